@@ -1,5 +1,7 @@
 from django.contrib import admin
 from .models import Organization, Pet, Interest, Application, AdopterProfile, RiskClassification, VisibilityScore
+from .services.description_feature_service import DescriptionFeatureService
+from .services.visibility_score_service import VisibilityScoreService
 
 @admin.register(Organization)
 class OrganizationAdmin(admin.ModelAdmin):
@@ -13,6 +15,13 @@ class PetAdmin(admin.ModelAdmin):
     search_fields = ("name", "external_id", "breed_primary", "breed_secondary")
     list_filter = ("species", "status", "source")
 
+    def save_model(self, request, obj, form, change):
+        # Edited descriptions must not keep stale keyword bits (ranking / risk read only the bits)
+        obj.description_features = DescriptionFeatureService.compute(obj.raw_description, obj.ai_description)
+        super().save_model(request, obj, form, change)
+        # listed_at feeds the precomputed score, and new pets need one to be ranked
+        VisibilityScoreService.refresh_for_pets([obj])
+
 @admin.register(Interest)
 class InterestAdmin(admin.ModelAdmin):
     list_display = ("interest_id", "user", "pet", "notification_status", "created_at")
@@ -32,6 +41,10 @@ class AdopterProfileAdmin(admin.ModelAdmin):
 class RiskClassificationAdmin(admin.ModelAdmin):
     list_display = ("pet", "is_long_stay", "is_senior", "is_medical", "is_overlooked_breed_group", "recently_returned")
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        VisibilityScoreService.refresh_for_pet(obj.pet, obj)
+
 @admin.register(VisibilityScore)
 class VisibilityScoreAdmin(admin.ModelAdmin):
     list_display = ("pet", "final_score", "computed_at")
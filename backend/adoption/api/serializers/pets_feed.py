@@ -41,6 +41,9 @@ class PetFeedItemSerializer(serializers.ModelSerializer):
         }
 
     def get_why_shown(self, obj):
+        why_shown_map = self.context.get("why_shown_map")
+        if why_shown_map is not None and str(obj.pet_id) in why_shown_map:
+            return why_shown_map[str(obj.pet_id)]
         return RankingService.reasons_for_pet(obj)
 
     def get_is_interested(self, obj):
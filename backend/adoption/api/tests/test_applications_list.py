@@ -94,4 +94,32 @@ class ApplicationsListTests(TestCase):
         self.assertEqual(item["handoff"]["version"], "v1")
         self.assertEqual(item["handoff"]["type"], "APPLICATION_HANDOFF")
         self.assertTrue(item["handoff"]["disclaimer"]["application_is_not_approval"])
-        self.assertTrue(item["handoff"]["apply_url_present"])
\ No newline at end of file
+        self.assertTrue(item["handoff"]["apply_url_present"])
+
+    def test_limit_is_capped_and_pages_follow_the_cursor(self):
+        now = timezone.now()
+        pets = Pet.objects.bulk_create([
+            Pet(source="TEST", external_id=f"P{i}", organization=self.org, name=f"Pet {i}", listed_at=now)
+            for i in range(2, 62)
+        ])
+        Application.objects.bulk_create([
+            Application(user=self.user, pet=p, organization=self.org, payload={}, handoff_payload={})
+            for p in pets
+        ])
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+
+        resp = client.get("/api/v1/applications", {"limit": 500})
+        self.assertEqual(resp.status_code, 200)
+        data = json.loads(resp.content.decode("utf-8"))["data"]
+        self.assertEqual(len(data["items"]), 50)
+        self.assertIsNotNone(data["next_cursor"])
+
+        resp = client.get("/api/v1/applications", {"limit": 500, "cursor": data["next_cursor"]})
+        rest = json.loads(resp.content.decode("utf-8"))["data"]
+        self.assertEqual(len(rest["items"]), 11)
+        self.assertIsNone(rest["next_cursor"])
+
+        first_ids = {i["pet_id"] for i in data["items"]}
+        self.assertFalse(first_ids & {i["pet_id"] for i in rest["items"]})
@@ -1,5 +1,7 @@
 import json
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from accounts.models import User
 from adoption.models import Organization, Pet, Interest
@@ -98,3 +100,65 @@ class InterestsTests(TestCase):
 
         interest = Interest.objects.get(interest_id=interest_id)
         self.assertEqual(interest.notification_status, Interest.NotificationStatus.FAILED)
+
+
+class InterestsListPaginationTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.org = Organization.objects.create(source="TEST", source_org_id="org1", name="Test Org")
+        now = timezone.now()
+        pets = Pet.objects.bulk_create([
+            Pet(source="TEST", external_id=f"p{i}", organization=self.org, name=f"Pet {i}", listed_at=now)
+            for i in range(7)
+        ])
+        Interest.objects.bulk_create([Interest(user=self.user, pet=p) for p in pets])
+        # Two rows share a timestamp so the id tie-break is exercised
+        for i, interest in enumerate(Interest.objects.order_by("pk")):
+            interest.created_at = now - timezone.timedelta(minutes=min(i, 5))
+            interest.save(update_fields=["created_at"])
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _get(self, **params):
+        resp = self.client.get("/api/v1/interests", params)
+        return resp, json.loads(resp.content.decode("utf-8"))
+
+    def test_pages_are_disjoint_and_cover_all_interests(self):
+        seen = []
+        cursor = None
+        pages = 0
+        while True:
+            params = {"limit": 3}
+            if cursor:
+                params["cursor"] = cursor
+            resp, payload = self._get(**params)
+            self.assertEqual(resp.status_code, 200)
+            seen.extend(item["interest_id"] for item in payload["data"]["items"])
+            cursor = payload["data"]["next_cursor"]
+            pages += 1
+            if not cursor:
+                break
+
+        self.assertEqual(pages, 3)
+        expected = [str(i.interest_id) for i in Interest.objects.filter(user=self.user).order_by("-created_at", "-pk")]
+        self.assertEqual(seen, expected)
+
+    def test_single_page_has_no_next_cursor(self):
+        _, payload = self._get()
+        self.assertEqual(len(payload["data"]["items"]), 7)
+        self.assertIsNone(payload["data"]["next_cursor"])
+
+    def test_invalid_cursor_is_400(self):
+        resp, payload = self._get(cursor="not-a-cursor")
+        self.assertEqual(resp.status_code, 400)
+        self.assertFalse(payload["ok"])
+
+    def test_query_count_does_not_grow_with_limit(self):
+        counts = []
+        for limit in (1, 7):
+            with CaptureQueriesContext(connection) as ctx:
+                resp, _ = self._get(limit=limit)
+            self.assertEqual(resp.status_code, 200)
+            counts.append(len(ctx.captured_queries))
+        self.assertEqual(counts[0], counts[1])
@@ -1,8 +1,9 @@
 import json
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from rest_framework.test import APIClient
 from accounts.models import User
-from adoption.models import Organization, Pet, RiskClassification, Interest
+from adoption.models import Organization, Pet, RiskClassification, Interest, PetSeen, Application
+from adoption.services.pet_feed_service import PetFeedService
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
@@ -95,6 +96,38 @@ class PetsFeedTests(TestCase):
         # liked pets do not appear in feed
         self.assertNotIn(str(self.pet.pet_id), ids)
 
+    def test_feed_excludes_seen_and_applied_pets_for_this_user_only(self):
+        seen = Pet.objects.create(source="TEST", external_id="seen", organization=self.org, name="Seen")
+        applied = Pet.objects.create(source="TEST", external_id="applied", organization=self.org, name="Applied")
+        PetSeen.objects.create(user=self.user, pet=seen)
+        Application.objects.create(user=self.user, pet=applied, organization=self.org)
+        other = User.objects.create_user(username="other", password="pass1234")
+        PetSeen.objects.create(user=other, pet=self.pet)
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        payload = json.loads(client.get("/api/v1/pets?limit=10").content.decode("utf-8"))
+
+        ids = {i["pet_id"] for i in payload["data"]["items"]}
+        self.assertEqual(ids, {str(self.pet.pet_id)})
+
+    def test_exclusions_are_one_array_parameter(self):
+        PetSeen.objects.create(user=self.user, pet=self.pet)
+
+        sql, params = PetFeedService._base_queryset(self.user).query.sql_with_params()
+        self.assertIn("<> ALL(", sql.upper())
+        # No per-user history table in the candidate query
+        self.assertNotIn("adoption_petseen", sql)
+        self.assertIn([self.pet.pet_id], params)
+
+    @override_settings(WOOFER_FEED_EXCLUSION_MAX_IDS=0)
+    def test_oversized_history_falls_back_to_anti_joins(self):
+        PetSeen.objects.create(user=self.user, pet=self.pet)
+
+        sql = str(PetFeedService._base_queryset(self.user).query).upper()
+        self.assertEqual(sql.count("NOT (EXISTS("), 3)
+        self.assertNotIn("NOT (\"ADOPTION_PET\".\"PET_ID\" IN", sql)
+
 
 
     def test_ranking_boost_affects_feed_order(self):
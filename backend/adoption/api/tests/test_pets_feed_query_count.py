@@ -0,0 +1,83 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from adoption.models import Organization, Pet, RiskClassification
+
+User = get_user_model()
+
+
+class PetsFeedQueryCountTests(TestCase):
+    """
+    Regression lock: feed/detail serialization must not scale queries with page size
+    (no per-item RiskClassification / re-scoring lookups).
+    """
+
+    def setUp(self):
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        org = Organization.objects.create(
+            source="TEST",
+            source_org_id="org1",
+            name="Test Org",
+            contact_email="o@example.com",
+            location="LA",
+            is_active=True,
+        )
+
+        now = timezone.now()
+        self.pets = []
+        for i in range(25):
+            pet = Pet.objects.create(
+                source="TEST",
+                external_id=f"p{i}",
+                organization=org,
+                name=f"Pet {i}",
+                species=Pet.Species.DOG,
+                status=Pet.Status.ACTIVE,
+                listed_at=now - timezone.timedelta(minutes=i),
+                photos=[],
+                raw_description="",
+                temperament_tags=[],
+            )
+            # Mix of boosted / normal so why_shown has content
+            if i % 3 == 0:
+                RiskClassification.objects.create(pet=pet, is_long_stay=True)
+            self.pets.append(pet)
+
+    def _count_queries(self, url: str) -> int:
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        return len(ctx.captured_queries)
+
+    def test_feed_query_count_is_constant_in_page_size(self):
+        # Warm up (profile get_or_create inserts on first call)
+        self._count_queries("/api/v1/pets?limit=1")
+
+        small = self._count_queries("/api/v1/pets?limit=5")
+        large = self._count_queries("/api/v1/pets?limit=20")
+
+        self.assertEqual(small, large)
+
+    def test_feed_why_shown_matches_risk_reasons(self):
+        resp = self.client.get("/api/v1/pets?limit=20")
+        items = resp.json()["data"]["items"]
+        boosted_ids = {str(p.pet_id) for i, p in enumerate(self.pets) if i % 3 == 0}
+
+        for item in items:
+            expected = ["LONG_STAY_BOOST"] if item["pet_id"] in boosted_ids else []
+            self.assertEqual(item["why_shown"], expected)
+
+    def test_detail_query_count_does_not_lazy_load_risk(self):
+        pet = self.pets[0]
+        # 1 query: pet + organization + risk + visibility
+        with self.assertNumQueries(1):
+            resp = self.client.get(f"/api/v1/pets/{pet.pet_id}")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()["data"]["why_shown"], ["LONG_STAY_BOOST"])
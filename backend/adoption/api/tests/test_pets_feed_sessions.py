@@ -0,0 +1,128 @@
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+from django.contrib.auth import get_user_model
+
+from adoption.models import Organization, Pet, RiskClassification
+from adoption.services.feed_session_service import FEED_SESSION_CACHE_ALIAS
+from adoption.services.pet_seen_service import PetSeenService
+from adoption.services.ranked_cursor import decode_rank_cursor_session
+from adoption.services.user_profile_service import UserProfileService
+
+User = get_user_model()
+
+
+class PetsFeedSessionTests(TestCase):
+    def setUp(self):
+        caches[FEED_SESSION_CACHE_ALIAS].clear()
+
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+        org = Organization.objects.create(
+            source="TEST",
+            source_org_id="org1",
+            name="Test Org",
+            contact_email="o@example.com",
+            location="LA",
+            is_active=True,
+        )
+
+        now = timezone.now()
+        for i in range(23):
+            pet = Pet.objects.create(
+                source="TEST",
+                external_id=f"p{i}",
+                organization=org,
+                name=f"Pet {i}",
+                species=Pet.Species.DOG,
+                status=Pet.Status.ACTIVE,
+                listed_at=now - timezone.timedelta(minutes=i),
+                photos=[],
+                raw_description="",
+                temperament_tags=[],
+            )
+            # Boosted pets exercise diversity selection across pages
+            if i % 4 == 0:
+                RiskClassification.objects.create(pet=pet, is_long_stay=True)
+
+    def _walk(self, limit: int, expire_after_first: bool = False):
+        pages = []
+        cursor = None
+        while True:
+            url = f"/api/v1/pets?limit={limit}" + (f"&cursor={cursor}" if cursor else "")
+            resp = self.client.get(url)
+            self.assertEqual(resp.status_code, 200)
+            data = resp.json()["data"]
+            pages.append([item["pet_id"] for item in data["items"]])
+            cursor = data["next_cursor"]
+            if expire_after_first:
+                caches[FEED_SESSION_CACHE_ALIAS].clear()
+            if not cursor:
+                return pages
+
+    def test_first_page_opens_session(self):
+        resp = self.client.get("/api/v1/pets?limit=5")
+        cursor = resp.json()["data"]["next_cursor"]
+
+        position = decode_rank_cursor_session(cursor)
+        self.assertIsNotNone(position)
+        self.assertEqual(position[1], 5)
+
+    def test_session_pages_match_reranked_pages(self):
+        session_pages = self._walk(5)
+        reranked_pages = self._walk(5, expire_after_first=True)
+
+        self.assertEqual(session_pages, reranked_pages)
+        flat = [pid for page in session_pages for pid in page]
+        self.assertEqual(len(flat), len(set(flat)))
+
+    @override_settings(WOOFER_FEED_SESSIONS_ENABLED=False)
+    def test_disabled_sessions_use_plain_cursor(self):
+        cursor = self.client.get("/api/v1/pets?limit=5").json()["data"]["next_cursor"]
+        self.assertIsNone(decode_rank_cursor_session(cursor))
+
+        resp = self.client.get(f"/api/v1/pets?limit=5&cursor={cursor}")
+        self.assertEqual(len(resp.json()["data"]["items"]), 5)
+
+    def test_session_page_skips_the_ranking_pipeline(self):
+        cursor = self.client.get("/api/v1/pets?limit=5").json()["data"]["next_cursor"]
+
+        with CaptureQueriesContext(connection) as session_ctx:
+            session_resp = self.client.get(f"/api/v1/pets?limit=5&cursor={cursor}")
+
+        caches[FEED_SESSION_CACHE_ALIAS].clear()
+        with CaptureQueriesContext(connection) as rerank_ctx:
+            rerank_resp = self.client.get(f"/api/v1/pets?limit=5&cursor={cursor}")
+
+        self.assertEqual(session_resp.json()["data"]["items"], rerank_resp.json()["data"]["items"])
+        self.assertFalse(any("LIMIT 500" in q["sql"] for q in session_ctx.captured_queries))
+        self.assertTrue(any("LIMIT 500" in q["sql"] for q in rerank_ctx.captured_queries))
+
+    def test_session_skips_pets_decided_since_snapshot(self):
+        first = self.client.get("/api/v1/pets?limit=5").json()["data"]
+        second = self.client.get(f"/api/v1/pets?limit=5&cursor={first['next_cursor']}").json()["data"]
+
+        passed_id = second["items"][0]["pet_id"]
+        with self.captureOnCommitCallbacks(execute=True):
+            PetSeenService.mark_seen(self.user, passed_id)
+
+        again = self.client.get(f"/api/v1/pets?limit=5&cursor={first['next_cursor']}").json()["data"]
+        ids = [item["pet_id"] for item in again["items"]]
+        self.assertNotIn(passed_id, ids)
+        self.assertEqual(len(ids), 5)
+
+    def test_profile_change_invalidates_session(self):
+        cursor = self.client.get("/api/v1/pets?limit=5").json()["data"]["next_cursor"]
+
+        UserProfileService.update_profile(self.user, {"activity_level": "HIGH"})
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get(f"/api/v1/pets?limit=5&cursor={cursor}")
+        self.assertEqual(resp.status_code, 200)
+        # Fell back to the full pipeline
+        self.assertTrue(any("LIMIT 500" in q["sql"] for q in ctx.captured_queries))
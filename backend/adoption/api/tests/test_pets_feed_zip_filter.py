@@ -1,11 +1,22 @@
 import json
-from django.test import TestCase
+from django.core.cache import caches
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from unittest.mock import patch
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 
 from adoption.models import Organization, Pet, AdopterProfile
+from adoption.services.ingestion_service import IngestionService
+from adoption.services.org_distance_cache_service import (
+    GEO_VERSION_CACHE_ALIAS,
+    GEO_VERSION_KEY,
+    TOO_MANY_ORGS,
+    OrgDistanceCacheService,
+)
+from adoption.services.zip_geo_service import ZipGeoResult
 
 User = get_user_model()
 
@@ -117,3 +128,163 @@ class PetsFeedZipFilterTests(TestCase):
         ids = [i["pet_id"] for i in payload["data"]["items"]]
         self.assertIn(str(self.pet_match.pet_id), ids)
         self.assertIn(str(self.pet_other.pet_id), ids)
+
+    @patch("adoption.services.pet_feed_service.MAX_CANDIDATES", 3)
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_radius_applies_before_candidate_cap(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+
+        # Newer (higher scoring) far-away pets that would fill the whole cap.
+        # Bounding-box corner, ~57 miles out: only a real distance check drops them
+        far_org = Organization.objects.create(
+            source="TEST",
+            source_org_id="org_corner",
+            name="Corner",
+            latitude=round(self.home_lat + 0.6, 6),
+            longitude=round(self.home_lon + 0.7, 6),
+        )
+        for i in range(5):
+            Pet.objects.create(
+                source="TEST",
+                external_id=f"far{i}",
+                organization=far_org,
+                name=f"Far {i}",
+                listed_at=timezone.now() + timezone.timedelta(days=1),
+            )
+
+        profile, _ = AdopterProfile.objects.get_or_create(user=self.user)
+        profile.home_postal_code = self.home_zip
+        profile.preferences = {"max_distance_miles": 50}
+        profile.save()
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        payload = json.loads(client.get("/api/v1/pets?limit=50").content.decode("utf-8"))
+
+        ids = [i["pet_id"] for i in payload["data"]["items"]]
+        self.assertEqual(ids, [str(self.pet_match.pet_id)])
+
+    def test_unknown_home_zip_uses_nearest_zip_in_prefix(self):
+        # 90099 is not in the centroid file; 90095 (West LA) is the closest known 900xx ZIP
+        profile, _ = AdopterProfile.objects.get_or_create(user=self.user)
+        profile.home_postal_code = "90099"
+        profile.preferences = {"max_distance_miles": 50}
+        profile.save()
+
+        client = APIClient()
+        client.force_authenticate(user=self.user)
+        payload = json.loads(client.get("/api/v1/pets?limit=50").content.decode("utf-8"))
+
+        ids = [i["pet_id"] for i in payload["data"]["items"]]
+        self.assertEqual(ids, [str(self.pet_match.pet_id)])
+
+
+class PetsFeedOrgDistanceCacheTests(TestCase):
+    def setUp(self):
+        OrgDistanceCacheService.reset_cache_for_tests()
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.home_lat, self.home_lon = 34.0537, -118.2428
+        self.near_org = Organization.objects.create(
+            source="TEST", source_org_id="near", name="Near", latitude=self.home_lat, longitude=self.home_lon,
+        )
+        self.near_pet = Pet.objects.create(source="TEST", external_id="near", organization=self.near_org, name="Near")
+
+        profile, _ = AdopterProfile.objects.get_or_create(user=self.user)
+        profile.home_postal_code = "90012"
+        profile.preferences = {"max_distance_miles": 25}
+        profile.save()
+
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _ids(self):
+        payload = json.loads(self.client.get("/api/v1/pets?limit=50").content.decode("utf-8"))
+        return {i["pet_id"] for i in payload["data"]["items"]}
+
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_second_feed_for_same_zip_skips_lookup(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+
+        self.assertEqual(self._ids(), {str(self.near_pet.pet_id)})
+        self.assertEqual(self._ids(), {str(self.near_pet.pet_id)})
+
+        self.assertEqual(mock_lookup.call_count, 1)
+        self.assertEqual(OrgDistanceCacheService.get("90012", 25), frozenset({self.near_org.organization_id}))
+
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_org_geo_change_invalidates(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+        self._ids()
+
+        # Backfill-style save moves a far org into range
+        moved = Organization.objects.create(source="TEST", source_org_id="moved", name="Moved")
+        moved_pet = Pet.objects.create(source="TEST", external_id="moved", organization=moved, name="Moved")
+        moved.latitude, moved.longitude = self.home_lat + 0.01, self.home_lon
+        moved.save(update_fields=["latitude", "longitude"])
+
+        self.assertIsNone(OrgDistanceCacheService.get("90012", 25))
+        self.assertEqual(self._ids(), {str(self.near_pet.pet_id), str(moved_pet.pet_id)})
+
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_geo_change_during_org_query_stores_stale_entry(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+        real_put = OrgDistanceCacheService.put
+
+        def put_after_geo_change(*args):
+            # Another process moves an org after this request's in-range query ran
+            OrgDistanceCacheService.invalidate()
+            return real_put(*args)
+
+        with patch.object(OrgDistanceCacheService, "put", side_effect=put_after_geo_change):
+            self.assertEqual(self._ids(), {str(self.near_pet.pet_id)})
+
+        # Tagged with the version read before the query, so the next feed recomputes
+        self.assertIsNone(OrgDistanceCacheService.get("90012", 25))
+
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_bulk_ingest_geo_change_invalidates(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+        self._ids()
+
+        with patch("adoption.services.ingestion_service.ZipGeoService.lookup") as ingest_lookup:
+            ingest_lookup.return_value = ZipGeoResult(postal_code="90013", lat=self.home_lat, lon=self.home_lon + 0.01)
+            IngestionService.bulk_upsert_organizations(
+                [{"source": "TEST", "source_org_id": "new", "name": "New", "postal_code": "90013"}]
+            )
+
+        self.assertIsNone(OrgDistanceCacheService.get("90012", 25))
+
+    @override_settings(WOOFER_ORG_DISTANCE_CACHE_MAX_ENTRIES=2)
+    def test_lru_is_bounded(self):
+        for z in ("10001", "10002", "10003"):
+            OrgDistanceCacheService.put(z, 10, [], OrgDistanceCacheService.geo_version())
+        OrgDistanceCacheService.get("10002", 10)
+        OrgDistanceCacheService.put("10004", 10, [], OrgDistanceCacheService.geo_version())
+
+        self.assertIsNone(OrgDistanceCacheService.get("10001", 10))
+        self.assertIsNone(OrgDistanceCacheService.get("10003", 10))
+        self.assertIsNotNone(OrgDistanceCacheService.get("10002", 10))
+
+    @override_settings(WOOFER_ORG_DISTANCE_CACHE_MAX_ORGS=0)
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_large_sets_fall_back_to_sql_filter(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+
+        self.assertEqual(self._ids(), {str(self.near_pet.pet_id)})
+        self.assertIs(OrgDistanceCacheService.get("90012", 25), TOO_MANY_ORGS)
+
+        # Next request skips the org-level distance query
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(self._ids(), {str(self.near_pet.pet_id)})
+        org_queries = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith('SELECT "adoption_organization"')]
+        self.assertEqual(org_queries, [])
+
+    @patch("adoption.services.pet_feed_service.ZipGeoService.lookup")
+    def test_version_bump_from_another_process_invalidates(self, mock_lookup):
+        mock_lookup.return_value = {"lat": self.home_lat, "lon": self.home_lon}
+        self._ids()
+
+        # An ingest / backfill process only shares the database-backed version key
+        caches[GEO_VERSION_CACHE_ALIAS].set(GEO_VERSION_KEY, 42, timeout=None)
+
+        self.assertIsNone(OrgDistanceCacheService.get("90012", 25))
@@ -2,20 +2,25 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
-from adoption.models import Application
+from adoption.services.application_service import ApplicationService
 from adoption.api.serializers.applications_list import ApplicationsListItemSerializer
 
 class ApplicationsListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        apps = (
-            Application.objects
-            .select_related("pet", "organization")
-            .filter(user=request.user)
-            .order_by("-created_at")
-        )
+        cursor = request.query_params.get("cursor")
+        limit_raw = request.query_params.get("limit")
 
+        limit = None
+        if limit_raw is not None:
+            try:
+                limit = int(limit_raw)
+            except ValueError:
+                limit = None  # ignore bad limit
+
+        apps, next_cursor = ApplicationService.list_applications_page(request.user, cursor, limit)
         return Response({
-            "items": ApplicationsListItemSerializer(apps, many=True).data
+            "items": ApplicationsListItemSerializer(apps, many=True).data,
+            "next_cursor": next_cursor,
         })
@@ -9,7 +9,18 @@ class InterestsListView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        interests = InterestService.list_interests(request.user)
+        cursor = request.query_params.get("cursor")
+        limit_raw = request.query_params.get("limit")
+
+        limit = None
+        if limit_raw is not None:
+            try:
+                limit = int(limit_raw)
+            except ValueError:
+                limit = None  # ignore bad limit
+
+        interests, next_cursor = InterestService.list_interests_page(request.user, cursor, limit)
         return Response({
-            "items": InterestsListItemSerializer(interests, many=True).data
+            "items": InterestsListItemSerializer(interests, many=True).data,
+            "next_cursor": next_cursor,
         })
@@ -10,5 +10,5 @@ class PetDetailView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request, pet_id):
-        pet = get_object_or_404(Pet.objects.select_related("organization"), pet_id=pet_id)
+        pet = get_object_or_404(Pet.objects.select_related("organization", "risk", "visibility"), pet_id=pet_id)
         return Response(PetDetailSerializer(pet).data)
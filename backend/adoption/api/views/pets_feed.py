@@ -4,6 +4,7 @@ from rest_framework.permissions import IsAuthenticated
 from adoption.models import Interest
 from adoption.api.serializers.pets_feed import PetFeedItemSerializer
 from adoption.services.pet_feed_service import PetFeedService
+from adoption.services.ranking_service import RankingService
 
 class PetsFeedView(APIView):
     permission_classes = [IsAuthenticated]
@@ -19,7 +20,11 @@ class PetsFeedView(APIView):
             except ValueError:
                 limit = None  # ignore bad limit
 
-        items, next_cursor = PetFeedService.get_feed(request.user, cursor, limit)
+        page, next_cursor = PetFeedService.get_feed_page(request.user, cursor, limit)
+        items = [rp.pet for rp in page]
+
+        # why_shown already computed by the ranker (no re-scoring per item)
+        why_shown_map = {str(rp.pet.pet_id): RankingService.why_shown(rp.reasons) for rp in page}
 
         #interest state for this page (server-side truth)
         pet_ids = [i.pet_id for i in items]  # items are Pet objects (feed items)
@@ -32,7 +37,7 @@ class PetsFeedView(APIView):
             "items": PetFeedItemSerializer(
                 items,
                 many=True,
-                context={"interest_map": interest_map},
+                context={"interest_map": interest_map, "why_shown_map": why_shown_map},
             ).data,
             "next_cursor": next_cursor,
         })
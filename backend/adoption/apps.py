@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class AdoptionConfig(AppConfig):
     name = 'adoption'
+
+    def ready(self):
+        from adoption.services import organization_geo_signals  # noqa: F401
@@ -1,21 +1,50 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from typing import Optional
+from decimal import Decimal
+from typing import List, Optional
 
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from adoption.models import Organization
+from adoption.services.geohash_service import GeohashService
+from adoption.services.org_distance_cache_service import OrgDistanceCacheService
 from adoption.services.zip_geo_service import ZipGeoService
 
+# Organization.latitude/longitude are decimal_places=6
+_COORD_QUANT = Decimal("0.000001")
+# Centroids come from the float32 binary store (~7.6e-6 deg resolution at |lon| 118),
+# so a stored coordinate matches its ZIP when within this, not when equal
+_CENTROID_TOLERANCE = Decimal("0.00001")
+
+_GEO_UPDATE_FIELDS = ["latitude", "longitude", "geohash", "geo_source", "geo_updated_at"]
+
+
+def _coord(value) -> Optional[Decimal]:
+    if value is None:
+        return None
+    return Decimal(str(value)).quantize(_COORD_QUANT)
+
+
+def _matches_centroid(org: Organization, lat: Decimal, lon: Decimal) -> bool:
+    if org.latitude is None or org.longitude is None:
+        return False
+    return (
+        abs(_coord(org.latitude) - lat) <= _CENTROID_TOLERANCE
+        and abs(_coord(org.longitude) - lon) <= _CENTROID_TOLERANCE
+    )
+
 
 @dataclass
 class BackfillStats:
     scanned: int = 0
-    eligible: int = 0
+    batches: int = 0
     updated: int = 0
+    unchanged: int = 0
     skipped_no_postal: int = 0
     skipped_no_match: int = 0
 
@@ -35,32 +64,98 @@ class Command(BaseCommand):
             default=1000,
             help="Max number of eligible orgs to process.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Orgs per keyset page (one batched write per page).",
+        )
+        parser.add_argument(
+            "--refresh",
+            action="store_true",
+            help="Also re-geocode ZIP-sourced orgs whose coordinates no longer match their postal code.",
+        )
 
     def handle(self, *args, **opts):
         dry_run: bool = bool(opts["dry_run"])
         limit: int = int(opts["limit"])
+        batch_size: int = max(1, int(opts["batch_size"]))
+        refresh: bool = bool(opts["refresh"])
 
         stats = BackfillStats()
         now = timezone.now()
+        t0 = time.perf_counter()
 
-        qs = (
+        # v0: only fill missing coords; --refresh adds orgs geocoded from a (possibly stale) ZIP.
+        # Never touches coordinates from other geo sources.
+        missing = Q(latitude__isnull=True)
+        eligible = missing | Q(geo_source="ZIP") if refresh else missing
+        base_qs = (
             Organization.objects
             .filter(postal_code__isnull=False)
             .exclude(postal_code__exact="")
-            .filter(latitude__isnull=True)  # v0: only fill missing coords
-            .order_by("organization_id")[:limit]
+            .filter(eligible)
+            .order_by("organization_id")
         )
 
-        stats.eligible = qs.count()
-
         self.stdout.write(self.style.NOTICE("BackfillOrgGeos starting..."))
-        self.stdout.write(f"  dry_run={dry_run} limit={limit} eligible={stats.eligible}")
-
-        # We do per-row saves. This is deterministic and safe for MVP size.
-        # If you later want speed: bulk_update in batches.
-        for org in qs:
-            stats.scanned += 1
+        self.stdout.write(f"  dry_run={dry_run} limit={limit} batch_size={batch_size} refresh={refresh}")
+
+        # Keyset pagination on the primary key: every page is an index range scan,
+        # and rows updated by earlier pages cannot shift later ones.
+        last_id = None
+        while stats.scanned < limit:
+            page_qs = base_qs if last_id is None else base_qs.filter(organization_id__gt=last_id)
+            page_size = min(batch_size, limit - stats.scanned)
+            page = list(page_qs[:page_size])
+            if not page:
+                break
+            last_id = page[-1].organization_id
+            stats.scanned += len(page)
+            stats.batches += 1
+
+            changed = self._geocode_page(page, now, stats)
+            if changed and not dry_run:
+                # UPDATE by primary key only: orgs deleted since the page was read stay deleted
+                with transaction.atomic():
+                    Organization.objects.bulk_update(changed, _GEO_UPDATE_FIELDS, batch_size=batch_size)
+            stats.updated += len(changed)
+
+            elapsed = time.perf_counter() - t0
+            self.stdout.write(
+                f"  batch={stats.batches} scanned={stats.scanned} updated={stats.updated} "
+                f"orgs_per_s={stats.scanned / elapsed if elapsed > 0 else 0.0:.0f}"
+            )
+            if len(page) < page_size:
+                break
+
+        if stats.updated and not dry_run:
+            # Batched writes skip Organization.save, so cached org distance sets are dropped here
+            OrgDistanceCacheService.invalidate()
+
+        elapsed = time.perf_counter() - t0
+        self.stdout.write(self.style.SUCCESS("BackfillOrgGeos complete."))
+        self.stdout.write(
+            "\n".join([
+                "Backfill result:",
+                f"  scanned={stats.scanned}",
+                f"  batches={stats.batches}",
+                f"  updated={stats.updated}",
+                f"  unchanged={stats.unchanged}",
+                f"  skipped_no_postal={stats.skipped_no_postal}",
+                f"  skipped_no_match={stats.skipped_no_match}",
+                f"  elapsed_seconds={elapsed:.3f}",
+                f"  dry_run={dry_run}",
+            ])
+        )
 
+    @staticmethod
+    def _geocode_page(page: List[Organization], now, stats: BackfillStats) -> List[Organization]:
+        """
+        Resolves ZIPs in memory and sets geo fields on the orgs that change.
+        """
+        changed: List[Organization] = []
+        for org in page:
             z = ZipGeoService.normalize_zip(org.postal_code)
             if not z:
                 stats.skipped_no_postal += 1
@@ -71,26 +166,17 @@ class Command(BaseCommand):
                 stats.skipped_no_match += 1
                 continue
 
-            # Set fields
-            org.latitude = res.lat
-            org.longitude = res.lon
+            lat, lon = _coord(res.lat), _coord(res.lon)
+            if _matches_centroid(org, lat, lon):
+                # --refresh: postal code still matches the stored centroid
+                stats.unchanged += 1
+                continue
+
+            org.latitude = lat
+            org.longitude = lon
+            org.geohash = GeohashService.encode(lat, lon)
             org.geo_source = "ZIP"
             org.geo_updated_at = now
+            changed.append(org)
 
-            if not dry_run:
-                org.save(update_fields=["latitude", "longitude", "geo_source", "geo_updated_at"])
-
-            stats.updated += 1
-
-        self.stdout.write(self.style.SUCCESS("BackfillOrgGeos complete."))
-        self.stdout.write(
-            "\n".join([
-                "Backfill result:",
-                f"  scanned={stats.scanned}",
-                f"  eligible={stats.eligible}",
-                f"  updated={stats.updated}",
-                f"  skipped_no_postal={stats.skipped_no_postal}",
-                f"  skipped_no_match={stats.skipped_no_match}",
-                f"  dry_run={dry_run}",
-            ])
-        )
\ No newline at end of file
+        return changed
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from adoption.services.visibility_score_service import VisibilityScoreService
+
+
+class Command(BaseCommand):
+    help = "Create the precomputed VisibilityScore for pets that do not have one yet."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Pets per keyset page (one risk query + one upsert per page).",
+        )
+
+    def handle(self, *args, **opts):
+        batch_size = max(1, int(opts["batch_size"]))
+        written = VisibilityScoreService.backfill_missing(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f"BackfillVisibilityScores complete. written={written}"))
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 from adoption.models import Pet
 from django.db.models import Q
 from adoption.services.pet_enrichment_service import PetEnrichmentService
+from adoption.services.description_feature_service import DescriptionFeatureService
 
 class Command(BaseCommand):
     help = "Backfill ai_description for ACTIVE pets that have raw_description but no ai_description."
@@ -33,7 +34,8 @@ class Command(BaseCommand):
             updated += 1
             if not dry_run:
                 pet.ai_description = gen
-                pet.save(update_fields=["ai_description"])
+                pet.description_features = DescriptionFeatureService.compute(pet.raw_description, gen)
+                pet.save(update_fields=["ai_description", "description_features"])
 
         self.stdout.write(
             self.style.SUCCESS(f"Enrichment backfill complete: updated={updated} dry_run={dry_run}")
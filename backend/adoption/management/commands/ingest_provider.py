@@ -1,21 +1,26 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from dataclasses import replace
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Set
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import reset_queries, transaction
 
 from providers.base import ProviderName
 from providers.factory import get_provider_client
 
 from adoption.services.provider_mappers.base import canonical_org_dict, canonical_pet_dict
-from adoption.services.ingestion_service import IngestionService
+from adoption.services.ingestion_service import IngestionService, IngestResult
 from adoption.services.risk_backfill_service import RiskBackfillService
 
 from adoption.models import ProviderSyncState
 from django.utils import timezone
 
-from adoption.models import Pet
+from adoption.models import Organization, Pet
+from datetime import timedelta
+from django.conf import settings
+import sys
 import time
 
 
@@ -36,8 +41,11 @@ class Command(BaseCommand):
         parser.add_argument(
             "--limit",
             type=int,
-            default=200,
-            help="Max number of pets to ingest (approx).",
+            default=0,
+            help=(
+                "Max number of pets to ingest (approx). 0 (default) = whole catalog; capped runs never "
+                "advance the incremental watermark."
+            ),
         )
         parser.add_argument(
             "--dry-run",
@@ -55,7 +63,16 @@ class Command(BaseCommand):
             type=str,
             choices=["full", "incremental"],
             default="full",
-            help="Ingestion mode. Incremental is recorded but behaves like full for now.",
+            help=(
+                "Ingestion mode. Incremental fetches only pets updated since the last successful run and skips "
+                "deactivation; it escalates to full when no watermark exists or a full reconciliation is due."
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=250,
+            help="Pets fetched, mapped and upserted per batch (memory stays proportional to this). 0 = single batch.",
         )
         parser.add_argument(
             "--summary-only",
@@ -79,11 +96,16 @@ class Command(BaseCommand):
         summary_only: bool = options["summary_only"]
         mode = options["mode"].upper()
         provider_raw = options["provider"].strip().lower()
-        limit: int = options["limit"]
+        # 0 = no cap (adapters take a plain int)
+        limit: int = options["limit"] if options["limit"] > 0 else sys.maxsize
         dry_run: bool = options["dry_run"]
         org_id: Optional[str] = options["org_id"]
         force: bool = options["force"]
         lock_owner: Optional[str] = options["lock_owner"]
+        batch_size: int = options["batch_size"]
+        # DB time (ingest, seen stamping, deactivation, long-stay refresh) vs client HTTP time
+        self._db_s = 0.0
+        self._fetched_pets = 0
 
 
         try:
@@ -97,7 +119,14 @@ class Command(BaseCommand):
             raise CommandError(str(e))
 
         sync_state = None
-        if not dry_run:
+        updated_since = None
+        long_stay_since = None
+        if dry_run:
+            # Read-only look at the watermark so dry-runs fetch what the real run would
+            existing_state = ProviderSyncState.objects.filter(provider=provider.upper()).first()
+            mode, updated_since = self._plan_mode(mode, existing_state, timezone.now())
+            generation = (existing_state.sync_generation if existing_state else 0) + 1
+        else:
             with transaction.atomic():
                 sync_state, _ = ProviderSyncState.objects.select_for_update().get_or_create(
                     provider=provider.upper()
@@ -110,52 +139,51 @@ class Command(BaseCommand):
                         "Use --force to override."
                     )
 
+                # Last long-stay refresh happened just before the previous success;
+                # generous overlap is free (already flagged pets are skipped)
+                long_stay_since = (
+                    sync_state.last_success_at - timedelta(hours=1) if sync_state.last_success_at else None
+                )
                 sync_state.lock_acquired_at = timezone.now()
                 sync_state.lock_owner = lock_owner or "ingest_provider"
+                mode, updated_since = self._plan_mode(mode, sync_state, sync_state.lock_acquired_at)
                 sync_state.last_run_started_at = sync_state.lock_acquired_at
                 sync_state.last_mode = mode
+                sync_state.sync_generation += 1
+                generation = sync_state.sync_generation
                 sync_state.save(
                     update_fields=[
                         "lock_acquired_at",
                         "lock_owner",
                         "last_run_started_at",
                         "last_mode",
+                        "sync_generation",
                     ]
                 )
 
 
         self.stdout.write(self.style.NOTICE("Ingest starting..."))
-        self.stdout.write(f"  provider={provider} limit={limit} org_id={org_id or 'ALL'} dry_run={dry_run}")
-        # 1) Fetch provider-normalized pets first (they determine which orgs we need)
-        pet_records = list(client.iter_pets(limit=limit, org_id=org_id))
-
-        # Collect the unique org ids referenced by those pets
-        needed_org_ids = sorted({p.external_org_id for p in pet_records if p.external_org_id})
-
-        # Fetch only the orgs we actually need
-        org_records = []
-        for oid in needed_org_ids:
-            org_records.extend(list(client.iter_orgs(limit=1, org_id=oid)))
-
-        self.stdout.write(self.style.NOTICE(
-                f"Fetched: pets={len(pet_records)} unique_org_ids={len(needed_org_ids)} orgs={len(org_records)}"
-            )
+        self.stdout.write(
+            f"  provider={provider} mode={mode.lower()} limit={options['limit'] or 'none'} org_id={org_id or 'ALL'} dry_run={dry_run}"
+            + (f" updated_since={updated_since.isoformat()}" if updated_since else "")
         )
-
-
-        # 2) Map to canonical dicts
-        org_dicts = [canonical_org_dict(o) for o in org_records]
-        pet_dicts = [canonical_pet_dict(p) for p in pet_records]
-
-        # 3) Ingest + risk backfill (dry-run uses rollback)
+        # Streaming: each batch is fetched, mapped, upserted and dropped before the next
         if dry_run:
             try:
                 with transaction.atomic():
-                    result = IngestionService.ingest_canonical(org_dicts, pet_dicts)
+                    result = self._ingest_stream(
+                        client,
+                        limit=limit,
+                        org_id=org_id,
+                        batch_size=batch_size,
+                        source=provider.upper(),
+                        updated_since=updated_since,
+                        generation=generation,
+                    )
                     # Backfill only over ingested pets would be ideal, but canon allows safe all-active backfill.
-                    would_deactivate = (
-                        Pet.objects.filter(source=provider.upper(), status="ACTIVE")
-                        .exclude(external_id__in=result.pets_seen_external_ids).count()
+                    # Incremental runs only see changed pets, so they never deactivate.
+                    would_deactivate = 0 if mode == "INCREMENTAL" else (
+                        self._stale_pets(provider.upper(), generation).count()
                     )
                     elapsed = time.time() - t0
 
@@ -168,6 +196,8 @@ class Command(BaseCommand):
                             dry_run=True,
                             deactivated=would_deactivate,
                             elapsed_s=elapsed,
+                            http_stats=getattr(client, "http_stats", None),
+                            db_s=self._db_s,
                         )
                     )
                     raise DryRunRollback()
@@ -177,24 +207,30 @@ class Command(BaseCommand):
             return
         
         try:
-            result = IngestionService.ingest_canonical(org_dicts, pet_dicts)
             now = timezone.now()
-
-            # Mark seen pets last_seen_at (provider)
-            Pet.objects.filter(
+            result = self._ingest_stream(
+                client,
+                limit=limit,
+                org_id=org_id,
+                batch_size=batch_size,
+                seen_at=now,
                 source=provider.upper(),
-                external_id__in=result.pets_seen_external_ids,
-            ).update(last_seen_at=now)
-
-            # Deactivate missing pets (provider-scoped)
-            deactivated = (
-                Pet.objects.filter(source=provider.upper(), status="ACTIVE")
-                .exclude(external_id__in=result.pets_seen_external_ids)
-                .update(status="INACTIVE", last_seen_at=now)
+                updated_since=updated_since,
+                generation=generation,
             )
 
+            t_db = time.perf_counter()
+            # Deactivate missing pets (provider-scoped). Only a full run sees the whole catalog.
+            deactivated = 0
+            if mode == "FULL":
+                deactivated = self._stale_pets(provider.upper(), generation).update(
+                    status="INACTIVE", last_seen_at=now
+                )
+
             elapsed = time.time() - t0
-            risk_count = RiskBackfillService.backfill_all_active()
+            # Touched pets were classified during ingest, only long-stay crossings remain
+            risk_count = RiskBackfillService.refresh_long_stay(since=long_stay_since)
+            self._db_s += time.perf_counter() - t_db
 
             self.stdout.write(
                 self._format_result(
@@ -203,36 +239,226 @@ class Command(BaseCommand):
                     dry_run=False,
                     deactivated=deactivated,
                     elapsed_s=elapsed,
+                    http_stats=getattr(client, "http_stats", None),
+                    db_s=self._db_s,
                 )
             )
 
             if sync_state is not None:
                 sync_state.last_run_finished_at = timezone.now()
                 sync_state.last_success_at = sync_state.last_run_finished_at
-                sync_state.save(update_fields=["last_run_finished_at", "last_success_at"])
+                update_fields = ["last_run_finished_at", "last_success_at"]
+                # Only runs that saw everything the provider had (not org-scoped, not cut off by --limit)
+                # may move the watermark. It is the run start, so pets updated mid-fetch are picked up next time.
+                if not org_id and self._fetched_pets < limit:
+                    sync_state.updated_since_watermark = now
+                    update_fields.append("updated_since_watermark")
+                    if mode == "FULL":
+                        sync_state.last_full_success_at = now
+                        update_fields.append("last_full_success_at")
+                sync_state.save(update_fields=update_fields)
 
             self.stdout.write(self.style.SUCCESS("Ingest complete."))
 
         finally:
+            # Pooled provider connections are per run
+            close = getattr(client, "close", None)
+            if callable(close):
+                close()
+
             # Always release lock (even if exceptions occur)
             if sync_state is not None:
                 sync_state.lock_acquired_at = None
                 sync_state.lock_owner = None
                 sync_state.save(update_fields=["lock_acquired_at", "lock_owner"])
 
-    def _format_result(self, result, risk_count: int, dry_run: bool, deactivated: int = 0, elapsed_s: float = 0.0) -> str:
+    @staticmethod
+    def _plan_mode(requested: str, sync_state, now) -> tuple:
+        """
+        Effective (mode, updated_since) for a requested mode.
+        INCREMENTAL needs a watermark and a full reconciliation within
+        WOOFER_FULL_RECONCILE_HOURS, otherwise the run escalates to FULL.
+        """
+        if requested != "INCREMENTAL" or sync_state is None:
+            return "FULL", None
+
+        watermark = sync_state.updated_since_watermark or sync_state.last_success_at
+        reconcile_cutoff = now - timedelta(hours=getattr(settings, "WOOFER_FULL_RECONCILE_HOURS", 24))
+        if (
+            watermark is None
+            or sync_state.last_full_success_at is None
+            or sync_state.last_full_success_at < reconcile_cutoff
+        ):
+            return "FULL", None
+
+        # Overlap covers provider clock skew and records committed mid-run
+        overlap = timedelta(seconds=getattr(settings, "WOOFER_INCREMENTAL_OVERLAP_SECONDS", 300))
+        return "INCREMENTAL", watermark - overlap
+
+    @staticmethod
+    def _stale_pets(source: str, generation: int):
+        """
+        ACTIVE pets of the source the current run did not stamp:
+        one set-based predicate, no id list regardless of catalog size.
+        """
+        return Pet.objects.filter(source=source, status="ACTIVE").exclude(sync_generation=generation)
+
+    @staticmethod
+    def _batches(items: Iterable, size: int) -> Iterator[list]:
+        it = iter(items)
+        while True:
+            batch = list(islice(it, size)) if size > 0 else list(it)
+            if not batch:
+                return
+            yield batch
+
+    def _ingest_stream(
+        self,
+        client,
+        *,
+        limit: int,
+        org_id: Optional[str],
+        batch_size: int,
+        seen_at=None,
+        source: Optional[str] = None,
+        updated_since=None,
+        generation: int = 0,
+    ) -> IngestResult:
+        """
+        Fetch page -> resolve orgs not seen yet this run -> map -> upsert -> drop.
+        Every pet in the feed is stamped with the run's sync generation (and
+        last_seen_at when seen_at is given) as part of the upsert, so nothing
+        outlives a batch except counts. The distinct pets_seen is counted from
+        those stamps at the end.
+        """
+        total = IngestResult(
+            organizations_created=0,
+            organizations_updated=0,
+            pets_created=0,
+            pets_updated=0,
+            pets_skipped=0,
+            pets_seen_external_ids=set(),
+        )
+        resolved_org_ids: Set[str] = set()
+        fetched_pets = 0
+        org_counts = {"included": 0, "fresh": 0, "fetched": 0}
+
+        pet_kwargs = {"limit": limit, "org_id": org_id}
+        if updated_since is not None:
+            pet_kwargs["updated_since"] = updated_since
+
+        for pet_records in self._batches(client.iter_pets(**pet_kwargs), batch_size):
+            # Fetch only the orgs this batch needs that earlier batches didn't resolve
+            new_org_ids = sorted({p.external_org_id for p in pet_records if p.external_org_id} - resolved_org_ids)
+            org_records = self._resolve_orgs(client, new_org_ids, source, org_counts)
+            resolved_org_ids.update(new_org_ids)
+
+            fetched_pets += len(pet_records)
+            self._fetched_pets = fetched_pets
+
+            org_dicts = [canonical_org_dict(o) for o in org_records]
+            pet_dicts = [canonical_pet_dict(p) for p in pet_records]
+            del pet_records, org_records
+
+            seen_stamp = {"sync_generation": generation}
+            if seen_at is not None:
+                seen_stamp["last_seen_at"] = seen_at
+
+            t_db = time.perf_counter()
+            result = IngestionService.ingest_canonical(
+                org_dicts, pet_dicts, seen_stamp=seen_stamp, org_fetched_at=timezone.now()
+            )
+            self._db_s += time.perf_counter() - t_db
+
+            total = total.merged(result)
+
+            # DEBUG keeps every executed SQL string, drop them per batch too
+            reset_queries()
+
+        if source:
+            # Distinct across batches: a pet repeated in several pages counts once
+            total = replace(total, pets_seen=Pet.objects.filter(source=source, sync_generation=generation).count())
+
+        self.stdout.write(self.style.NOTICE(
+                f"Fetched: pets={fetched_pets} unique_org_ids={len(resolved_org_ids)} "
+                f"orgs_included={org_counts['included']} orgs_fresh_skipped={org_counts['fresh']} "
+                f"orgs_fetched={org_counts['fetched']}"
+            )
+        )
+        return total
+
+    @staticmethod
+    def _resolve_orgs(client, org_ids: List[str], source: Optional[str], counts: dict) -> list:
+        """
+        Org records for ids first referenced in this batch:
+        1) orgs the adapter already received alongside the pets (no HTTP)
+        2) skip orgs fetched recently (last_fetched_at, stamped even when unchanged)
+        3) fetch the rest (adapter bulk/concurrent fetch when available)
+        """
+        if not org_ids:
+            return []
+
+        included_orgs = getattr(client, "included_orgs", None)
+        records = list(included_orgs(org_ids)) if callable(included_orgs) else []
+        counts["included"] += len(records)
+
+        remaining = set(org_ids) - {o.external_org_id for o in records}
+        if remaining and source:
+            cutoff = timezone.now() - timedelta(hours=getattr(settings, "WOOFER_ORG_REFRESH_HOURS", 24))
+            fresh = set(
+                Organization.objects.filter(source=source, source_org_id__in=remaining, last_fetched_at__gte=cutoff)
+                .values_list("source_org_id", flat=True)
+            )
+            counts["fresh"] += len(fresh)
+            remaining -= fresh
+
+        if remaining:
+            fetch_orgs = getattr(client, "fetch_orgs", None)
+            if callable(fetch_orgs):
+                fetched = list(fetch_orgs(sorted(remaining)))
+            else:
+                fetched = []
+                for oid in sorted(remaining):
+                    fetched.extend(list(client.iter_orgs(limit=1, org_id=oid)))
+            counts["fetched"] += len(fetched)
+            records.extend(fetched)
+
+        return records
+
+    def _format_result(
+        self,
+        result,
+        risk_count: int,
+        dry_run: bool,
+        deactivated: int = 0,
+        elapsed_s: float = 0.0,
+        http_stats=None,
+        db_s: float = 0.0,
+    ) -> str:
+        http_lines = ""
+        if http_stats is not None:
+            http_lines = (
+                f"  http_requests={http_stats.requests}\n"
+                f"  http_retries={http_stats.retries}\n"
+                f"  http_errors={http_stats.errors}\n"
+                f"  http_seconds={http_stats.total_s:.3f}\n"
+            )
         return (
             "Ingestion result:\n"
             f"  organizations_created={result.organizations_created}\n"
             f"  organizations_updated={result.organizations_updated}\n"
+            f"  organizations_unchanged={result.organizations_unchanged}\n"
             f"  pets_created={result.pets_created}\n"
             f"  pets_updated={result.pets_updated}\n"
+            f"  pets_unchanged={result.pets_unchanged}\n"
             f"  pets_skipped={result.pets_skipped}\n"
-            f"  pets_seen={len(result.pets_seen_external_ids)}\n"
+            f"  pets_seen={result.pets_seen}\n"
             f"  pets_deactivated={deactivated}\n"
             f"  risk_backfilled={risk_count}\n"
             f"  mode={'DRY_RUN' if dry_run else 'WRITE'}\n"
             f"  elapsed_seconds={elapsed_s:.3f}\n"
+            + http_lines
+            + f"  db_seconds={db_s:.3f}\n"
         )
 
 
@@ -1,6 +1,8 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from adoption.models import Organization, Pet
+from adoption.services.description_feature_service import DescriptionFeatureService
+from adoption.services.visibility_score_service import VisibilityScoreService
 
 class Command(BaseCommand):
     help = "Seed demo organization + pets for local testing"
@@ -18,6 +20,7 @@ class Command(BaseCommand):
         )
 
         created = 0
+        pets = []
         for i in range(12):
             pet, was_created = Pet.objects.get_or_create(
                 source="DEMO",
@@ -31,10 +34,15 @@ class Command(BaseCommand):
                     "photos": [],
                     "raw_description": "Demo description",
                     "ai_description": "Friendly demo pet.",
+                    "description_features": DescriptionFeatureService.compute("Demo description", "Friendly demo pet."),
                     "temperament_tags": ["FRIENDLY"],
                 },
             )
+            pets.append(pet)
             if was_created:
                 created += 1
 
+        # The feed orders candidates by VisibilityScore.final_score
+        VisibilityScoreService.refresh_for_pets(pets)
+
         self.stdout.write(self.style.SUCCESS(f"Seed complete. Created {created} pets."))
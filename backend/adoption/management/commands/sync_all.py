@@ -6,7 +6,8 @@ class Command(BaseCommand):
 
     def add_arguments(self, parser):
         parser.add_argument("--provider", type=str, default="rescuegroups")
-        parser.add_argument("--limit", type=int, default=200)
+        # 0 = whole catalog; a capped ingest never advances the incremental watermark
+        parser.add_argument("--limit", type=int, default=0)
         parser.add_argument("--dry-run", action="store_true")
 
         # Default ON behavior (use disable flag)
@@ -30,6 +31,10 @@ class Command(BaseCommand):
 
         call_command("ingest_provider", *ingest_args)
 
+        # Pets created outside ingestion (admin, seed_demo, older deploys) still need a feed score
+        if not dry_run:
+            call_command("backfill_visibility_scores")
+
         # keep “one command = correct distance feed”
         if backfill_geo:
             backfill_args = []
@@ -37,7 +42,8 @@ class Command(BaseCommand):
                 backfill_args.append("--dry-run")
             call_command("backfill_org_geos", *backfill_args)
 
-        enrich_args = ["--limit", str(limit)]
+        # Uncapped syncs keep enrich_pets' own per-run cap
+        enrich_args = ["--limit", str(limit)] if limit > 0 else []
         if dry_run:
             enrich_args.append("--dry-run")
 
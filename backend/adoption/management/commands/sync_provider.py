@@ -16,15 +16,15 @@ class Command(BaseCommand):
         parser.add_argument(
             "--limit",
             type=int,
-            default=200,
-            help="Max number of pets to ingest.",
+            default=0,
+            help="Max number of pets to ingest. 0 (default) = whole catalog; capped runs never advance the incremental watermark.",
         )
         parser.add_argument(
             "--mode",
             type=str,
             choices=["full", "incremental"],
             default="incremental",
-            help="Ingestion mode (recorded only; behavior same as full for now).",
+            help="Ingestion mode. Incremental fetches only pets updated since the last success; full also deactivates missing pets.",
         )
         parser.add_argument(
             "--org-id",
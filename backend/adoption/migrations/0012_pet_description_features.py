@@ -0,0 +1,75 @@
+# Generated by Django 6.0.1 on 2026-10-17 21:45
+
+import re
+
+from django.db import migrations, models
+
+
+# Frozen copy of DescriptionFeatureService.compute as of this migration:
+# later keyword changes must not alter what this historical backfill writes.
+_KEYWORD_BITS = [
+    ("active", 1 << 0),
+    ("energetic", 1 << 1),
+    ("gentle", 1 << 2),
+    ("easy", 1 << 3),
+]
+_FEATURE_MEDICAL = 1 << 4
+_MEDICAL_RE = re.compile(
+    "|".join(re.escape(k) for k in [
+        "diabetes",
+        "seizure",
+        "blind",
+        "deaf",
+        "amput",
+        "special needs",
+        "medical",
+        "needs medication",
+        "wheelchair",
+        "heartworm",
+        "injury",
+        "surgery",
+    ]),
+    re.IGNORECASE,
+)
+
+
+def _compute_features(raw_description, ai_description):
+    bits = 0
+    lowered = (ai_description or raw_description or "").lower()
+    for kw, bit in _KEYWORD_BITS:
+        if kw in lowered:
+            bits |= bit
+
+    combined = (raw_description or "") + "\n" + (ai_description or "")
+    if combined.strip() and _MEDICAL_RE.search(combined):
+        bits |= _FEATURE_MEDICAL
+    return bits
+
+
+def backfill_description_features(apps, schema_editor):
+    Pet = apps.get_model("adoption", "Pet")
+    batch = []
+    for pet in Pet.objects.only("pet_id", "raw_description", "ai_description").iterator(chunk_size=1000):
+        pet.description_features = _compute_features(pet.raw_description, pet.ai_description)
+        batch.append(pet)
+        if len(batch) >= 1000:
+            Pet.objects.bulk_update(batch, ["description_features"])
+            batch = []
+    if batch:
+        Pet.objects.bulk_update(batch, ["description_features"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0011_organization_geo_source_organization_geo_updated_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='description_features',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_description_features, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 21:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0012_pet_description_features'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='pet',
+            name='content_hash',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+    ]
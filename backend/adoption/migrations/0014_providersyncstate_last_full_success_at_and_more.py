@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 22:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0013_organization_content_hash_pet_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='providersyncstate',
+            name='last_full_success_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='providersyncstate',
+            name='updated_since_watermark',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
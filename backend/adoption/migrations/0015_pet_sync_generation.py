@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-17 22:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0014_providersyncstate_last_full_success_at_and_more'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='pet',
+            name='sync_generation',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='providersyncstate',
+            name='sync_generation',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
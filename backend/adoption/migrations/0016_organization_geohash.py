@@ -0,0 +1,81 @@
+# Generated by Django 6.0.1 on 2026-10-17 22:22
+
+from django.db import migrations, models
+
+
+# Frozen copy of GeohashService.encode as of this migration: later changes to
+# the encoder or its precision must not alter what this historical backfill writes.
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_GEOHASH_PRECISION = 9
+
+
+def _encode_geohash(lat, lon):
+    lat = float(lat)
+    lon = float(lon)
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+
+    while len(chars) < _GEOHASH_PRECISION:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                bits = (bits << 1) | 1
+                lon_lo = mid
+            else:
+                bits <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                bits = (bits << 1) | 1
+                lat_lo = mid
+            else:
+                bits <<= 1
+                lat_hi = mid
+        even = not even
+        bit_count += 1
+
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return "".join(chars)
+
+
+def backfill_geohash(apps, schema_editor):
+    Organization = apps.get_model("adoption", "Organization")
+    batch = []
+    qs = Organization.objects.filter(latitude__isnull=False, longitude__isnull=False)
+    for org in qs.only("organization_id", "latitude", "longitude").iterator(chunk_size=1000):
+        org.geohash = _encode_geohash(org.latitude, org.longitude)
+        batch.append(org)
+        if len(batch) >= 1000:
+            Organization.objects.bulk_update(batch, ["geohash"])
+            batch = []
+    if batch:
+        Organization.objects.bulk_update(batch, ["geohash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0015_pet_sync_generation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='geohash',
+            field=models.CharField(blank=True, default='', max_length=12),
+        ),
+        migrations.AddIndex(
+            model_name='organization',
+            index=models.Index(fields=['geohash'], name='org_geohash_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:01
+
+import django.contrib.postgres.indexes
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0016_organization_geohash'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['user', '-created_at'], name='application_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='interest',
+            index=models.Index(fields=['user', '-created_at'], name='interest_user_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=models.Index(condition=models.Q(('status', 'ACTIVE')), fields=['-listed_at', '-pet_id'], name='pet_active_listed_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='pet',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['temperament_tags'], name='pet_temperament_tags_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.1 on 2026-10-17 23:40
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_tables(apps, schema_editor):
+    # Table for the "shared" DatabaseCache (org geo version); no-op when it already exists
+    call_command("createcachetable", database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0017_feed_query_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0018_shared_cache_table'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='visibilityscore',
+            index=models.Index(fields=['-final_score', '-pet'], name='visibility_final_score_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 6.0.1 on 2026-10-18 00:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('adoption', '0019_visibility_final_score_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='organization',
+            name='last_fetched_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
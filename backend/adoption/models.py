@@ -1,5 +1,6 @@
 import uuid
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 from django.utils import timezone
 
@@ -19,6 +20,13 @@ class Organization(models.Model):
     longitude = models.DecimalField(max_digits=9, decimal_places=6, null=True, blank=True)
     geo_source = models.CharField(max_length=32, blank=True, default="")  # e.g. ZIP
     geo_updated_at = models.DateTimeField(null=True, blank=True)
+    # Derived from latitude/longitude on save (see GeohashService), prefix-indexed for radius queries
+    geohash = models.CharField(max_length=12, blank=True, default="")
+
+    # Fingerprint of the last ingested canonical dict (unchanged syncs skip the write)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
+    # Last time a provider fetch returned this org, unchanged or not (ingest_provider refresh window)
+    last_fetched_at = models.DateTimeField(null=True, blank=True)
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -32,6 +40,8 @@ class Organization(models.Model):
 
         indexes = [
             models.Index(fields=["is_active"]),
+            # varchar_pattern_ops so LIKE 'prefix%' can use the index under any collation
+            models.Index(fields=["geohash"], name="org_geohash_prefix_idx", opclasses=["varchar_pattern_ops"]),
         ]
 
         def __str__(self):
@@ -71,9 +81,18 @@ class Pet(models.Model):
     ai_description = models.TextField(blank=True, null=True)
     temperament_tags = models.JSONField(default=list, blank=True)
     special_needs_flags = models.JSONField(default=list, blank=True)
+    # Keyword bitset computed from descriptions at ingest (see DescriptionFeatureService)
+    # NULL = not computed yet, readers fall back to scanning text
+    description_features = models.PositiveIntegerField(blank=True, null=True)
+
+    # Fingerprint of the last ingested canonical dict (unchanged syncs skip the write)
+    content_hash = models.CharField(max_length=64, blank=True, default="")
 
     listed_at = models.DateTimeField(blank=True, null=True)
     last_seen_at = models.DateTimeField(blank=True, null=True)
+    # ProviderSyncState.sync_generation of the last run that saw this pet in the feed
+    # (deactivation = ACTIVE pets of the source not stamped by the current run)
+    sync_generation = models.PositiveBigIntegerField(default=0)
     status = models.CharField(max_length=20, choices=Status.choices, default=Status.ACTIVE)
 
     created_at = models.DateTimeField(auto_now_add=True)
@@ -90,6 +109,15 @@ class Pet(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["species"]),
             models.Index(fields=["listed_at"]),
+            # Newest-first scans over the live catalog (enrich_pets, feed candidates without a
+            # VisibilityScore yet, long-stay refresh); partial so INACTIVE history never bloats it
+            models.Index(
+                fields=["-listed_at", "-pet_id"],
+                name="pet_active_listed_idx",
+                condition=models.Q(status="ACTIVE"),
+            ),
+            # hard_constraints: temperament_tags @> '["tag"]' (jsonb_path_ops only serves @>, and is smaller)
+            GinIndex(fields=["temperament_tags"], name="pet_temperament_tags_gin", opclasses=["jsonb_path_ops"]),
         ]
 
     def __str__(self):
@@ -166,6 +194,8 @@ class Interest(models.Model):
         indexes = [
             models.Index(fields=["created_at"]),
             models.Index(fields=["notification_status"]),
+            # A user's interests, newest first (InterestService.list_interests)
+            models.Index(fields=["user", "-created_at"], name="interest_user_created_idx"),
         ]
 
 
@@ -194,6 +224,8 @@ class Application(models.Model):
         indexes = [
             models.Index(fields=["created_at"]),
             models.Index(fields=["email_status"]),
+            # A user's applications, newest first (ApplicationsListView)
+            models.Index(fields=["user", "-created_at"], name="application_user_created_idx"),
         ]
    
 class PetSeen(models.Model):
@@ -247,6 +279,12 @@ class VisibilityScore(models.Model):
 
     computed_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Feed candidate fetch walks pets best score first (PetFeedService._fetch_candidates)
+            models.Index(fields=["-final_score", "-pet"], name="visibility_final_score_idx"),
+        ]
+
 
 class ProviderSyncState(models.Model):
     """
@@ -268,6 +306,15 @@ class ProviderSyncState(models.Model):
     last_run_finished_at = models.DateTimeField(null=True, blank=True)
     last_success_at = models.DateTimeField(null=True, blank=True)
 
+    # Incremental sync watermarks:
+    # updated_since_watermark = start of the last successful run (next incremental asks for changes after it)
+    # last_full_success_at = last successful full reconciliation (the only runs that deactivate)
+    updated_since_watermark = models.DateTimeField(null=True, blank=True)
+    last_full_success_at = models.DateTimeField(null=True, blank=True)
+
+    # Bumped per ingest run and stamped on every pet the run sees (Pet.sync_generation)
+    sync_generation = models.PositiveBigIntegerField(default=0)
+
     last_mode = models.CharField(
         max_length=16,
         choices=[("FULL", "Full"), ("INCREMENTAL", "Incremental")],
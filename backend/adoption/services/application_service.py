@@ -2,7 +2,10 @@ from django.db import transaction, IntegrityError
 from rest_framework.exceptions import ValidationError, NotFound
 
 from adoption.models import Application, Pet
+from adoption.services.cursor import keyset_page
+from adoption.services.feed_exclusion_service import FeedExclusionService
 from adoption.services.notification_service import NotificationService
+from adoption.services.pet_card_service import PetCardService
 from adoption.services.user_profile_service import UserProfileService
 from adoption.services.handoff_payload_builder import HandoffPayloadBuilder
 
@@ -51,6 +54,7 @@ class ApplicationService:
                     profile_snapshot=profile_snapshot,
                     handoff_payload=handoff_payload,
                 )
+            FeedExclusionService.invalidate(user)
         except IntegrityError:
             app = Application.objects.get(user=user, pet=pet)
 
@@ -58,3 +62,22 @@ class ApplicationService:
         NotificationService.notify_application_created(app)
         return app
 
+    @staticmethod
+    def list_applications(user):
+        return (
+            Application.objects
+            .select_related("pet", "organization")
+            .only(
+                "application_id", "created_at", "email_status", "handoff_payload",
+                *PetCardService.card_fields("pet__", organization_prefix="organization__"),
+            )
+            .filter(user=user)
+            .order_by("-created_at")
+        )
+
+    @staticmethod
+    def list_applications_page(user, cursor, limit):
+        """
+        Keyset page of list_applications: (applications, next_cursor).
+        """
+        return keyset_page(ApplicationService.list_applications(user), cursor, limit)
@@ -1,12 +1,23 @@
 import base64
+import binascii
 import json
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
-def encode_cursor(listed_at: Optional[datetime], pet_id: str) -> str:
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+
+DEFAULT_PAGE_LIMIT = 20
+MAX_PAGE_LIMIT = 50
+
+def encode_cursor(ts: Optional[datetime], obj_id: str) -> str:
+    """
+    Opaque (timestamp, id) keyset position.
+    """
     payload = {
-        "listed_at": listed_at.isoformat() if listed_at else None,
-        "pet_id": pet_id,
+        "ts": ts.isoformat() if ts else None,
+        "id": obj_id,
     }
     raw = json.dumps(payload).encode("utf-8")
     return base64.urlsafe_b64encode(raw).decode("utf-8")
@@ -14,7 +25,42 @@ def encode_cursor(listed_at: Optional[datetime], pet_id: str) -> str:
 def decode_cursor(cursor: str) -> Tuple[Optional[datetime], str]:
     raw = base64.urlsafe_b64decode(cursor.encode("utf-8"))
     payload = json.loads(raw.decode("utf-8"))
-    listed_at = payload.get("listed_at")
-    pet_id = payload.get("pet_id")
-    dt = datetime.fromisoformat(listed_at) if listed_at else None
-    return dt, pet_id
+    ts = payload.get("ts")
+    obj_id = payload.get("id")
+    dt = datetime.fromisoformat(ts) if ts else None
+    return dt, obj_id
+
+def clamp_page_limit(limit: Optional[int]) -> int:
+    lim = limit or DEFAULT_PAGE_LIMIT
+    return min(max(lim, 1), MAX_PAGE_LIMIT)
+
+def keyset_page(qs, cursor: Optional[str], limit: Optional[int], ts_field: str = "created_at") -> Tuple[List, Optional[str]]:
+    """
+    Newest-first page of qs ordered by (ts_field, pk) DESC, and the cursor for the next one.
+    One query: limit + 1 rows tell whether another page exists.
+    """
+    lim = clamp_page_limit(limit)
+    qs = qs.order_by(f"-{ts_field}", "-pk")
+
+    if cursor:
+        try:
+            ts, last_id = decode_cursor(cursor)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, AttributeError):
+            raise ValidationError({"cursor": ["Invalid cursor."]})
+        if ts is None or not last_id:
+            raise ValidationError({"cursor": ["Invalid cursor."]})
+        try:
+            # The redundant ts_field__lte bound is what lets the (user, ts_field DESC) index drive the scan
+            qs = qs.filter(**{f"{ts_field}__lte": ts}).filter(
+                Q(**{f"{ts_field}__lt": ts}) | Q(**{ts_field: ts, "pk__lt": last_id})
+            )
+        except DjangoValidationError:
+            raise ValidationError({"cursor": ["Invalid cursor."]})
+
+    rows = list(qs[:lim + 1])
+    if len(rows) <= lim:
+        return rows, None
+
+    rows = rows[:lim]
+    last = rows[-1]
+    return rows, encode_cursor(getattr(last, ts_field), str(last.pk))
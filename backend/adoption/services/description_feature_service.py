@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+
+# Feature bits stored in Pet.description_features (NULL = not computed yet)
+FEATURE_ACTIVE = 1 << 0
+FEATURE_ENERGETIC = 1 << 1
+FEATURE_GENTLE = 1 << 2
+FEATURE_EASY = 1 << 3
+FEATURE_MEDICAL = 1 << 4
+
+# Profile matching keywords, scanned in the primary description (ai, else raw)
+_KEYWORD_BITS = [
+    ("active", FEATURE_ACTIVE),
+    ("energetic", FEATURE_ENERGETIC),
+    ("gentle", FEATURE_GENTLE),
+    ("easy", FEATURE_EASY),
+]
+
+_MEDICAL_KEYWORDS = [
+    "diabetes",
+    "seizure",
+    "blind",
+    "deaf",
+    "amput",
+    "special needs",
+    "medical",
+    "needs medication",
+    "wheelchair",
+    "heartworm",
+    "injury",
+    "surgery",
+]
+
+# Very conservative, deterministic text scan
+_MEDICAL_RE = re.compile("|".join(re.escape(k) for k in _MEDICAL_KEYWORDS), re.IGNORECASE)
+
+
+class DescriptionFeatureService:
+    """
+    Precomputed description keyword features.
+
+    Computed once whenever a pet's description changes (ingest / enrichment),
+    so ranking and risk classification only read bits instead of scanning text.
+    """
+
+    @staticmethod
+    def compute(raw_description: Optional[str], ai_description: Optional[str]) -> int:
+        bits = 0
+
+        # Prefer ai_description if present, fallback to raw_description
+        lowered = (ai_description or raw_description or "").lower()
+        for kw, bit in _KEYWORD_BITS:
+            if kw in lowered:
+                bits |= bit
+
+        # Medical scan covers both texts (same as RiskBackfillService)
+        combined = (raw_description or "") + "\n" + (ai_description or "")
+        if combined.strip() and _MEDICAL_RE.search(combined):
+            bits |= FEATURE_MEDICAL
+
+        return bits
+
+    @staticmethod
+    def for_pet(pet) -> int:
+        """
+        Stored bits when present, computed from text otherwise (pets not yet backfilled).
+        """
+        bits = getattr(pet, "description_features", None)
+        if bits is not None:
+            return bits
+        return DescriptionFeatureService.compute(pet.raw_description, pet.ai_description)
+
+    @staticmethod
+    def is_active(bits: int) -> bool:
+        return bool(bits & (FEATURE_ACTIVE | FEATURE_ENERGETIC))
+
+    @staticmethod
+    def is_gentle(bits: int) -> bool:
+        return bool(bits & (FEATURE_GENTLE | FEATURE_EASY))
+
+    @staticmethod
+    def is_medical(bits: int) -> bool:
+        return bool(bits & FEATURE_MEDICAL)
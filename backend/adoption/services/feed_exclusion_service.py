@@ -0,0 +1,118 @@
+import uuid
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+
+from adoption.models import Application, Interest, PetSeen
+
+# Shared across processes: a swipe handled by one worker must hide the pet in every worker's feed
+FEED_EXCLUSION_CACHE_ALIAS = "shared"
+
+_ID_BYTES = 16
+# Cached in place of the array when a history exceeds WOOFER_FEED_EXCLUSION_MAX_IDS
+_TOO_MANY = b"*"
+
+
+class FeedExclusionService:
+    """
+    Per-user "already decided" pet ids (liked, applied, passed) for the feed.
+
+    Stored in the shared cache as a sorted array of 16-byte pet UUIDs, built from
+    Interest / Application / PetSeen and tagged with the user's exclusion version.
+    PetSeenService.mark_seen, InterestService.create_interest and
+    ApplicationService.create_application replace that version on commit (one blind
+    write, no read-modify-write), so the next feed rebuilds the array. A build
+    reads the version before the tables: a decision committing mid-build leaves
+    the stored array already stale instead of missing the pet until the TTL.
+    The feed sends the array as a single uuid[] parameter, which Postgres hashes,
+    so no per-user history table is scanned.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "WOOFER_FEED_EXCLUSION_CACHE_ENABLED", False)
+
+    @staticmethod
+    def _cache():
+        return caches[FEED_EXCLUSION_CACHE_ALIAS]
+
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"feed_exclusions:{user_id}"
+
+    @staticmethod
+    def _version_key(user_id) -> str:
+        return f"feed_exclusions_version:{user_id}"
+
+    @staticmethod
+    def _ttl() -> int:
+        return getattr(settings, "WOOFER_FEED_EXCLUSION_TTL_SECONDS", 3600)
+
+    @staticmethod
+    def _max_ids() -> int:
+        return getattr(settings, "WOOFER_FEED_EXCLUSION_MAX_IDS", 20000)
+
+    @staticmethod
+    def _build(user) -> bytes:
+        pet_ids = (
+            Interest.objects.filter(user=user).values_list("pet_id", flat=True)
+            .union(
+                Application.objects.filter(user=user).values_list("pet_id", flat=True),
+                PetSeen.objects.filter(user=user).values_list("pet_id", flat=True),
+            )
+        )
+        ids = sorted(pet_id.bytes for pet_id in pet_ids)
+        if len(ids) > FeedExclusionService._max_ids():
+            return _TOO_MANY
+        return b"".join(ids)
+
+    @staticmethod
+    def pet_ids(user) -> Optional[List[uuid.UUID]]:
+        """
+        Pet ids to hide from the user's feed, or None when the cache is off or the
+        history is too large for a parameter (callers keep the anti-joins then).
+        """
+        if not FeedExclusionService.is_enabled() or getattr(user, "pk", None) is None:
+            return None
+
+        cache = FeedExclusionService._cache()
+        ttl = FeedExclusionService._ttl()
+        key = FeedExclusionService._key(user.pk)
+        version_key = FeedExclusionService._version_key(user.pk)
+
+        found = cache.get_many([key, version_key])
+        version = found.get(version_key)
+        entry = found.get(key)
+        if version is not None and entry is not None and entry[0] == version:
+            data = entry[1]
+        else:
+            if version is None:
+                # First build (or evicted): every stored array carries a real version,
+                # so a missing one never matches
+                cache.add(version_key, uuid.uuid4().hex, timeout=ttl)
+                version = cache.get(version_key)
+            data = FeedExclusionService._build(user)
+            cache.set(key, (version, data), timeout=ttl)
+        if data == _TOO_MANY:
+            return None
+        return [uuid.UUID(bytes=data[i:i + _ID_BYTES]) for i in range(0, len(data), _ID_BYTES)]
+
+    @staticmethod
+    def invalidate(user) -> None:
+        """
+        A new decision: once the surrounding transaction commits, replace the user's
+        version so any cached (or in-flight) array is rebuilt by the next feed.
+        """
+        if not FeedExclusionService.is_enabled() or getattr(user, "pk", None) is None:
+            return
+
+        user_id = user.pk
+
+        def _bump():
+            FeedExclusionService._cache().set(
+                FeedExclusionService._version_key(user_id), uuid.uuid4().hex, timeout=FeedExclusionService._ttl()
+            )
+
+        transaction.on_commit(_bump)
@@ -0,0 +1,58 @@
+import uuid
+from typing import List, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+
+from adoption.models import AdopterProfile
+from adoption.services.ranking_service import RankedPet
+
+FEED_SESSION_CACHE_ALIAS = "feed_sessions"
+
+
+class FeedSessionService:
+    """
+    Snapshot of a user's ranked feed, stored on the first page.
+
+    Keyed by user + profile version (updated_at), so a profile change invalidates
+    every open session. Entries are (pet_id, score, reasons) in serving order;
+    pets themselves are re-fetched per page so status/exclusions stay current.
+    """
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "WOOFER_FEED_SESSIONS_ENABLED", False)
+
+    @staticmethod
+    def _cache():
+        return caches[FEED_SESSION_CACHE_ALIAS]
+
+    @staticmethod
+    def _key(user, profile: AdopterProfile, session_id: str) -> str:
+        version = profile.updated_at.timestamp() if profile.updated_at else 0
+        return f"feed_session:{user.pk}:{version}:{session_id}"
+
+    @staticmethod
+    def create(user, profile: AdopterProfile, limit: int, ordered: List[RankedPet]) -> Optional[str]:
+        """
+        Stores the ordered list, returns the session id (None when sessions are off).
+        """
+        if not FeedSessionService.is_enabled() or getattr(user, "pk", None) is None:
+            return None
+
+        session_id = uuid.uuid4().hex
+        entries = [(str(rp.pet.pet_id), rp.score, list(rp.reasons)) for rp in ordered]
+        FeedSessionService._cache().set(
+            FeedSessionService._key(user, profile, session_id),
+            {"limit": limit, "entries": entries},
+        )
+        return session_id
+
+    @staticmethod
+    def load(user, profile: AdopterProfile, session_id: str) -> Optional[dict]:
+        """
+        Returns the stored session or None (expired, evicted, or profile changed).
+        """
+        if not FeedSessionService.is_enabled() or getattr(user, "pk", None) is None:
+            return None
+        return FeedSessionService._cache().get(FeedSessionService._key(user, profile, session_id))
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, GeoDistanceService falls back to the python loop
+    np = None
+
+EARTH_RADIUS_MILES = 3958.7613
+
+
+def _to_float(value) -> Optional[float]:
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class GeoDistanceService:
+    """
+    Haversine distances (miles) from one center to many points.
+
+    Batch calls convert the coordinates once and run a single NumPy pass
+    when NumPy is installed. Missing/invalid coordinates get distance None
+    and are never within a radius.
+    """
+
+    @staticmethod
+    def haversine_miles(center_lat: float, center_lon: float, lat, lon) -> Optional[float]:
+        lat2 = _to_float(lat)
+        lon2 = _to_float(lon)
+        if lat2 is None or lon2 is None:
+            return None
+
+        dlat = math.radians(lat2 - center_lat)
+        dlon = math.radians(lon2 - center_lon)
+
+        a = (
+            math.sin(dlat / 2) ** 2
+            + math.cos(math.radians(center_lat)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+        )
+        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        return EARTH_RADIUS_MILES * c
+
+    @staticmethod
+    def distances_miles(
+        center_lat: float,
+        center_lon: float,
+        lats: Sequence,
+        lons: Sequence,
+        backend: Optional[str] = None,
+    ) -> List[Optional[float]]:
+        """
+        Distance per point, None where the point has no usable coordinates.
+        backend: "numpy" | "python" | None (numpy when available).
+        """
+        if backend is None:
+            backend = "numpy" if np is not None else "python"
+
+        if backend == "python" or len(lats) == 0:
+            return [
+                GeoDistanceService.haversine_miles(center_lat, center_lon, lat, lon)
+                for lat, lon in zip(lats, lons)
+            ]
+
+        if np is None:
+            raise RuntimeError("numpy backend requested but numpy is not installed")
+
+        dist = GeoDistanceService._distances_numpy(center_lat, center_lon, lats, lons)
+        # NaN != NaN: missing coordinates
+        return [None if d != d else d for d in dist.tolist()]
+
+    @staticmethod
+    def within_radius(
+        center_lat: float,
+        center_lon: float,
+        lats: Sequence,
+        lons: Sequence,
+        max_miles: float,
+        backend: Optional[str] = None,
+    ) -> Tuple[List[bool], List[Optional[float]]]:
+        """
+        (mask, distances) for a radius filter, in input order.
+        """
+        distances = GeoDistanceService.distances_miles(center_lat, center_lon, lats, lons, backend=backend)
+        limit = float(max_miles)
+        mask = [d is not None and d <= limit for d in distances]
+        return mask, distances
+
+    @staticmethod
+    def _distances_numpy(center_lat: float, center_lon: float, lats: Sequence, lons: Sequence) -> "np.ndarray":
+        lat2 = _float_array(lats)
+        lon2 = _float_array(lons)
+
+        lat2_rad = np.radians(lat2)
+        dlat = lat2_rad - math.radians(center_lat)
+        dlon = np.radians(lon2 - center_lon)
+
+        a = np.sin(dlat / 2) ** 2 + math.cos(math.radians(center_lat)) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+        return EARTH_RADIUS_MILES * 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+
+
+def _float_array(values: Sequence) -> "np.ndarray":
+    """
+    float64 array, None / non-numeric -> NaN (propagates to a NaN distance).
+    """
+    try:
+        # map(float) beats np.array() on the Decimals the ORM returns; None raises -> slow path
+        return np.fromiter(map(float, values), dtype=np.float64, count=len(values))
+    except (TypeError, ValueError):
+        return np.array([math.nan if (f := _to_float(v)) is None else f for v in values], dtype=np.float64)
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+from typing import List, Optional, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Stored precision: 9 chars ~ 5m cells
+GEOHASH_PRECISION = 9
+
+# Upper bound on prefixes per radius query (each one is an index range scan)
+MAX_COVER_CELLS = 16
+
+
+class GeohashService:
+    """
+    Pure-Python geohash encoding + radius cover.
+
+    Organization.geohash (B-tree, prefix-searchable) turns "orgs near a point"
+    into a handful of `LIKE 'prefix%'` index range scans. The cover is a
+    superset of the circle: callers still apply an exact distance check.
+    """
+
+    @staticmethod
+    def encode(lat, lon, precision: int = GEOHASH_PRECISION) -> str:
+        if lat is None or lon is None:
+            return ""
+        try:
+            lat = float(lat)
+            lon = float(lon)
+        except (TypeError, ValueError):
+            return ""
+
+        lat_lo, lat_hi = -90.0, 90.0
+        lon_lo, lon_hi = -180.0, 180.0
+        chars = []
+        bits = 0
+        bit_count = 0
+        even = True  # geohash interleaves starting with longitude
+
+        while len(chars) < precision:
+            if even:
+                mid = (lon_lo + lon_hi) / 2
+                if lon >= mid:
+                    bits = (bits << 1) | 1
+                    lon_lo = mid
+                else:
+                    bits <<= 1
+                    lon_hi = mid
+            else:
+                mid = (lat_lo + lat_hi) / 2
+                if lat >= mid:
+                    bits = (bits << 1) | 1
+                    lat_lo = mid
+                else:
+                    bits <<= 1
+                    lat_hi = mid
+            even = not even
+            bit_count += 1
+
+            if bit_count == 5:
+                chars.append(_BASE32[bits])
+                bits = 0
+                bit_count = 0
+
+        return "".join(chars)
+
+    @staticmethod
+    def cell_size_degrees(precision: int) -> Tuple[float, float]:
+        """
+        (lat_height, lon_width) of one cell at the given precision.
+        """
+        total_bits = 5 * precision
+        lon_bits = (total_bits + 1) // 2
+        lat_bits = total_bits // 2
+        return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+    @staticmethod
+    def cover(center_lat: float, center_lon: float, lat_delta: float, lon_delta: float) -> Optional[List[str]]:
+        """
+        Geohash prefixes whose cells together contain the bounding box
+        center +/- (lat_delta, lon_delta). Uses the finest precision that needs
+        at most MAX_COVER_CELLS cells. None = box too large to be worth it.
+        """
+        lat_min = max(-90.0, center_lat - lat_delta)
+        lat_max = min(90.0, center_lat + lat_delta)
+        lon_min = max(-180.0, center_lon - lon_delta)
+        lon_max = min(180.0, center_lon + lon_delta)
+
+        for precision in range(GEOHASH_PRECISION, 0, -1):
+            cell_h, cell_w = GeohashService.cell_size_degrees(precision)
+            rows = math.floor((lat_max + 90.0) / cell_h) - math.floor((lat_min + 90.0) / cell_h) + 1
+            cols = math.floor((lon_max + 180.0) / cell_w) - math.floor((lon_min + 180.0) / cell_w) + 1
+            if rows * cols > MAX_COVER_CELLS:
+                continue
+
+            first_row = math.floor((lat_min + 90.0) / cell_h)
+            first_col = math.floor((lon_min + 180.0) / cell_w)
+            prefixes = set()
+            for r in range(rows):
+                # Cell centers, clamped into range at the poles / antimeridian
+                lat = min(90.0 - cell_h / 2, -90.0 + (first_row + r + 0.5) * cell_h)
+                for c in range(cols):
+                    lon = min(180.0 - cell_w / 2, -180.0 + (first_col + c + 0.5) * cell_w)
+                    prefixes.add(GeohashService.encode(lat, lon, precision))
+            return sorted(prefixes)
+
+        return None
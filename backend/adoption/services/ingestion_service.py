@@ -1,13 +1,53 @@
 from __future__ import annotations
+import hashlib
+import json
+import uuid
+from datetime import date
 from dataclasses import dataclass
 from typing import Any, Dict, Iterable, Optional, Tuple, List
 from django.db import transaction
 from django.utils import timezone
 from adoption.services.pet_enrichment_service import PetEnrichmentService
 from adoption.services.zip_geo_service import ZipGeoService
+from adoption.services.geohash_service import GeohashService
+from adoption.services.org_distance_cache_service import OrgDistanceCacheService
+from adoption.services.visibility_score_service import VisibilityScoreService
+from adoption.services.risk_backfill_service import RiskBackfillService
+from adoption.services.description_feature_service import DescriptionFeatureService
 from adoption.models import Organization, Pet
 from typing import Set
 
+# Rows per prefetch query / INSERT .. ON CONFLICT statement
+DEFAULT_BATCH_SIZE = 1000
+
+_ORG_GEO_FIELDS = ["latitude", "longitude", "geohash", "geo_source", "geo_updated_at"]
+_ORG_UPDATE_FIELDS = ["name", "contact_email", "location", "postal_code", "is_active"] + _ORG_GEO_FIELDS + ["content_hash", "updated_at"]
+
+_PET_UPDATE_FIELDS = [
+    "organization",
+    "name",
+    "species",
+    "age_group",
+    "size",
+    "sex",
+    "breed_primary",
+    "breed_secondary",
+    "is_mixed",
+    "photos",
+    "raw_description",
+    "ai_description",
+    "description_features",
+    "listed_at",
+    "status",
+    "apply_url",
+    "apply_hint",
+    "content_hash",
+    "updated_at",
+]
+
+# Bump when ingestion policies change so every row is rewritten once
+CONTENT_HASH_VERSION = "1"
+
 @dataclass(frozen=True)
 class IngestResult:
     organizations_created: int
@@ -17,6 +57,31 @@ class IngestResult:
     pets_skipped: int
 
     pets_seen_external_ids: Set[str]
+
+    # Rows whose canonical dict matched the stored fingerprint (no write)
+    organizations_unchanged: int = 0
+    pets_unchanged: int = 0
+
+    # Distinct external ids in the feed (len(pets_seen_external_ids))
+    pets_seen: int = 0
+
+    def merged(self, other: "IngestResult") -> "IngestResult":
+        """
+        Combined counts of two ingest runs (streaming ingest sums per-batch results).
+        Seen ids are per batch and not carried over, so memory stays batch-sized;
+        pets_seen is summed (a pet repeated across batches counts per batch).
+        """
+        return IngestResult(
+            organizations_created=self.organizations_created + other.organizations_created,
+            organizations_updated=self.organizations_updated + other.organizations_updated,
+            pets_created=self.pets_created + other.pets_created,
+            pets_updated=self.pets_updated + other.pets_updated,
+            pets_skipped=self.pets_skipped + other.pets_skipped,
+            pets_seen_external_ids=set(),
+            organizations_unchanged=self.organizations_unchanged + other.organizations_unchanged,
+            pets_unchanged=self.pets_unchanged + other.pets_unchanged,
+            pets_seen=self.pets_seen + other.pets_seen,
+        )
     
 class IngestionService:
     """
@@ -25,27 +90,29 @@ class IngestionService:
     """
 
     @staticmethod
-    def upsert_organization(org: Dict[str, Any]) -> Tuple[Organization, bool]:
-        # Required keys
-        source = org.get("source")
-        source_org_id = org.get("source_org_id")
-        if not source or not source_org_id:
-            raise ValueError("Organization missing required keys: source, source_org_id")
+    def content_hash(canonical: Dict[str, Any]) -> str:
+        """
+        Stable fingerprint of a canonical org/pet dict (key order independent).
+        """
+        def _default(value):
+            if isinstance(value, date):
+                return value.isoformat()
+            return str(value)
 
-        postal_code = (org.get("postal_code", "") or "").strip()
+        payload = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=_default)
+        return hashlib.sha256(f"{CONTENT_HASH_VERSION}:{payload}".encode("utf-8")).hexdigest()
 
-        # 1) Fetch existing first (so we can decide whether geo is allowed to change)
-        existing = (
-            Organization.objects
-            .filter(source=source, source_org_id=source_org_id)
-            .only("organization_id", "geo_source", "latitude", "longitude", "postal_code")
-            .first()
-        )
+    @staticmethod
+    def _organization_defaults(org: Dict[str, Any], existing: Optional[Organization]) -> Dict[str, Any]:
+        """
+        Field values for an organization upsert, geo fields only when the ZIP policy allows.
+        """
+        source_org_id = org.get("source_org_id")
+        postal_code = (org.get("postal_code", "") or "").strip()
 
         existing_geo_source = (existing.geo_source or "") if existing else ""
-        has_existing_geo = bool(existing and existing.latitude is not None and existing.longitude is not None)
 
-        # 2) Base defaults (non-geo fields always safe to update)
+        # Base defaults (non-geo fields always safe to update)
         defaults: Dict[str, Any] = {
             "name": org.get("name") or (source_org_id or "Unknown Organization"),
             "contact_email": org.get("contact_email"),
@@ -54,7 +121,7 @@ class IngestionService:
             "is_active": bool(org.get("is_active", True)),
         }
 
-        # 3) Geo policy:
+        # Geo policy:
         # - If existing geo_source is non-empty and not ZIP, do NOT overwrite.
         # - Else, we may set/refresh ZIP geo if we have a match.
         allow_zip_geo = (existing is None) or (existing_geo_source in ("", "ZIP"))
@@ -68,6 +135,8 @@ class IngestionService:
                         {
                             "latitude": hit.lat,
                             "longitude": hit.lon,
+                            # bulk_create skips Organization.save, keep the derived column in step
+                            "geohash": GeohashService.encode(hit.lat, hit.lon),
                             "geo_source": "ZIP",
                             "geo_updated_at": timezone.now(),
                         }
@@ -77,6 +146,27 @@ class IngestionService:
                     # (Do NOT null them out.)
                     pass
 
+        return defaults
+
+    @staticmethod
+    def upsert_organization(org: Dict[str, Any]) -> Tuple[Organization, bool]:
+        # Required keys
+        source = org.get("source")
+        source_org_id = org.get("source_org_id")
+        if not source or not source_org_id:
+            raise ValueError("Organization missing required keys: source, source_org_id")
+
+        # Fetch existing first (so we can decide whether geo is allowed to change)
+        existing = (
+            Organization.objects
+            .filter(source=source, source_org_id=source_org_id)
+            .only("organization_id", "geo_source", "latitude", "longitude", "postal_code")
+            .first()
+        )
+
+        defaults = IngestionService._organization_defaults(org, existing)
+        defaults["content_hash"] = IngestionService.content_hash(org)
+
         obj, created = Organization.objects.update_or_create(
             source=source,
             source_org_id=source_org_id,
@@ -84,35 +174,15 @@ class IngestionService:
         )
         return obj, created
 
-    
     @staticmethod
-    def upsert_pet(pet: Dict[str, Any]) -> Tuple[Optional[Pet], bool, bool]:
+    def _pet_defaults(pet: Dict[str, Any], existing: Optional[Pet]) -> Dict[str, Any]:
         """
-        Returns: (pet_or_none, created?, skipped?)
-        Skipped when required keys or org link is missing.
+        Field values for a pet upsert (organization excluded).
+        existing only needs listed_at + ai_description.
         """
-        source = pet.get("source")
-        external_id = pet.get("external_id")
-        org_source_org_id = pet.get("organization_source_org_id")
-
-        if not source or not external_id:
-            return None, False, True
-        if not org_source_org_id:
-            return None, False, True
-
-        try:
-            org = Organization.objects.get(source=source, source_org_id=org_source_org_id)
-        except Organization.DoesNotExist:
-            return None, False, True
-
         incoming_listed_at = pet.get("listed_at")
 
         # Preserve listed_at once set (fairness long-stay must not reset on re-sync)
-        existing = (
-            Pet.objects.filter(source=source, external_id=str(external_id))
-            .only("listed_at")
-            .first()
-        )
         if existing and existing.listed_at:
             listed_at = existing.listed_at
         else:
@@ -125,7 +195,6 @@ class IngestionService:
         photos = [u.strip() for u in raw_photos if isinstance(u, str) and u.strip()]
 
         defaults = {
-            "organization": org,
             "name": pet.get("name") or "Unknown",
             "species": pet.get("species") or "DOG",
             "age_group": pet.get("age_group"),
@@ -150,6 +219,42 @@ class IngestionService:
             if generated:
                 defaults["ai_description"] = generated
 
+        # Description keyword bits, recomputed whenever descriptions are written
+        final_ai = defaults.get("ai_description", existing.ai_description if existing else None)
+        defaults["description_features"] = DescriptionFeatureService.compute(raw_desc, final_ai)
+
+        return defaults
+
+    @staticmethod
+    def upsert_pet(pet: Dict[str, Any]) -> Tuple[Optional[Pet], bool, bool]:
+        """
+        Returns: (pet_or_none, created?, skipped?)
+        Skipped when required keys or org link is missing.
+        """
+        source = pet.get("source")
+        external_id = pet.get("external_id")
+        org_source_org_id = pet.get("organization_source_org_id")
+
+        if not source or not external_id:
+            return None, False, True
+        if not org_source_org_id:
+            return None, False, True
+
+        try:
+            org = Organization.objects.get(source=source, source_org_id=org_source_org_id)
+        except Organization.DoesNotExist:
+            return None, False, True
+
+        existing = (
+            Pet.objects.filter(source=source, external_id=str(external_id))
+            .only("listed_at", "ai_description")
+            .first()
+        )
+
+        defaults = IngestionService._pet_defaults(pet, existing)
+        defaults["organization"] = org
+        defaults["content_hash"] = IngestionService.content_hash(pet)
+
         obj, created = Pet.objects.update_or_create(
             source=source,
             external_id=str(external_id),
@@ -158,43 +263,242 @@ class IngestionService:
         return obj, created, False
 
     @staticmethod
-    @transaction.atomic
-    def ingest_canonical(org_dicts: Iterable[Dict[str, Any]],pet_dicts: Iterable[Dict[str, Any]],
-) -> IngestResult:
-        org_created = org_updated = 0
-        pet_created = pet_updated = pet_skipped = 0
+    def _chunks(items: List[Any], size: int):
+        for i in range(0, len(items), size):
+            yield items[i:i + size]
 
-        pets_seen: Set[str] = set()
-        touched_pets: List["Pet"] = []  # pets created/updated this run (non skipped)
+    @staticmethod
+    def bulk_upsert_organizations(
+        org_dicts: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        fetched_at=None,
+    ) -> Tuple[int, int, int]:
+        """
+        Batched upsert_organization: one prefetch query + one INSERT .. ON CONFLICT per chunk.
+        Dicts matching the stored content_hash are skipped.
+        fetched_at is stamped as last_fetched_at on every org in the feed, unchanged ones
+        via one pk-keyed UPDATE per chunk.
+        Returns (created, updated, unchanged) counted per input dict.
+        """
+        update_fields = _ORG_UPDATE_FIELDS + (["last_fetched_at"] if fetched_at is not None else [])
+        created = updated = unchanged = 0
+        geo_changed = False
 
         for org in org_dicts:
-            o, created = IngestionService.upsert_organization(org)
-            if created:
-                org_created += 1
-            else:
-                org_updated += 1
-
-        for pet in pet_dicts:
-            external_id = pet.get("external_id")
-            if external_id:
-                pets_seen.add(str(external_id))
-
-            p, created, skipped = IngestionService.upsert_pet(pet)
-            if skipped:
-                pet_skipped += 1
+            if not org.get("source") or not org.get("source_org_id"):
+                raise ValueError("Organization missing required keys: source, source_org_id")
+
+        for chunk in IngestionService._chunks(org_dicts, batch_size):
+            existing_by_key: Dict[Tuple[str, str], Organization] = {
+                (o.source, o.source_org_id): o
+                for o in Organization.objects.filter(
+                    source__in={o["source"] for o in chunk},
+                    source_org_id__in={o["source_org_id"] for o in chunk},
+                ).only(
+                    "organization_id", "source", "source_org_id",
+                    "geo_source", "latitude", "longitude", "geohash", "geo_updated_at", "content_hash",
+                )
+            }
+
+            # Last dict wins per key (ON CONFLICT can't touch the same row twice)
+            rows: Dict[Tuple[str, str], Organization] = {}
+            stamp_only_ids = set()
+            for org in chunk:
+                key = (org["source"], org["source_org_id"])
+                existing = rows.get(key) or existing_by_key.get(key)
+                fingerprint = IngestionService.content_hash(org)
+
+                if existing is None:
+                    created += 1
+                elif existing.content_hash == fingerprint:
+                    unchanged += 1
+                    if key not in rows:
+                        stamp_only_ids.add(existing.organization_id)
+                    continue
+                else:
+                    updated += 1
+
+                defaults = IngestionService._organization_defaults(org, existing)
+                # Geo left out by the policy keeps its current values (never nulled out)
+                if "geo_source" not in defaults and existing is not None:
+                    for field in _ORG_GEO_FIELDS:
+                        defaults[field] = getattr(existing, field)
+
+                obj = Organization(
+                    organization_id=existing.organization_id if existing else uuid.uuid4(),
+                    source=key[0],
+                    source_org_id=key[1],
+                    content_hash=fingerprint,
+                    last_fetched_at=fetched_at,
+                    **defaults,
+                )
+                rows[key] = obj
+                stamp_only_ids.discard(obj.organization_id)
+
+            if fetched_at is not None and stamp_only_ids:
+                Organization.objects.filter(organization_id__in=stamp_only_ids).update(last_fetched_at=fetched_at)
+
+            if not rows:
+                continue
+
+            # bulk_create skips Organization.save, invalidate distance caches here
+            if any(
+                (existing_by_key.get(key).geohash if key in existing_by_key else "") != obj.geohash
+                for key, obj in rows.items()
+            ):
+                geo_changed = True
+
+            Organization.objects.bulk_create(
+                list(rows.values()),
+                update_conflicts=True,
+                unique_fields=["source", "source_org_id"],
+                update_fields=update_fields,
+            )
+
+        if geo_changed:
+            OrgDistanceCacheService.invalidate()
+        return created, updated, unchanged
+
+    @staticmethod
+    def bulk_upsert_pets(
+        pet_dicts: List[Dict[str, Any]],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        seen_stamp: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[List[Pet], int, int, int, int]:
+        """
+        Batched upsert_pet: per chunk one org query, one existing-pet query and one
+        INSERT .. ON CONFLICT (source, external_id). Same listed_at / ai_description
+        policies and per-dict counts as the row-by-row path.
+        Dicts matching the stored content_hash (and still in the same status) are not rewritten.
+        seen_stamp (e.g. sync_generation, last_seen_at) is written to every existing or
+        upserted pet in the feed, unchanged ones via one pk-keyed UPDATE per chunk.
+        Returns (touched_pets, created, updated, skipped, unchanged).
+        """
+        seen_stamp = seen_stamp or {}
+        update_fields = _PET_UPDATE_FIELDS + [f for f in seen_stamp if f not in _PET_UPDATE_FIELDS]
+        touched: List[Pet] = []
+        created = updated = skipped = unchanged = 0
+
+        for chunk in IngestionService._chunks(pet_dicts, batch_size):
+            # Dicts without an org are still looked up: a stored pet in the feed must be
+            # stamped as seen even when this record can't be upserted
+            valid = [p for p in chunk if p.get("source") and p.get("external_id")]
+            skipped += len(chunk) - len(valid)
+            if not valid:
                 continue
 
-            touched_pets.append(p)
+            org_id_by_key = {
+                (source, source_org_id): organization_id
+                for organization_id, source, source_org_id in Organization.objects.filter(
+                    source__in={p["source"] for p in valid},
+                    source_org_id__in={p["organization_source_org_id"] for p in valid if p.get("organization_source_org_id")},
+                ).values_list("organization_id", "source", "source_org_id")
+            }
 
-            if created:
-                pet_created += 1
-            else:
-                pet_updated += 1
+            existing_by_key: Dict[Tuple[str, str], Pet] = {
+                (p.source, p.external_id): p
+                for p in Pet.objects.filter(
+                    source__in={p["source"] for p in valid},
+                    external_id__in={str(p["external_id"]) for p in valid},
+                ).only("pet_id", "source", "external_id", "listed_at", "ai_description", "status", "content_hash")
+            }
+
+            # Last dict wins per key (ON CONFLICT can't touch the same row twice),
+            # earlier duplicates act as the existing row like sequential upserts would
+            rows: Dict[Tuple[str, str], Pet] = {}
+            # Stored pets present in the feed but not rewritten (still count as seen)
+            stamp_only_ids = set()
+            for pet in valid:
+                key = (pet["source"], str(pet["external_id"]))
+                organization_id = org_id_by_key.get((pet["source"], pet.get("organization_source_org_id")))
+                if organization_id is None:
+                    skipped += 1
+                    if key in existing_by_key:
+                        stamp_only_ids.add(existing_by_key[key].pet_id)
+                    continue
+
+                existing = rows.get(key) or existing_by_key.get(key)
+                fingerprint = IngestionService.content_hash(pet)
+
+                if existing is None:
+                    created += 1
+                elif (
+                    existing.content_hash == fingerprint
+                    # Deactivation happens outside ingest, a returning pet must be rewritten
+                    and existing.status == (pet.get("status") or "ACTIVE")
+                ):
+                    unchanged += 1
+                    if key not in rows:
+                        stamp_only_ids.add(existing.pet_id)
+                    continue
+                else:
+                    updated += 1
+
+                defaults = IngestionService._pet_defaults(pet, existing)
+                # ai_description left out keeps the stored one
+                if "ai_description" not in defaults:
+                    defaults["ai_description"] = existing.ai_description if existing else None
+
+                rows[key] = Pet(
+                    pet_id=existing.pet_id if existing else uuid.uuid4(),
+                    source=key[0],
+                    external_id=key[1],
+                    organization_id=organization_id,
+                    content_hash=fingerprint,
+                    **defaults,
+                    **seen_stamp,
+                )
+                stamp_only_ids.discard(rows[key].pet_id)
+
+            if rows:
+                batch = list(rows.values())
+                Pet.objects.bulk_create(
+                    batch,
+                    update_conflicts=True,
+                    unique_fields=["source", "external_id"],
+                    update_fields=update_fields,
+                )
+                touched.extend(batch)
+
+            if seen_stamp and stamp_only_ids:
+                Pet.objects.filter(pet_id__in=stamp_only_ids).update(**seen_stamp)
+
+        return touched, created, updated, skipped, unchanged
+
+    @staticmethod
+    @transaction.atomic
+    def ingest_canonical(
+        org_dicts: Iterable[Dict[str, Any]],
+        pet_dicts: Iterable[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        seen_stamp: Optional[Dict[str, Any]] = None,
+        org_fetched_at=None,
+    ) -> IngestResult:
+        size = max(1, batch_size or DEFAULT_BATCH_SIZE)
+        org_dicts = list(org_dicts)
+        pet_dicts = list(pet_dicts)
+
+        pets_seen: Set[str] = {str(p["external_id"]) for p in pet_dicts if p.get("external_id")}
+
+        org_created, org_updated, org_unchanged = IngestionService.bulk_upsert_organizations(
+            org_dicts, batch_size=size, fetched_at=org_fetched_at
+        )
+
+        # pets created/updated this run (non skipped, unchanged pets are not touched)
+        touched_pets, pet_created, pet_updated, pet_skipped, pet_unchanged = IngestionService.bulk_upsert_pets(
+            pet_dicts, batch_size=size, seen_stamp=seen_stamp
+        )
 
         # Enrich only pets touched in this ingestion run
         # Non blocking behavior is handled inside PetEnrichmentService
         PetEnrichmentService.enrich_missing_ai_descriptions(touched_pets)
 
+        # Risk flags only change with the content (long-stay drift is RiskBackfillService.refresh_long_stay)
+        RiskBackfillService.classify_pets(touched_pets)
+
+        # Maintain the precomputed feed base score for touched pets
+        VisibilityScoreService.refresh_for_pets(touched_pets)
+
         return IngestResult(
             organizations_created=org_created,
             organizations_updated=org_updated,
@@ -202,7 +506,7 @@ class IngestionService:
             pets_updated=pet_updated,
             pets_skipped=pet_skipped,
             pets_seen_external_ids=pets_seen,
+            organizations_unchanged=org_unchanged,
+            pets_unchanged=pet_unchanged,
+            pets_seen=len(pets_seen),
         )
-   
-
-
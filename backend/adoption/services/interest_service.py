@@ -1,6 +1,9 @@
 from django.db import transaction, IntegrityError
 from adoption.models import Interest, Pet
+from adoption.services.cursor import keyset_page
+from adoption.services.feed_exclusion_service import FeedExclusionService
 from adoption.services.notification_service import NotificationService
+from adoption.services.pet_card_service import PetCardService
 
 
 class InterestService:
@@ -18,6 +21,7 @@ class InterestService:
             with transaction.atomic():
                 interest = Interest.objects.create(user=user, pet=pet)
                 created = True
+                FeedExclusionService.invalidate(user)
                 # Non blocking notification
                 NotificationService.notify_interest_created(interest)
                 return interest, created
@@ -30,6 +34,14 @@ class InterestService:
         return (
             Interest.objects
             .select_related("pet", "pet__organization")
+            .only("interest_id", "created_at", *PetCardService.card_fields("pet__"))
             .filter(user=user)
             .order_by("-created_at")
         )
+
+    @staticmethod
+    def list_interests_page(user, cursor, limit):
+        """
+        Keyset page of list_interests: (interests, next_cursor).
+        """
+        return keyset_page(InterestService.list_interests(user), cursor, limit)
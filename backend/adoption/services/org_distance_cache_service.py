@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+# Geo version lives in the database-backed cache so ingest/backfill processes invalidate web workers
+GEO_VERSION_CACHE_ALIAS = "shared"
+GEO_VERSION_KEY = "org_geo_version"
+
+# Cached in place of an id set when the radius covers more than WOOFER_ORG_DISTANCE_CACHE_MAX_ORGS orgs
+TOO_MANY_ORGS = frozenset({"<too many orgs>"})
+
+
+class OrgDistanceCacheService:
+    """
+    Per-process LRU: (home_zip, radius_miles) -> organization_ids within the radius.
+
+    Feeds for a popular ZIP then filter on organization_id__in and skip the
+    centroid lookup and distance SQL. Entries are tagged with the org geo
+    version (bumped whenever Organization coordinates change) and expire after
+    WOOFER_ORG_DISTANCE_CACHE_TTL_SECONDS. Radii covering too many orgs are
+    cached as TOO_MANY_ORGS so callers go straight to the SQL distance filter.
+    """
+
+    _lock = threading.Lock()
+    # key -> (geo_version, stored_at, org_ids)
+    _entries: "OrderedDict[Tuple[str, int], Tuple[int, float, FrozenSet]]" = OrderedDict()
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "WOOFER_ORG_DISTANCE_CACHE_ENABLED", False)
+
+    @classmethod
+    def geo_version(cls) -> int:
+        """
+        Current org geo version (0 when caching is off). Read it before querying orgs and
+        pass it to put, so a set computed from coordinates that change mid-query is stored
+        already stale.
+        """
+        if not cls.is_enabled():
+            return 0
+        return caches[GEO_VERSION_CACHE_ALIAS].get(GEO_VERSION_KEY, 0)
+
+    @classmethod
+    def get(cls, home_zip: str, miles: int, version: Optional[int] = None) -> Optional[FrozenSet]:
+        """
+        Cached org ids, TOO_MANY_ORGS, or None (miss, stale version, expired, or cache off).
+        """
+        if not cls.is_enabled():
+            return None
+
+        key = (home_zip, int(miles))
+        if version is None:
+            version = cls.geo_version()
+        ttl = getattr(settings, "WOOFER_ORG_DISTANCE_CACHE_TTL_SECONDS", 300)
+
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            entry_version, stored_at, org_ids = entry
+            if entry_version != version or time.monotonic() - stored_at > ttl:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return org_ids
+
+    @classmethod
+    def put(cls, home_zip: str, miles: int, org_ids: Iterable, version: int) -> Optional[FrozenSet]:
+        """
+        Stores and returns the id set, or None when caching is off or the set is too
+        large to be worth an IN list (callers keep the SQL distance filter then; the
+        key is remembered as TOO_MANY_ORGS so the next get skips the org query).
+        version is geo_version() as read before org_ids was queried.
+        """
+        if not cls.is_enabled():
+            return None
+
+        org_ids = frozenset(org_ids)
+        too_many = len(org_ids) > getattr(settings, "WOOFER_ORG_DISTANCE_CACHE_MAX_ORGS", 2000)
+        if too_many:
+            org_ids = TOO_MANY_ORGS
+
+        max_entries = getattr(settings, "WOOFER_ORG_DISTANCE_CACHE_MAX_ENTRIES", 256)
+        with cls._lock:
+            cls._entries[(home_zip, int(miles))] = (version, time.monotonic(), org_ids)
+            cls._entries.move_to_end((home_zip, int(miles)))
+            while len(cls._entries) > max_entries:
+                cls._entries.popitem(last=False)
+        return None if too_many else org_ids
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """
+        Organization coordinates changed: drop local entries, bump the shared version.
+        """
+        cache = caches[GEO_VERSION_CACHE_ALIAS]
+        try:
+            cache.incr(GEO_VERSION_KEY)
+        except ValueError:
+            # Missing key: start above the implicit 0
+            cache.set(GEO_VERSION_KEY, 1, timeout=None)
+        with cls._lock:
+            cls._entries.clear()
+
+    @classmethod
+    def reset_cache_for_tests(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
@@ -0,0 +1,31 @@
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import receiver
+
+from adoption.models import Organization
+from adoption.services.geohash_service import GeohashService
+from adoption.services.org_distance_cache_service import OrgDistanceCacheService
+
+# Row-by-row Organization saves (admin, upsert_organization, tests) keep geohash and the
+# org distance cache in step with the coordinates. Batched writers (bulk ingest,
+# backfill_org_geos) skip signals and stamp geohash / invalidate themselves.
+# Connected in AdoptionConfig.ready().
+
+
+@receiver(pre_save, sender=Organization, dispatch_uid="organization_stamp_geohash")
+def stamp_geohash(sender, instance, **kwargs):
+    instance._previous_geohash = "" if instance._state.adding else instance.geohash
+    instance.geohash = GeohashService.encode(instance.latitude, instance.longitude)
+
+
+@receiver(post_save, sender=Organization, dispatch_uid="organization_geo_changed")
+def geo_changed(sender, instance, created, update_fields=None, **kwargs):
+    previous = getattr(instance, "_previous_geohash", "")
+    if instance.geohash == previous:
+        return
+
+    # save(update_fields=[...latitude...]) did not write the recomputed geohash
+    if update_fields is not None and "geohash" not in update_fields:
+        Organization.objects.filter(pk=instance.pk).update(geohash=instance.geohash)
+
+    # Cached (home ZIP, radius) -> org id sets depend on coordinates
+    OrgDistanceCacheService.invalidate()
@@ -0,0 +1,74 @@
+from typing import List, Optional
+
+from django.db.models import Case, F, When
+
+# What a pet card shows (feed item, interest / application mini card).
+# raw_description, provider bookkeeping and org contact/geo columns stay in Postgres.
+PET_CARD_FIELDS = (
+    "pet_id",
+    "name",
+    "age_group",
+    "size",
+    "photos",
+    "ai_description",
+    "temperament_tags",
+    "apply_url",
+    "apply_hint",
+)
+ORG_CARD_FIELDS = ("organization_id", "name", "location")
+
+# What the feed additionally reads per candidate: ranking inputs and org coordinates
+PET_RANKING_FIELDS = ("listed_at", "description_features")
+ORG_GEO_FIELDS = ("latitude", "longitude")
+RISK_FIELDS = ("is_long_stay", "is_senior", "is_medical", "is_overlooked_breed_group", "recently_returned")
+VISIBILITY_FIELDS = ("final_score",)
+
+# raw_description only for pets whose description_features are not backfilled yet
+PENDING_RAW_DESCRIPTION = "raw_description_if_unfeatured"
+
+
+class PetCardService:
+    """
+    Slim pet projections for list and feed queries (.only() over select_related rows).
+    Keeps serializer output identical while never fetching text blobs the card does not show.
+    """
+
+    @staticmethod
+    def card_fields(prefix: str = "", organization_prefix: Optional[str] = None) -> List[str]:
+        """
+        .only() paths for a pet card. prefix = "pet__" from Interest / Application querysets;
+        organization_prefix defaults to the pet's organization.
+        """
+        if organization_prefix is None:
+            organization_prefix = f"{prefix}organization__"
+        return (
+            [f"{prefix}{f}" for f in PET_CARD_FIELDS]
+            + [f"{organization_prefix}{f}" for f in ORG_CARD_FIELDS]
+        )
+
+    @staticmethod
+    def feed_queryset(qs):
+        """
+        Feed candidates: card fields plus everything ranking and the distance filter read.
+        qs must select_related("organization", "risk", "visibility").
+        """
+        fields = (
+            PetCardService.card_fields()
+            + list(PET_RANKING_FIELDS)
+            + [f"organization__{f}" for f in ORG_GEO_FIELDS]
+            + [f"risk__{f}" for f in RISK_FIELDS]
+            + [f"visibility__{f}" for f in VISIBILITY_FIELDS]
+        )
+        return qs.only(*fields).annotate(**{
+            PENDING_RAW_DESCRIPTION: Case(When(description_features__isnull=True, then=F("raw_description"))),
+        })
+
+    @staticmethod
+    def restore_pending_descriptions(pets) -> None:
+        """
+        Puts the annotated raw_description back on pets without description_features,
+        so DescriptionFeatureService.for_pet falls back to text without a deferred-field query.
+        """
+        for pet in pets:
+            if pet.description_features is None:
+                pet.raw_description = getattr(pet, PENDING_RAW_DESCRIPTION, None)
@@ -1,6 +1,8 @@
 import re
 from typing import Optional, Iterable
 
+from adoption.services.description_feature_service import DescriptionFeatureService
+
 # Keep it deterministic, no randomness, no external calls.
 
 DEFAULT_FUN_TAGLINES = [
@@ -121,7 +123,8 @@ class PetEnrichmentService:
                     continue
 
                 pet.ai_description = gen
-                pet.save(update_fields=["ai_description"])
+                pet.description_features = DescriptionFeatureService.compute(pet.raw_description, gen)
+                pet.save(update_fields=["ai_description", "description_features"])
                 updated += 1
             except Exception:
                 # swallow ingestion must never fail because enrichment failed
@@ -1,12 +1,19 @@
 from typing import Optional, Tuple, List
 import math
-from decimal import Decimal
-from adoption.models import Pet, AdopterProfile, Interest, PetSeen, Application
-from adoption.services.ranking_service import RankingService, DIVERSITY_TARGET_BOOSTED_RATIO, DIVERSITY_MIN_NORMAL_PER_PAGE
-from adoption.services.ranked_cursor import decode_rank_cursor, encode_rank_cursor
-from django.db.models import Subquery
+from adoption.models import Pet, AdopterProfile, Interest, PetSeen, Application, Organization
+from adoption.services.ranking_service import RankingService, RankedPet, DIVERSITY_TARGET_BOOSTED_RATIO, DIVERSITY_MIN_NORMAL_PER_PAGE
+from adoption.services.ranked_cursor import decode_rank_cursor, decode_rank_cursor_session, encode_rank_cursor
+from adoption.services.feed_exclusion_service import FeedExclusionService
+from adoption.services.feed_session_service import FeedSessionService
+from django.db.models import BooleanField, Exists, FloatField, OuterRef, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import ASin, Cast, Cos, Least, Power, Radians, Sin, Sqrt
 from adoption.services.user_profile_service import UserProfileService
 from adoption.services.zip_geo_service import ZipGeoService
+from adoption.services.geohash_service import GeohashService
+from adoption.services.geo_distance_service import GeoDistanceService, EARTH_RADIUS_MILES
+from adoption.services.org_distance_cache_service import TOO_MANY_ORGS, OrgDistanceCacheService
+from adoption.services.pet_card_service import PetCardService
 
 DEFAULT_LIMIT = 20
 MAX_LIMIT = 50
@@ -16,72 +23,185 @@ MAX_CANDIDATES = 500  # MVP
 class PetFeedService:
     @staticmethod
     def get_feed(user, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[Pet], Optional[str]]:
+        page, next_cursor = PetFeedService.get_feed_page(user, cursor, limit)
+        return [rp.pet for rp in page], next_cursor
+
+    @staticmethod
+    def get_feed_page(user, cursor: Optional[str], limit: Optional[int]) -> Tuple[List[RankedPet], Optional[str]]:
+        """
+        Same as get_feed, but keeps the RankedPet (score + reasons) for each item
+        so serializers never need to re-score.
+        """
         lim = limit or DEFAULT_LIMIT
         lim = min(max(lim, 1), MAX_LIMIT)
         profile = UserProfileService.get_or_create_profile(user)
 
-        base_qs = (
+        # Later pages of a live feed session are served from the stored snapshot
+        if cursor:
+            session_result = PetFeedService._get_session_page(user, profile, cursor, lim)
+            if session_result is not None:
+                return session_result
+
+        ranked = PetFeedService._rank_candidates(user, profile)
+
+        if cursor:
+            last_score, last_pet_id = decode_rank_cursor(cursor)
+            ranked = PetFeedService._after_cursor(ranked, last_score, last_pet_id)
+
+        page = PetFeedService._select_page_with_diversity(ranked, lim)
+
+        if len(page) < lim:
+            return page, None
+
+        last = page[-1]
+
+        # First page opens a session holding every later page in serving order
+        if not cursor:
+            ordered = PetFeedService._paginate_all(ranked, lim)
+            session_id = FeedSessionService.create(user, profile, lim, ordered)
+            if session_id is not None:
+                return page, encode_rank_cursor(last.score, str(last.pet.pet_id), session_id, len(page))
+
+        next_cursor = encode_rank_cursor(last.score, str(last.pet.pet_id))
+        return page, next_cursor
+
+    @staticmethod
+    def _base_queryset(user):
+        # Card projection: only the columns ranking and PetFeedItemSerializer read
+        qs = PetCardService.feed_queryset(
             Pet.objects
-            .select_related("organization")
+            .select_related("organization", "risk", "visibility")
             .filter(status=Pet.Status.ACTIVE)
         )
 
-        # APPLY PROFILE FILTERS (returns distance_ctx)
-        base_qs, distance_ctx = PetFeedService._apply_profile_filters(base_qs, profile)
-
-        # Exclude "already decided" pets (user scoped)
+        # Exclude "already decided" pets (user scoped).
+        # The cached exclusion array goes out as one uuid[] parameter (hashed by Postgres);
+        # without it, NOT EXISTS anti-joins probe the (user, pet) unique indexes.
         if user is not None and getattr(user, "is_authenticated", False):
-            liked_pet_ids = Interest.objects.filter(user=user).values("pet_id")
-            applied_pet_ids = Application.objects.filter(user=user).values("pet_id")
-            passed_pet_ids = PetSeen.objects.filter(user=user).values("pet_id")
-
-            base_qs = (
-                base_qs
-                .exclude(pet_id__in=Subquery(liked_pet_ids))
-                .exclude(pet_id__in=Subquery(applied_pet_ids))
-                .exclude(pet_id__in=Subquery(passed_pet_ids))
-            )
+            excluded = FeedExclusionService.pet_ids(user)
+            if excluded is not None:
+                if excluded:
+                    qs = qs.filter(RawSQL(
+                        f'"{Pet._meta.db_table}"."pet_id" <> ALL(%s::uuid[])', (excluded,), output_field=BooleanField()
+                    ))
+            else:
+                qs = (
+                    qs
+                    .exclude(Exists(Interest.objects.filter(user=user, pet_id=OuterRef("pk"))))
+                    .exclude(Exists(Application.objects.filter(user=user, pet_id=OuterRef("pk"))))
+                    .exclude(Exists(PetSeen.objects.filter(user=user, pet_id=OuterRef("pk"))))
+                )
+        return qs
 
-        # Candidate set: stable deterministic DB fetch
+    @staticmethod
+    def _fetch_candidates(qs) -> List[Pet]:
+        """
+        Candidate set: stable deterministic DB fetch, best precomputed base score first.
+        Pets without a VisibilityScore row yet follow in recency order (same order as
+        final_score DESC NULLS LAST), fetched separately so each part walks an index:
+        scored pets visibility_final_score_idx, the unscored tail pet_active_listed_idx.
+        """
         candidates = list(
-            base_qs
-            .order_by("-listed_at", "-pet_id")[:MAX_CANDIDATES]
+            qs.filter(visibility__isnull=False)
+            .order_by("-visibility__final_score", "-listed_at", "-pet_id")[:MAX_CANDIDATES]
         )
+        if len(candidates) < MAX_CANDIDATES:
+            candidates += list(
+                qs.filter(visibility__isnull=True)
+                .order_by("-listed_at", "-pet_id")[:MAX_CANDIDATES - len(candidates)]
+            )
+        return candidates
+
+    @staticmethod
+    def _rank_candidates(user, profile: AdopterProfile) -> List[RankedPet]:
+        """
+        Full pipeline: filters, candidate fetch, distance filter, ranking, diversity slotting.
+        """
+        base_qs = PetFeedService._base_queryset(user)
+
+        # APPLY PROFILE FILTERS (returns distance_ctx)
+        base_qs, distance_ctx = PetFeedService._apply_profile_filters(base_qs, profile)
+
+        candidates = PetFeedService._fetch_candidates(base_qs)
+        PetCardService.restore_pending_descriptions(candidates)
 
-        # PRECISE DISTANCE FILTER (after DB filter/candidate cap)
+        # PRECISE DISTANCE FILTER (SQL already filtered the radius, this pins the float boundary)
         if distance_ctx is not None:
             center_lat, center_lon = distance_ctx["center"]
             max_miles = distance_ctx["miles"]
 
-            candidates = [
-                p for p in candidates
-                if PetFeedService._within_radius_miles(
-                    center_lat, center_lon,
-                    getattr(p.organization, "latitude", None),
-                    getattr(p.organization, "longitude", None),
-                    max_miles,
-                )
-            ]
+            # One batch haversine over all candidates (NumPy when available)
+            mask, _ = GeoDistanceService.within_radius(
+                center_lat, center_lon,
+                [getattr(p.organization, "latitude", None) for p in candidates],
+                [getattr(p.organization, "longitude", None) for p in candidates],
+                max_miles,
+            )
+            candidates = [p for p, keep in zip(candidates, mask) if keep]
 
         ranked = RankingService.rank(candidates, profile=profile)
-        ranked = PetFeedService._apply_diversity_slotting(ranked)
+        return PetFeedService._apply_diversity_slotting(ranked)
 
-        if cursor:
-            last_score, last_pet_id = decode_rank_cursor(cursor)
-            ranked = [
-                rp for rp in ranked
-                if (rp.score < last_score) or (rp.score == last_score and str(rp.pet.pet_id) < last_pet_id)
-            ]
+    @staticmethod
+    def _after_cursor(ranked, last_score: float, last_pet_id: str):
+        return [
+            rp for rp in ranked
+            if (rp.score < last_score) or (rp.score == last_score and str(rp.pet.pet_id) < last_pet_id)
+        ]
 
-        page = PetFeedService._select_page_with_diversity(ranked, lim)
-        pets = [rp.pet for rp in page]
+    @staticmethod
+    def _paginate_all(ranked, lim: int) -> List[RankedPet]:
+        """
+        Every page the cursor path would serve, flattened in order.
+        Each step filters the previous remainder (the cursor only moves forward),
+        so a session page matches the re-ranked page for the same cursor.
+        """
+        ordered = []
+        remaining = ranked
+        while True:
+            page = PetFeedService._select_page_with_diversity(remaining, lim)
+            ordered.extend(page)
+            if len(page) < lim:
+                return ordered
+            last = page[-1]
+            remaining = PetFeedService._after_cursor(remaining, last.score, str(last.pet.pet_id))
+
+    @staticmethod
+    def _get_session_page(user, profile: AdopterProfile, cursor: str, lim: int):
+        """
+        O(page) read from a feed session, or None to fall back to re-ranking
+        (plain cursor, expired session, changed profile or page size).
+        """
+        position = decode_rank_cursor_session(cursor)
+        if position is None:
+            return None
+
+        session_id, offset = position
+        session = FeedSessionService.load(user, profile, session_id)
+        if session is None or session["limit"] != lim:
+            return None
+
+        entries = session["entries"]
+        base_qs = PetFeedService._base_queryset(user)
+
+        page = []
+        pos = offset
+        # Pets that were decided/deactivated since the snapshot are skipped, read further to fill
+        while len(page) < lim and pos < len(entries):
+            window = entries[pos:pos + (lim - len(page))]
+            pos += len(window)
+
+            pets = {str(p.pet_id): p for p in base_qs.filter(pet_id__in=[pet_id for pet_id, _, _ in window])}
+            for pet_id, score, reasons in window:
+                pet = pets.get(pet_id)
+                if pet is not None:
+                    page.append(RankedPet(pet=pet, score=score, reasons=list(reasons)))
 
         if len(page) < lim:
-            return pets, None
+            return page, None
 
         last = page[-1]
-        next_cursor = encode_rank_cursor(last.score, str(last.pet.pet_id))
-        return pets, next_cursor
+        return page, encode_rank_cursor(last.score, str(last.pet.pet_id), session_id, pos)
 
     @staticmethod
     def _apply_diversity_slotting(ranked):
@@ -147,8 +267,12 @@ class PetFeedService:
 
         12.5.4 rule:
         If home_postal_code and max_distance_miles are present and valid:
+          - home centroid from ZipGeoService.resolve (nearest same-prefix ZIP when not in the file)
           - require org lat/lon (exclude missing)
-          - filter via haversine in python (after candidate fetch)
+          - in-range org ids from OrgDistanceCacheService (computed once per ZIP + radius
+            with geohash cover + haversine in SQL)
+          - without the cache: the same SQL filter on the pets (before the candidate cap),
+            then exact float haversine in python on the capped candidates
         """
         prefs = profile.preferences or {}
 
@@ -174,38 +298,69 @@ class PetFeedService:
                 md = None
 
         if home_zip and md is not None and md > 0:
-            # Resolve home centroid (offline)
-            home = ZipGeoService.lookup(home_zip)
+            # Popular ZIPs: in-range org ids are cached, no centroid lookup or distance SQL
+            # Read before the org query below: a concurrent coordinate change then leaves the new entry stale
+            geo_version = OrgDistanceCacheService.geo_version()
+            org_ids = OrgDistanceCacheService.get(home_zip, md, geo_version)
+            if org_ids is not None and org_ids is not TOO_MANY_ORGS:
+                return PetFeedService._apply_hard_constraints(qs.filter(organization_id__in=org_ids), prefs), None
+
+            # Resolve home centroid (offline); unknown ZIPs fall back to the nearest known one in the prefix
+            home = ZipGeoService.resolve(home_zip)
             latlon = PetFeedService._extract_lat_lon(home)
 
             if latlon is not None:
                 center_lat, center_lon = latlon
-                distance_ctx = {"center": (center_lat, center_lon), "miles": md}
-
-                # Exclude orgs that cannot be distance filtered
-                qs = qs.exclude(organization__latitude__isnull=True).exclude(organization__longitude__isnull=True)
-
-                # Optional: DB-side bounding box to reduce candidates BEFORE Python haversine
-                lat_delta, lon_delta = PetFeedService._bbox_deltas_miles(center_lat, md)
-                lat_min = Decimal(str(center_lat - lat_delta))
-                lat_max = Decimal(str(center_lat + lat_delta))
-                lon_min = Decimal(str(center_lon - lon_delta))
-                lon_max = Decimal(str(center_lon + lon_delta))
-
-                qs = qs.filter(
-                    organization__latitude__gte=lat_min,
-                    organization__latitude__lte=lat_max,
-                    organization__longitude__gte=lon_min,
-                    organization__longitude__lte=lon_max,
-                )
 
+                if org_ids is TOO_MANY_ORGS:
+                    # Known to cover too many orgs: skip the org query
+                    org_ids = None
+                else:
+                    in_range = PetFeedService._radius_filter(
+                        Organization.objects.all(), center_lat, center_lon, md, prefix=""
+                    ).values_list("organization_id", flat=True)
+                    org_ids = OrgDistanceCacheService.put(home_zip, md, in_range, geo_version)
+
+                if org_ids is not None:
+                    qs = qs.filter(organization_id__in=org_ids)
+                else:
+                    # Cache off or too many orgs for an IN list: filter the pets directly
+                    distance_ctx = {"center": (center_lat, center_lon), "miles": md}
+                    qs = PetFeedService._radius_filter(qs, center_lat, center_lon, md, prefix="organization__")
+
+        return PetFeedService._apply_hard_constraints(qs, prefs), distance_ctx
+
+    @staticmethod
+    def _apply_hard_constraints(qs, prefs: dict):
         # Lean MVP hard constraints
         hard_constraints = prefs.get("hard_constraints") or []
         for c in hard_constraints:
             if isinstance(c, str) and c.strip():
                 qs = qs.filter(temperament_tags__contains=[c.strip()])
+        return qs
 
-        return qs, distance_ctx
+    @staticmethod
+    def _radius_filter(qs, center_lat: float, center_lon: float, md: int, prefix: str):
+        """
+        Org coordinates within md miles, in SQL. prefix = "" for Organization
+        querysets, "organization__" for Pet querysets.
+        """
+        # Exclude orgs that cannot be distance filtered
+        qs = qs.exclude(**{f"{prefix}latitude__isnull": True}).exclude(**{f"{prefix}longitude__isnull": True})
+
+        # Geohash prefix cover of the radius bounding box (index range scans on Organization.geohash)
+        lat_delta, lon_delta = PetFeedService._bbox_deltas_miles(center_lat, md)
+        prefixes = GeohashService.cover(center_lat, center_lon, lat_delta, lon_delta)
+        if prefixes is not None:
+            cover_q = Q()
+            for gh in prefixes:
+                cover_q |= Q(**{f"{prefix}geohash__startswith": gh})
+            qs = qs.filter(cover_q)
+
+        # Exact radius in SQL, so the candidate cap only ever sees in-radius pets
+        return qs.alias(
+            distance_miles=PetFeedService._distance_miles_expression(center_lat, center_lon, prefix)
+        ).filter(distance_miles__lte=float(md))
 
     @staticmethod
     def _select_page_with_diversity(ranked, lim: int):
@@ -313,24 +468,24 @@ class PetFeedService:
         return lat_delta, lon_delta
 
     @staticmethod
-    def _within_radius_miles(center_lat, center_lon, org_lat, org_lon, max_miles: int) -> bool:
-        if org_lat is None or org_lon is None:
-            return False
-
-        try:
-            lat2 = float(org_lat)
-            lon2 = float(org_lon)
-        except (TypeError, ValueError):
-            return False
-
-        # Haversine (miles)
-        r_miles = 3958.7613
-        dlat = math.radians(lat2 - center_lat)
-        dlon = math.radians(lon2 - center_lon)
+    def _distance_miles_expression(center_lat: float, center_lon: float, prefix: str = "organization__"):
+        """
+        Haversine distance (miles) from the center to the organization, as a SQL expression.
+        Same formula as GeoDistanceService.haversine_miles.
+        """
+        lat2 = Radians(Cast(f"{prefix}latitude", FloatField()))
+        lon2 = Radians(Cast(f"{prefix}longitude", FloatField()))
+        lat1 = math.radians(center_lat)
+        lon1 = math.radians(center_lon)
 
         a = (
-            math.sin(dlat / 2) ** 2
-            + math.cos(math.radians(center_lat)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+            Power(Sin((lat2 - Value(lat1)) / 2), 2)
+            + Value(math.cos(lat1)) * Cos(lat2) * Power(Sin((lon2 - Value(lon1)) / 2), 2)
         )
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
-        return (r_miles * c) <= float(max_miles)
+        # 2 * atan2(sqrt(a), sqrt(1 - a)) == 2 * asin(sqrt(a)) for a in [0, 1]; LEAST guards rounding
+        return Value(2 * EARTH_RADIUS_MILES) * ASin(Sqrt(Least(a, Value(1.0))))
+
+    @staticmethod
+    def _within_radius_miles(center_lat, center_lon, org_lat, org_lon, max_miles: int) -> bool:
+        distance = GeoDistanceService.haversine_miles(center_lat, center_lon, org_lat, org_lon)
+        return distance is not None and distance <= float(max_miles)
@@ -1,5 +1,6 @@
 from django.db import IntegrityError, transaction
 from adoption.models import Pet, PetSeen
+from adoption.services.feed_exclusion_service import FeedExclusionService
 
 
 class PetSeenService:
@@ -12,6 +13,7 @@ class PetSeenService:
             with transaction.atomic():
                 obj = PetSeen.objects.create(user=user, pet=pet)
                 created = True
+            FeedExclusionService.invalidate(user)
         except IntegrityError:
             obj = PetSeen.objects.get(user=user, pet=pet)
             created = False
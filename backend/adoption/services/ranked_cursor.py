@@ -2,8 +2,12 @@ import base64
 import json
 from typing import Optional, Tuple
 
-def encode_rank_cursor(score: float, pet_id: str) -> str:
+def encode_rank_cursor(score: float, pet_id: str, session_id: Optional[str] = None, offset: Optional[int] = None) -> str:
     payload = {"score": score, "pet_id": pet_id}
+    # Feed session position (optional), score/pet_id stay so expired sessions fall back to re-ranking
+    if session_id is not None:
+        payload["session"] = session_id
+        payload["offset"] = offset
     raw = json.dumps(payload).encode("utf-8")
     return base64.urlsafe_b64encode(raw).decode("utf-8")
 
@@ -11,3 +15,15 @@ def decode_rank_cursor(cursor: str) -> Tuple[float, str]:
     raw = base64.urlsafe_b64decode(cursor.encode("utf-8"))
     payload = json.loads(raw.decode("utf-8"))
     return float(payload["score"]), payload["pet_id"]
+
+def decode_rank_cursor_session(cursor: str) -> Optional[Tuple[str, int]]:
+    """
+    Returns (session_id, offset) for session cursors, None for plain score/pet_id cursors.
+    """
+    raw = base64.urlsafe_b64decode(cursor.encode("utf-8"))
+    payload = json.loads(raw.decode("utf-8"))
+    session_id = payload.get("session")
+    offset = payload.get("offset")
+    if not isinstance(session_id, str) or not isinstance(offset, int) or offset < 0:
+        return None
+    return session_id, offset
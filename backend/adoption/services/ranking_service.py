@@ -1,7 +1,9 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Tuple, Optional
-from adoption.models import Pet, RiskClassification, AdopterProfile
+from typing import Dict, List, Tuple, Optional
+from django.conf import settings
+from adoption.models import Pet, RiskClassification, AdopterProfile, VisibilityScore
+from adoption.services.description_feature_service import DescriptionFeatureService
  
 
 # Deterministic weights (tunable later)
@@ -14,6 +16,13 @@ BOOST_PROFILE_ACTIVITY_MATCH = 0.10
 BOOST_PROFILE_HOME_MATCH = 0.08
 BOOST_PROFILE_EXPERIENCE_MATCH = 0.07
 
+# Per-profile reasons are ranking-internal, why_shown only exposes bias-correction reasons
+PROFILE_REASONS = frozenset({
+    "PROFILE_ACTIVITY_MATCH",
+    "PROFILE_HOME_MATCH",
+    "PROFILE_EXPERIENCE_MATCH",
+})
+
 # cap total boost influence so boosted pets don't permanently dominate
 MAX_TOTAL_BOOST = 0.40
 
@@ -38,6 +47,7 @@ class RankingService:
     """
     v0 deterministic ranker.
     Base signal = recency (listed_at), plus bias-correction boosts from RiskClassification.
+    The profile-independent part is precomputed into VisibilityScore (see VisibilityScoreService).
     """
 
     @staticmethod
@@ -49,6 +59,15 @@ class RankingService:
         # Normalize to "days since epoch" so weights are comparable
         return listed_at.timestamp() / 86400.0
 
+    @staticmethod
+    def _description_flags(pet: Pet) -> Tuple[bool, bool]:
+        """
+        (mentions active/energetic, mentions gentle/easy) for profile matching.
+        Reads the precomputed description_features bits (no string work).
+        """
+        bits = DescriptionFeatureService.for_pet(pet)
+        return DescriptionFeatureService.is_active(bits), DescriptionFeatureService.is_gentle(bits)
+
     @staticmethod
     def _profile_boost(pet: Pet, profile: AdopterProfile) -> Tuple[float, List[str]]:
         """
@@ -58,13 +77,11 @@ class RankingService:
         boost = 0.0
         reasons: List[str] = []
 
-        # Prefer ai_description if present, fallback to raw_description
-        description = (pet.ai_description or pet.raw_description or "")
-        lowered = description.lower()
+        is_active_text, is_gentle_text = RankingService._description_flags(pet)
 
         # Activity matching
         if profile.activity_level == AdopterProfile.ActivityLevel.HIGH:
-            if "active" in lowered or "energetic" in lowered:
+            if is_active_text:
                 boost += BOOST_PROFILE_ACTIVITY_MATCH
                 reasons.append("PROFILE_ACTIVITY_MATCH")
 
@@ -76,7 +93,7 @@ class RankingService:
 
         # New adopters - soft boost for gentle/easy language if present
         if profile.experience_level == AdopterProfile.ExperienceLevel.NEW:
-            if "gentle" in lowered or "easy" in lowered:
+            if is_gentle_text:
                 boost += BOOST_PROFILE_EXPERIENCE_MATCH
                 reasons.append("PROFILE_EXPERIENCE_MATCH")
 
@@ -85,49 +102,122 @@ class RankingService:
 
 
     @staticmethod
-    def score_pet(pet: Pet, profile: Optional[AdopterProfile] = None) -> Tuple[float, List[str]]:
+    def _get_risk(pet: Pet) -> Optional[RiskClassification]:
+        try:
+            return pet.risk
+        except RiskClassification.DoesNotExist:
+            return None
+
+    @staticmethod
+    def _get_visibility(pet: Pet) -> Optional[VisibilityScore]:
+        try:
+            return pet.visibility
+        except VisibilityScore.DoesNotExist:
+            return None
 
-        score = RankingService._recency_score(pet.listed_at)
+    @staticmethod
+    def risk_boosts(risk: Optional[RiskClassification]) -> Dict[str, float]:
+        """
+        Uncapped bias-correction boosts, split the way VisibilityScore stores them.
+        """
+        boosts = {"boost_long_stay": 0.0, "boost_risk": 0.0, "boost_returned": 0.0}
+        if not risk:
+            return boosts
+
+        if risk.is_long_stay:
+            boosts["boost_long_stay"] += BOOST_LONG_STAY
+        if risk.is_senior:
+            boosts["boost_risk"] += BOOST_SENIOR
+        if risk.is_medical:
+            boosts["boost_risk"] += BOOST_MEDICAL
+        if risk.is_overlooked_breed_group:
+            boosts["boost_risk"] += BOOST_OVERLOOKED
+        if risk.recently_returned:
+            boosts["boost_returned"] += BOOST_RETURNED
+        return boosts
+
+    @staticmethod
+    def risk_reasons(risk: Optional[RiskClassification]) -> List[str]:
         reasons: List[str] = []
+        if not risk:
+            return reasons
+
+        if risk.is_long_stay:
+            reasons.append("LONG_STAY_BOOST")
+        if risk.is_senior:
+            reasons.append("SENIOR_BOOST")
+        if risk.is_medical:
+            reasons.append("MEDICAL_BOOST")
+        if risk.is_overlooked_breed_group:
+            reasons.append("OVERLOOKED_GROUP_BOOST")
+        if risk.recently_returned:
+            reasons.append("RECENTLY_RETURNED_BOOST")
+        return reasons
 
-        try:
-            risk = pet.risk
-        except RiskClassification.DoesNotExist:
-            risk = None
-
-        total_boost = 0.0
-
-        if risk:
-            if risk.is_long_stay:
-                total_boost += BOOST_LONG_STAY
-                reasons.append("LONG_STAY_BOOST")
-            if risk.is_senior:
-                total_boost += BOOST_SENIOR
-                reasons.append("SENIOR_BOOST")
-            if risk.is_medical:
-                total_boost += BOOST_MEDICAL
-                reasons.append("MEDICAL_BOOST")
-            if risk.is_overlooked_breed_group:
-                total_boost += BOOST_OVERLOOKED
-                reasons.append("OVERLOOKED_GROUP_BOOST")
-            if risk.recently_returned:
-                total_boost += BOOST_RETURNED
-                reasons.append("RECENTLY_RETURNED_BOOST")
+    @staticmethod
+    def compute_base_score(pet: Pet, risk: Optional[RiskClassification]) -> Dict[str, float]:
+        """
+        Profile-independent score components (the VisibilityScore row shape).
+        final_score = recency + capped risk boosts.
+        """
+        base = RankingService._recency_score(pet.listed_at)
+        boosts = RankingService.risk_boosts(risk)
 
+        # cap total boost
+        total_boost = boosts["boost_long_stay"] + boosts["boost_risk"] + boosts["boost_returned"]
+        if total_boost > MAX_TOTAL_BOOST:
+            total_boost = MAX_TOTAL_BOOST
+
+        return {
+            "base_score": base,
+            **boosts,
+            "penalty_high_adopt_prob": 0.0,
+            "final_score": base + total_boost,
+        }
+
+    @staticmethod
+    def base_score(pet: Pet) -> Tuple[float, List[str]]:
+        """
+        Recency + capped risk boosts.
+        Reads the precomputed VisibilityScore when present, computes on the fly otherwise.
+        """
+        risk = RankingService._get_risk(pet)
+        reasons = RankingService.risk_reasons(risk)
+
+        visibility = RankingService._get_visibility(pet)
+        if visibility is not None:
+            return visibility.final_score, reasons
+
+        return RankingService.compute_base_score(pet, risk)["final_score"], reasons
+
+    @staticmethod
+    def score_pet(pet: Pet, profile: Optional[AdopterProfile] = None) -> Tuple[float, List[str]]:
+        score, reasons = RankingService.base_score(pet)
+
+        # Profile boosts are per-request and never stored
         if profile is not None:
             p_boost, p_reasons = RankingService._profile_boost(pet, profile)
             score += p_boost
             reasons.extend(p_reasons)
 
-        # cap total boost
-        if total_boost > MAX_TOTAL_BOOST:
-            total_boost = MAX_TOTAL_BOOST
-        
-        score += total_boost
         return score, reasons
 
     @staticmethod
     def rank(pets: List[Pet], profile: Optional[AdopterProfile] = None) -> List[RankedPet]:
+        """
+        Backend is picked by settings.WOOFER_RANKING_BACKEND ("python" | "numpy").
+        Both produce identical ordering; numpy falls back to python when unavailable.
+        """
+        if getattr(settings, "WOOFER_RANKING_BACKEND", "python") == "numpy":
+            from adoption.services.vectorized_ranking_service import VectorizedRankingService
+
+            if VectorizedRankingService.is_available():
+                return VectorizedRankingService.rank(pets, profile=profile)
+
+        return RankingService.rank_python(pets, profile=profile)
+
+    @staticmethod
+    def rank_python(pets: List[Pet], profile: Optional[AdopterProfile] = None) -> List[RankedPet]:
 
         ranked: List[RankedPet] = []
         for p in pets:
@@ -143,6 +233,14 @@ class RankingService:
         _, reasons = RankingService.score_pet(pet)
         return reasons
 
+    @staticmethod
+    def why_shown(reasons: List[str]) -> List[str]:
+        """
+        Public why_shown list for an already-ranked pet (drops per-profile reasons).
+        Same output as reasons_for_pet without re-scoring.
+        """
+        return [r for r in reasons if r not in PROFILE_REASONS]
+
     @staticmethod
     def is_boosted(reasons: List[str]) -> bool:
         """
@@ -1,32 +1,14 @@
 from __future__ import annotations
 
-import re
 from datetime import timedelta
-from typing import Optional, Tuple
+from typing import Iterable, List, Optional, Tuple
 
 from django.db import transaction
 from django.utils import timezone
 
 from adoption.models import Pet, RiskClassification
-
-
-_MEDICAL_KEYWORDS = [
-    "diabetes",
-    "seizure",
-    "blind",
-    "deaf",
-    "amput",
-    "special needs",
-    "medical",
-    "needs medication",
-    "wheelchair",
-    "heartworm",
-    "injury",
-    "surgery",
-]
-
-# Very conservative, deterministic text scan
-_MEDICAL_RE = re.compile("|".join(re.escape(k) for k in _MEDICAL_KEYWORDS), re.IGNORECASE)
+from adoption.services.visibility_score_service import VisibilityScoreService
+from adoption.services.description_feature_service import DescriptionFeatureService
 
 
 class RiskBackfillService:
@@ -42,6 +24,14 @@ class RiskBackfillService:
     # MVP defaults — tune later
     LONG_STAY_DAYS = 21
 
+    _FLAG_FIELDS = [
+        "is_long_stay",
+        "is_senior",
+        "is_medical",
+        "is_overlooked_breed_group",
+        "recently_returned",
+    ]
+
     @staticmethod
     def _is_long_stay(pet: Pet, now=None) -> bool:
         now = now or timezone.now()
@@ -56,18 +46,16 @@ class RiskBackfillService:
 
     @staticmethod
     def _is_medical(pet: Pet) -> bool:
-        raw = (pet.raw_description or "") + "\n" + (pet.ai_description or "")
-        if not raw.strip():
-            return False
-        return bool(_MEDICAL_RE.search(raw))
+        # Keyword scan is precomputed into description_features at ingest
+        return DescriptionFeatureService.is_medical(DescriptionFeatureService.for_pet(pet))
 
     @staticmethod
-    def classify(pet: Pet) -> dict:
+    def classify(pet: Pet, now=None) -> dict:
         """
         Returns dict of RiskClassification boolean fields (excluding notes).
         """
         return {
-            "is_long_stay": RiskBackfillService._is_long_stay(pet),
+            "is_long_stay": RiskBackfillService._is_long_stay(pet, now),
             "is_senior": RiskBackfillService._is_senior(pet),
             "is_medical": RiskBackfillService._is_medical(pet),
             # v0: keep false by default; later we can compute from breed group taxonomy
@@ -84,6 +72,8 @@ class RiskBackfillService:
             pet=pet,
             defaults=flags,
         )
+        # Keep the precomputed feed score in step with the flags
+        VisibilityScoreService.refresh_for_pet(pet, obj)
         return obj, created
 
     @staticmethod
@@ -98,6 +88,64 @@ class RiskBackfillService:
             count += 1
         return count
 
+    @staticmethod
+    def classify_pets(pets: Iterable[Pet], now=None) -> int:
+        """
+        Batch upsert_for_pet without the score refresh: one INSERT .. ON CONFLICT
+        for all given pets (notes are left alone). Callers refresh VisibilityScore
+        afterwards (ingest does it for touched pets anyway).
+        Returns count written.
+        """
+        now = now or timezone.now()
+        # One row per pet (ON CONFLICT can't touch the same row twice)
+        pets = list({p.pet_id: p for p in pets if p is not None}.values())
+        if not pets:
+            return 0
+
+        RiskClassification.objects.bulk_create(
+            [RiskClassification(pet_id=p.pet_id, **RiskBackfillService.classify(p, now)) for p in pets],
+            update_conflicts=True,
+            unique_fields=["pet"],
+            update_fields=RiskBackfillService._FLAG_FIELDS + ["updated_at"],
+        )
+        return len(pets)
+
+    @staticmethod
+    def refresh_long_stay(since=None, now=None, batch_size: int = 1000) -> int:
+        """
+        Time-driven part of the flags: ACTIVE pets that crossed LONG_STAY_DAYS
+        and aren't flagged yet. With `since` (last refresh) only the listed_at
+        window that crossed the boundary in between is scanned (listed_at index).
+        Unchanged pets are otherwise never reclassified, so this replaces the
+        full rescan after each sync.
+        Returns count reclassified.
+        """
+        now = now or timezone.now()
+        long_stay = timedelta(days=RiskBackfillService.LONG_STAY_DAYS)
+
+        qs = Pet.objects.filter(status=Pet.Status.ACTIVE, listed_at__lte=now - long_stay)
+        if since is not None:
+            qs = qs.filter(listed_at__gt=since - long_stay)
+        # Missing risk rows are included (LEFT JOIN)
+        qs = qs.exclude(risk__is_long_stay=True)
+
+        count = 0
+        batch: List[Pet] = []
+        for pet in qs.iterator(chunk_size=batch_size):
+            batch.append(pet)
+            if len(batch) >= batch_size:
+                count += RiskBackfillService._reclassify(batch, now)
+                batch = []
+        count += RiskBackfillService._reclassify(batch, now)
+        return count
+
+    @staticmethod
+    @transaction.atomic
+    def _reclassify(pets: List[Pet], now) -> int:
+        written = RiskBackfillService.classify_pets(pets, now)
+        VisibilityScoreService.refresh_for_pets(pets)
+        return written
+
     @staticmethod
     def backfill_all_active() -> int:
         qs = Pet.objects.filter(status=Pet.Status.ACTIVE)
@@ -5,7 +5,19 @@ from django.core.management import call_command
 from django.test import TestCase
 from django.utils import timezone
 
+from adoption.management.commands.backfill_org_geos import Command
 from adoption.models import Organization
+from adoption.services.geohash_service import GeohashService
+from adoption.services.zip_geo_service import ZipGeoResult
+
+CENTROIDS = {
+    "90012": ZipGeoResult(postal_code="90012", lat=34.0614, lon=-118.2383),
+    "10001": ZipGeoResult(postal_code="10001", lat=40.7506, lon=-73.9972),
+}
+
+
+def _fake_lookup(z):
+    return CENTROIDS.get(z)
 
 
 class BackfillOrgGeosCommandTests(TestCase):
@@ -48,4 +60,101 @@ class BackfillOrgGeosCommandTests(TestCase):
         self.assertIsNone(self.org.latitude)
         self.assertIsNone(self.org.longitude)
         self.assertEqual(self.org.geo_source, "")
-        self.assertIsNone(self.org.geo_updated_at)
\ No newline at end of file
+        self.assertIsNone(self.org.geo_updated_at)
+
+    @patch("adoption.management.commands.backfill_org_geos.ZipGeoService.lookup", side_effect=_fake_lookup)
+    def test_keyset_batches_one_write_per_page(self, _mock_lookup):
+        for i in range(6):
+            Organization.objects.create(source="TEST", source_org_id=f"b{i}", name=f"B{i}", postal_code="10001")
+        Organization.objects.create(source="TEST", source_org_id="nomatch", name="NoMatch", postal_code="99999")
+
+        out = io.StringIO()
+        # 8 eligible orgs (incl. setUp's) in pages of 3: per page one SELECT and one
+        # UPDATE (wrapped in a savepoint pair inside the test transaction), then one
+        # org geo version bump in the shared cache (read, cull count, savepoint'd insert)
+        with self.assertNumQueries(3 * (1 + 3) + 6):
+            call_command("backfill_org_geos", "--batch-size", "3", stdout=out)
+
+        self.assertIn("batches=3", out.getvalue())
+        self.assertIn("updated=7", out.getvalue())
+        self.assertIn("skipped_no_match=1", out.getvalue())
+        org = Organization.objects.get(source_org_id="b0")
+        self.assertEqual(org.geo_source, "ZIP")
+        self.assertEqual(org.geohash, GeohashService.encode(org.latitude, org.longitude))
+
+    @patch("adoption.management.commands.backfill_org_geos.ZipGeoService.lookup", side_effect=_fake_lookup)
+    def test_limit_caps_scanned_orgs(self, _mock_lookup):
+        for i in range(4):
+            Organization.objects.create(source="TEST", source_org_id=f"b{i}", name=f"B{i}", postal_code="10001")
+
+        call_command("backfill_org_geos", "--limit", "3", "--batch-size", "2", stdout=io.StringIO())
+
+        self.assertEqual(Organization.objects.filter(latitude__isnull=True).count(), 2)
+
+    @patch("adoption.management.commands.backfill_org_geos.OrgDistanceCacheService.invalidate")
+    @patch("adoption.management.commands.backfill_org_geos.ZipGeoService.lookup", side_effect=_fake_lookup)
+    def test_refresh_regeocodes_moved_zip_orgs_only(self, _mock_lookup, mock_invalidate):
+        now = timezone.now()
+        # Geocoded from 90012, postal code since changed to 10001
+        moved = Organization.objects.create(
+            source="TEST", source_org_id="moved", name="Moved", postal_code="10001",
+            latitude=34.0614, longitude=-118.2383, geo_source="ZIP", geo_updated_at=now,
+        )
+        current = Organization.objects.create(
+            source="TEST", source_org_id="current", name="Current", postal_code="90012",
+            latitude=34.0614, longitude=-118.2383, geo_source="ZIP", geo_updated_at=now,
+        )
+        manual = Organization.objects.create(
+            source="TEST", source_org_id="manual", name="Manual", postal_code="10001",
+            latitude=34.0, longitude=-118.0, geo_source="MANUAL", geo_updated_at=now,
+        )
+
+        # Without --refresh only missing coordinates are filled
+        call_command("backfill_org_geos", stdout=io.StringIO())
+        moved.refresh_from_db()
+        self.assertAlmostEqual(float(moved.latitude), 34.0614, places=4)
+
+        mock_invalidate.reset_mock()
+        out = io.StringIO()
+        call_command("backfill_org_geos", "--refresh", stdout=out)
+
+        moved.refresh_from_db()
+        current.refresh_from_db()
+        manual.refresh_from_db()
+        self.assertAlmostEqual(float(moved.latitude), 40.7506, places=4)
+        self.assertEqual(moved.geohash, GeohashService.encode(moved.latitude, moved.longitude))
+        self.assertEqual(current.geo_updated_at, now)
+        self.assertAlmostEqual(float(manual.latitude), 34.0, places=4)
+        self.assertIn("unchanged=2", out.getvalue())
+        mock_invalidate.assert_called_once()
+
+    @patch("adoption.management.commands.backfill_org_geos.ZipGeoService.lookup")
+    def test_refresh_ignores_float32_centroid_drift(self, mock_lookup):
+        now = timezone.now()
+        org = Organization.objects.create(
+            source="TEST", source_org_id="drift", name="Drift", postal_code="90012",
+            latitude=34.0614, longitude=-118.2383, geo_source="ZIP", geo_updated_at=now,
+        )
+        # float32 round trip of the CSV centroid: differs at the 6th decimal
+        mock_lookup.return_value = ZipGeoResult(postal_code="90012", lat=34.061398, lon=-118.238297)
+
+        out = io.StringIO()
+        call_command("backfill_org_geos", "--refresh", stdout=out)
+
+        org.refresh_from_db()
+        self.assertEqual(org.geo_updated_at, now)
+        self.assertIn("unchanged=1", out.getvalue())
+
+    @patch("adoption.management.commands.backfill_org_geos.ZipGeoService.lookup", side_effect=_fake_lookup)
+    def test_org_deleted_mid_run_is_not_recreated(self, _mock_lookup):
+        real_geocode_page = Command._geocode_page
+
+        def geocode_then_delete(page, now, stats):
+            changed = real_geocode_page(page, now, stats)
+            Organization.objects.filter(pk=self.org.pk).delete()
+            return changed
+
+        with patch.object(Command, "_geocode_page", staticmethod(geocode_then_delete)):
+            call_command("backfill_org_geos", stdout=io.StringIO())
+
+        self.assertFalse(Organization.objects.filter(source_org_id="org1").exists())
@@ -0,0 +1,126 @@
+from django.contrib import admin
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from adoption.models import Organization, Pet, AdopterProfile, VisibilityScore
+from adoption.services.description_feature_service import (
+    DescriptionFeatureService,
+    FEATURE_ACTIVE,
+    FEATURE_ENERGETIC,
+    FEATURE_GENTLE,
+    FEATURE_EASY,
+    FEATURE_MEDICAL,
+)
+from adoption.services.ingestion_service import IngestionService
+from adoption.services.pet_enrichment_service import PetEnrichmentService
+from adoption.services.ranking_service import RankingService
+from adoption.services.risk_backfill_service import RiskBackfillService
+
+
+class DescriptionFeatureComputeTests(SimpleTestCase):
+    def test_keywords_scan_ai_description_first(self):
+        bits = DescriptionFeatureService.compute("calm and quiet", "Energetic, gentle pup")
+        self.assertEqual(bits & (FEATURE_ENERGETIC | FEATURE_GENTLE), FEATURE_ENERGETIC | FEATURE_GENTLE)
+        self.assertFalse(bits & FEATURE_ACTIVE)
+
+    def test_keywords_fall_back_to_raw_description(self):
+        bits = DescriptionFeatureService.compute("Very active and easy going", None)
+        self.assertTrue(bits & FEATURE_ACTIVE)
+        self.assertTrue(bits & FEATURE_EASY)
+
+    def test_medical_scans_both_texts(self):
+        self.assertTrue(DescriptionFeatureService.compute("Needs medication for diabetes", "Sweet pup") & FEATURE_MEDICAL)
+        self.assertTrue(DescriptionFeatureService.compute("", "Recovering from surgery") & FEATURE_MEDICAL)
+        self.assertEqual(DescriptionFeatureService.compute("", None), 0)
+
+
+class DescriptionFeatureMaintenanceTests(TestCase):
+    def setUp(self):
+        self.org_dicts = [
+            {"source": "RESCUEGROUPS", "source_org_id": "RG1", "name": "Org", "location": "LA, CA", "is_active": True}
+        ]
+
+    def _pet_dict(self, **overrides):
+        d = {
+            "source": "RESCUEGROUPS",
+            "external_id": "P1",
+            "organization_source_org_id": "RG1",
+            "name": "Bella",
+            "species": "DOG",
+            "raw_description": "An energetic pup recovering from surgery.",
+            "ai_description": "An energetic pup.",
+            "listed_at": timezone.now(),
+            "status": "ACTIVE",
+        }
+        d.update(overrides)
+        return d
+
+    def test_ingest_stores_features(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self._pet_dict()])
+        pet = Pet.objects.get(external_id="P1")
+        self.assertTrue(pet.description_features & FEATURE_ENERGETIC)
+        self.assertTrue(pet.description_features & FEATURE_MEDICAL)
+
+    def test_reingest_recomputes_when_description_changes(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self._pet_dict()])
+        IngestionService.ingest_canonical(
+            self.org_dicts,
+            [self._pet_dict(raw_description="Calm senior.", ai_description="A gentle pup.")],
+        )
+        pet = Pet.objects.get(external_id="P1")
+        self.assertEqual(pet.description_features, FEATURE_GENTLE)
+
+    def test_enrichment_updates_features(self):
+        org = Organization.objects.create(source="TEST", source_org_id="O1", name="Org", location="LA")
+        pet = Pet.objects.create(
+            source="TEST",
+            external_id="e1",
+            organization=org,
+            name="Enrich",
+            raw_description="Playful and energetic dog.",
+            ai_description="",
+            description_features=0,
+        )
+
+        PetEnrichmentService.enrich_missing_ai_descriptions([pet])
+
+        pet.refresh_from_db()
+        self.assertTrue(pet.ai_description)
+        self.assertTrue(DescriptionFeatureService.is_active(pet.description_features))
+
+    def test_readers_use_stored_bits_without_text(self):
+        org = Organization.objects.create(source="TEST", source_org_id="O1", name="Org", location="LA")
+        pet = Pet.objects.create(
+            source="TEST",
+            external_id="b1",
+            organization=org,
+            name="Bits",
+            listed_at=timezone.now(),
+            raw_description="",
+            ai_description="",
+            description_features=FEATURE_ACTIVE | FEATURE_MEDICAL,
+        )
+        profile = AdopterProfile(activity_level=AdopterProfile.ActivityLevel.HIGH)
+
+        _, reasons = RankingService.score_pet(pet, profile=profile)
+        self.assertIn("PROFILE_ACTIVITY_MATCH", reasons)
+        self.assertTrue(RiskBackfillService.classify(pet)["is_medical"])
+
+    def test_admin_edit_recomputes_features(self):
+        org = Organization.objects.create(source="TEST", source_org_id="O1", name="Org", location="LA")
+        pet = Pet.objects.create(
+            source="TEST",
+            external_id="a1",
+            organization=org,
+            name="Admin",
+            listed_at=timezone.now(),
+            ai_description="A gentle pup.",
+            description_features=FEATURE_GENTLE,
+        )
+
+        pet.ai_description = "Energetic, needs medication."
+        admin.site._registry[Pet].save_model(None, pet, None, True)
+
+        pet.refresh_from_db()
+        self.assertEqual(pet.description_features, FEATURE_ENERGETIC | FEATURE_MEDICAL)
+        self.assertTrue(VisibilityScore.objects.filter(pet=pet).exists())
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+
+from adoption.models import Interest, Organization, Pet, PetSeen
+from adoption.services.application_service import ApplicationService
+from adoption.services.feed_exclusion_service import FeedExclusionService
+from adoption.services.interest_service import InterestService
+from adoption.services.pet_seen_service import PetSeenService
+
+User = get_user_model()
+
+
+class FeedExclusionServiceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.org = Organization.objects.create(source="TEST", source_org_id="org1", name="Test Org")
+        self.pets = [
+            Pet.objects.create(source="TEST", external_id=f"p{i}", organization=self.org, name=f"Pet {i}")
+            for i in range(5)
+        ]
+
+    def test_miss_builds_from_all_three_tables_for_this_user(self):
+        Interest.objects.create(user=self.user, pet=self.pets[0])
+        PetSeen.objects.create(user=self.user, pet=self.pets[1])
+        PetSeen.objects.create(user=self.user, pet=self.pets[0])
+        PetSeen.objects.create(user=self.other, pet=self.pets[2])
+
+        ids = FeedExclusionService.pet_ids(self.user)
+
+        self.assertEqual(ids, sorted([self.pets[0].pet_id, self.pets[1].pet_id], key=lambda u: u.bytes))
+
+    def test_cached_array_is_served_until_a_decision(self):
+        PetSeen.objects.create(user=self.user, pet=self.pets[0])
+        FeedExclusionService.pet_ids(self.user)
+
+        # One shared cache read, no rebuild over the history tables
+        with self.assertNumQueries(1):
+            self.assertEqual(FeedExclusionService.pet_ids(self.user), [self.pets[0].pet_id])
+
+    def test_service_writes_invalidate_cached_array(self):
+        self.assertEqual(FeedExclusionService.pet_ids(self.user), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PetSeenService.mark_seen(self.user, self.pets[0].pet_id)
+            InterestService.create_interest(self.user, self.pets[1].pet_id)
+            ApplicationService.create_application(self.user, self.pets[2].pet_id, {})
+            PetSeenService.mark_seen(self.user, self.pets[0].pet_id)
+
+        ids = FeedExclusionService.pet_ids(self.user)
+        self.assertEqual(set(ids), {p.pet_id for p in self.pets[:3]})
+        self.assertEqual(len(ids), 3)
+
+    def test_decisions_apply_only_after_commit(self):
+        FeedExclusionService.pet_ids(self.user)
+
+        with self.captureOnCommitCallbacks(execute=False):
+            PetSeenService.mark_seen(self.user, self.pets[0].pet_id)
+
+        self.assertEqual(FeedExclusionService.pet_ids(self.user), [])
+
+    def test_interleaved_decisions_keep_every_pet(self):
+        FeedExclusionService.pet_ids(self.user)
+
+        # Two requests by the same user: both commit, their hooks run in either order
+        with self.captureOnCommitCallbacks() as first:
+            PetSeenService.mark_seen(self.user, self.pets[0].pet_id)
+        with self.captureOnCommitCallbacks() as second:
+            InterestService.create_interest(self.user, self.pets[1].pet_id)
+        for callback in second + first:
+            callback()
+
+        self.assertEqual(set(FeedExclusionService.pet_ids(self.user)), {self.pets[0].pet_id, self.pets[1].pet_id})
+
+    def test_decision_committed_during_rebuild_is_not_lost(self):
+        real_build = FeedExclusionService._build
+
+        def build_then_decision(user):
+            data = real_build(user)
+            # Another request commits a swipe after this build read the tables
+            with self.captureOnCommitCallbacks(execute=True):
+                PetSeenService.mark_seen(self.user, self.pets[0].pet_id)
+            return data
+
+        with patch.object(FeedExclusionService, "_build", side_effect=build_then_decision):
+            self.assertEqual(FeedExclusionService.pet_ids(self.user), [])
+
+        # The array stored by the racing build is tagged with the old version
+        self.assertEqual(FeedExclusionService.pet_ids(self.user), [self.pets[0].pet_id])
+
+    @override_settings(WOOFER_FEED_EXCLUSION_MAX_IDS=2)
+    def test_growing_past_max_ids_switches_to_anti_joins(self):
+        PetSeen.objects.create(user=self.user, pet=self.pets[0])
+        self.assertEqual(len(FeedExclusionService.pet_ids(self.user)), 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            PetSeenService.mark_seen(self.user, self.pets[1].pet_id)
+            PetSeenService.mark_seen(self.user, self.pets[2].pet_id)
+
+        self.assertIsNone(FeedExclusionService.pet_ids(self.user))
+
+    @override_settings(WOOFER_FEED_EXCLUSION_CACHE_ENABLED=False)
+    def test_disabled(self):
+        self.assertIsNone(FeedExclusionService.pet_ids(self.user))
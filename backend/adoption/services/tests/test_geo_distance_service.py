@@ -0,0 +1,55 @@
+import random
+import unittest
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from adoption.services import geo_distance_service
+from adoption.services.geo_distance_service import GeoDistanceService
+
+
+class GeoDistanceServiceTests(SimpleTestCase):
+    def _points(self, n, seed=3):
+        rng = random.Random(seed)
+        lats = [Decimal(f"{rng.uniform(-89, 89):.6f}") for _ in range(n)]
+        lons = [Decimal(f"{rng.uniform(-179, 179):.6f}") for _ in range(n)]
+        # Missing / junk coordinates mixed in
+        lats[::17] = [None] * len(lats[::17])
+        lons[5::23] = ["x"] * len(lons[5::23])
+        return lats, lons
+
+    def test_known_distance(self):
+        # Downtown LA -> Baltimore, ~2315 great-circle miles
+        d = GeoDistanceService.haversine_miles(34.0537, -118.2428, Decimal("39.2904"), Decimal("-76.6122"))
+        self.assertAlmostEqual(d, 2314.7, delta=0.5)
+        self.assertIsNone(GeoDistanceService.haversine_miles(34.0, -118.0, None, 1.0))
+
+    def test_python_backend_matches_scalar(self):
+        lats, lons = self._points(300)
+        batch = GeoDistanceService.distances_miles(34.05, -118.24, lats, lons, backend="python")
+        scalar = [GeoDistanceService.haversine_miles(34.05, -118.24, a, b) for a, b in zip(lats, lons)]
+        self.assertEqual(batch, scalar)
+
+    @unittest.skipIf(geo_distance_service.np is None, "numpy not installed")
+    def test_numpy_backend_matches_scalar_within_tolerance(self):
+        lats, lons = self._points(2000)
+        center = (40.7128, -74.0060)
+
+        fast = GeoDistanceService.distances_miles(*center, lats, lons, backend="numpy")
+        slow = GeoDistanceService.distances_miles(*center, lats, lons, backend="python")
+
+        self.assertEqual([d is None for d in fast], [d is None for d in slow])
+        for f, s in zip(fast, slow):
+            if s is not None:
+                self.assertAlmostEqual(f, s, delta=1e-6)
+
+    def test_within_radius_mask(self):
+        lats = [34.0537, 33.9416, 39.2904, None]
+        lons = [-118.2428, -118.4085, -76.6122, -118.0]
+        for backend in ("python", None):
+            mask, distances = GeoDistanceService.within_radius(34.0537, -118.2428, lats, lons, 25, backend=backend)
+            self.assertEqual(mask, [True, True, False, False])
+            self.assertIsNone(distances[3])
+
+    def test_empty_input(self):
+        self.assertEqual(GeoDistanceService.within_radius(0.0, 0.0, [], [], 10), ([], []))
@@ -0,0 +1,40 @@
+import random
+
+from django.test import SimpleTestCase, TestCase
+
+from adoption.models import Organization
+from adoption.services.geohash_service import GeohashService, MAX_COVER_CELLS
+
+
+class GeohashServiceTests(SimpleTestCase):
+    def test_encode_known_values(self):
+        self.assertEqual(GeohashService.encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(GeohashService.encode(34.0537, -118.2428, 5), "9q5ct")
+        self.assertEqual(GeohashService.encode(None, 1.0), "")
+
+    def test_cover_contains_every_point_of_the_box(self):
+        rng = random.Random(7)
+        for _ in range(50):
+            lat, lon = rng.uniform(-60, 60), rng.uniform(-170, 170)
+            lat_d, lon_d = rng.uniform(0.01, 3.0), rng.uniform(0.01, 3.0)
+            prefixes = GeohashService.cover(lat, lon, lat_d, lon_d)
+
+            self.assertIsNotNone(prefixes)
+            self.assertLessEqual(len(prefixes), MAX_COVER_CELLS)
+            for _ in range(20):
+                h = GeohashService.encode(lat + rng.uniform(-lat_d, lat_d), lon + rng.uniform(-lon_d, lon_d))
+                self.assertTrue(any(h.startswith(p) for p in prefixes), (lat, lon, h, prefixes))
+
+    def test_cover_gives_up_on_huge_boxes(self):
+        self.assertIsNone(GeohashService.cover(0.0, 0.0, 80.0, 170.0))
+
+
+class OrganizationGeohashTests(TestCase):
+    def test_save_keeps_geohash_in_step_with_coordinates(self):
+        org = Organization.objects.create(source="TEST", source_org_id="o1", name="Org", latitude=34.0537, longitude=-118.2428)
+        self.assertEqual(org.geohash, GeohashService.encode(34.0537, -118.2428))
+
+        org.latitude, org.longitude = 39.2904, -76.6122
+        org.save(update_fields=["latitude", "longitude"])
+        org.refresh_from_db()
+        self.assertEqual(org.geohash, GeohashService.encode(39.2904, -76.6122))
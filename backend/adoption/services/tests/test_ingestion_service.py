@@ -39,9 +39,11 @@ class IngestionServiceTests(TestCase):
 
         r2 = IngestionService.ingest_canonical(org_dicts, pet_dicts)
         self.assertEqual(r2.organizations_created, 0)
-        self.assertEqual(r2.organizations_updated, 1)
+        self.assertEqual(r2.organizations_updated, 0)
+        self.assertEqual(r2.organizations_unchanged, 1)
         self.assertEqual(r2.pets_created, 0)
-        self.assertEqual(r2.pets_updated, 1)
+        self.assertEqual(r2.pets_updated, 0)
+        self.assertEqual(r2.pets_unchanged, 1)
 
         self.assertEqual(Organization.objects.count(), 1)
         self.assertEqual(Pet.objects.count(), 1)
@@ -192,4 +194,195 @@ class IngestionAIDescriptionTests(TestCase):
 
         p = Pet.objects.get(source="RESCUEGROUPS", external_id="P1")
         self.assertEqual(p.ai_description, "Provider-supplied description.")
-        mock_generate.assert_not_called()
\ No newline at end of file
+        mock_generate.assert_not_called()
+
+class IngestionBulkTests(TestCase):
+    def _org(self, sid, **overrides):
+        d = {"source": "RESCUEGROUPS", "source_org_id": sid, "name": f"Org {sid}", "location": "LA, CA", "is_active": True}
+        d.update(overrides)
+        return d
+
+    def _pet(self, ext, org_sid="RG1", **overrides):
+        d = {
+            "source": "RESCUEGROUPS",
+            "external_id": ext,
+            "organization_source_org_id": org_sid,
+            "name": f"Pet {ext}",
+            "species": "DOG",
+            "photos": [],
+            "raw_description": "",
+            "ai_description": "A pup.",
+            "listed_at": timezone.now(),
+            "status": "ACTIVE",
+        }
+        d.update(overrides)
+        return d
+
+    def test_counts_match_row_by_row_across_chunks_and_duplicates(self):
+        org_dicts = [self._org("RG1"), self._org("RG2"), self._org("RG1", name="Renamed")]
+        pet_dicts = [
+            self._pet("P1"),
+            self._pet("P2", org_sid="RG2"),
+            self._pet("P1", name="Dup"),
+            self._pet("P3", org_sid="MISSING"),
+            {"source": "RESCUEGROUPS", "name": "NoId"},
+            self._pet("P4"),
+        ]
+
+        r = IngestionService.ingest_canonical(org_dicts, pet_dicts, batch_size=2)
+
+        self.assertEqual((r.organizations_created, r.organizations_updated), (2, 1))
+        self.assertEqual((r.pets_created, r.pets_updated, r.pets_skipped), (3, 1, 2))
+        self.assertEqual(r.pets_seen_external_ids, {"P1", "P2", "P3", "P4"})
+        self.assertEqual(Organization.objects.get(source_org_id="RG1").name, "Renamed")
+        self.assertEqual(Pet.objects.get(external_id="P1").name, "Dup")
+        self.assertEqual(Pet.objects.count(), 3)
+
+    def test_preserves_pet_identity_listed_at_and_ai_description(self):
+        original = timezone.now() - timedelta(days=60)
+        IngestionService.ingest_canonical([self._org("RG1")], [self._pet("P1", listed_at=original, ai_description="Kept.")])
+        pet_id = Pet.objects.get(external_id="P1").pet_id
+
+        with patch(
+            "adoption.services.pet_enrichment_service.PetEnrichmentService.generate_fun_neutral_summary",
+            return_value=None,
+        ):
+            IngestionService.ingest_canonical(
+                [self._org("RG1")],
+                [self._pet("P1", listed_at=timezone.now(), ai_description=None)],
+            )
+
+        p = Pet.objects.get(external_id="P1")
+        self.assertEqual(p.pet_id, pet_id)
+        self.assertEqual(p.listed_at, original)
+        self.assertEqual(p.ai_description, "Kept.")
+
+    def test_non_zip_geo_is_not_overwritten(self):
+        org = Organization.objects.create(
+            source="RESCUEGROUPS",
+            source_org_id="RG1",
+            name="Org",
+            latitude=1.5,
+            longitude=2.5,
+            geo_source="MANUAL",
+        )
+
+        IngestionService.ingest_canonical([self._org("RG1", postal_code="90012")], [])
+
+        org.refresh_from_db()
+        self.assertEqual(org.geo_source, "MANUAL")
+        self.assertEqual(float(org.latitude), 1.5)
+        self.assertEqual(org.postal_code, "90012")
+
+    def test_query_count_does_not_scale_with_pets(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        def run(n, prefix):
+            with CaptureQueriesContext(connection) as ctx:
+                IngestionService.ingest_canonical(
+                    [self._org(prefix)],
+                    [self._pet(f"{prefix}{i}", org_sid=prefix) for i in range(n)],
+                )
+            return len(ctx.captured_queries)
+
+        self.assertEqual(run(5, "a"), run(50, "b"))
+
+
+class IngestionContentHashTests(TestCase):
+    def setUp(self):
+        self.org_dicts = [
+            {"source": "RESCUEGROUPS", "source_org_id": "RG1", "name": "Org", "location": "LA, CA", "is_active": True}
+        ]
+        self.pet_dict = {
+            "source": "RESCUEGROUPS",
+            "external_id": "P1",
+            "organization_source_org_id": "RG1",
+            "name": "Bella",
+            "species": "DOG",
+            "photos": [],
+            "raw_description": "Sweet dog",
+            "listed_at": timezone.now() - timedelta(days=3),
+            "status": "ACTIVE",
+        }
+
+    def test_hash_is_key_order_independent(self):
+        reordered = dict(reversed(list(self.pet_dict.items())))
+        self.assertEqual(IngestionService.content_hash(self.pet_dict), IngestionService.content_hash(reordered))
+        self.assertNotEqual(
+            IngestionService.content_hash(self.pet_dict),
+            IngestionService.content_hash({**self.pet_dict, "name": "Other"}),
+        )
+
+    def test_unchanged_sync_does_no_writes(self):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+        before = Pet.objects.get(external_id="P1").updated_at
+
+        with CaptureQueriesContext(connection) as ctx:
+            r = IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+
+        self.assertEqual((r.pets_unchanged, r.pets_updated, r.organizations_unchanged), (1, 0, 1))
+        self.assertEqual(Pet.objects.get(external_id="P1").updated_at, before)
+        writes = [q["sql"] for q in ctx.captured_queries if q["sql"].startswith(("INSERT", "UPDATE", "DELETE"))]
+        self.assertEqual(writes, [])
+
+    def test_changed_pet_is_rewritten(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+        r = IngestionService.ingest_canonical(self.org_dicts, [{**self.pet_dict, "name": "Bella II"}])
+
+        self.assertEqual((r.pets_updated, r.pets_unchanged), (1, 0))
+        self.assertEqual(Pet.objects.get(external_id="P1").name, "Bella II")
+
+    def test_deactivated_pet_is_reactivated_even_if_unchanged(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+        Pet.objects.filter(external_id="P1").update(status="INACTIVE")
+
+        r = IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+
+        self.assertEqual((r.pets_updated, r.pets_unchanged), (1, 0))
+        self.assertEqual(Pet.objects.get(external_id="P1").status, "ACTIVE")
+
+    def test_seen_stamp_reaches_written_and_unchanged_pets(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict], seen_stamp={"sync_generation": 1})
+        before = Pet.objects.get(external_id="P1").updated_at
+
+        second = {**self.pet_dict, "external_id": "P2"}
+        r = IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict, second], seen_stamp={"sync_generation": 2})
+
+        self.assertEqual((r.pets_created, r.pets_unchanged, r.pets_seen), (1, 1, 2))
+        self.assertEqual(
+            dict(Pet.objects.values_list("external_id", "sync_generation")),
+            {"P1": 2, "P2": 2},
+        )
+        # Stamping is not a content change
+        self.assertEqual(Pet.objects.get(external_id="P1").updated_at, before)
+
+    def test_seen_stamp_reaches_stored_pet_whose_record_lost_its_org(self):
+        IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict], seen_stamp={"sync_generation": 1})
+
+        orphan = {k: v for k, v in self.pet_dict.items() if k != "organization_source_org_id"}
+        r = IngestionService.ingest_canonical([], [orphan], seen_stamp={"sync_generation": 2})
+
+        self.assertEqual((r.pets_skipped, r.pets_seen), (1, 1))
+        # Still listed, so the next FULL run must not deactivate it
+        self.assertEqual(Pet.objects.get(external_id="P1").sync_generation, 2)
+
+    def test_merged_sums_counts_without_carrying_seen_ids(self):
+        first = IngestionService.ingest_canonical(self.org_dicts, [self.pet_dict])
+        second = IngestionService.ingest_canonical(
+            self.org_dicts, [self.pet_dict, {**self.pet_dict, "external_id": "P2"}]
+        )
+
+        merged = first.merged(second)
+        self.assertEqual((merged.pets_created, merged.pets_seen), (2, 3))
+        self.assertEqual(merged.pets_seen_external_ids, set())
+
+    def test_touched_pets_are_risk_classified_in_ingest(self):
+        IngestionService.ingest_canonical(self.org_dicts, [{**self.pet_dict, "age_group": "SENIOR"}])
+
+        pet = Pet.objects.get(external_id="P1")
+        self.assertTrue(pet.risk.is_senior)
+        self.assertGreater(pet.visibility.boost_risk, 0.0)
@@ -0,0 +1,122 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from adoption.api.serializers.interests_list import InterestsListItemSerializer
+from adoption.api.serializers.pets_feed import PetFeedItemSerializer
+from adoption.models import AdopterProfile, Application, Interest, Organization, Pet, RiskClassification
+from adoption.services.application_service import ApplicationService
+from adoption.services.interest_service import InterestService
+from adoption.services.pet_feed_service import PetFeedService
+from adoption.services.ranking_service import RankingService
+
+User = get_user_model()
+
+
+class PetCardProjectionTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="u", password="pass1234")
+        self.other = User.objects.create_user(username="other", password="pass1234")
+        self.org = Organization.objects.create(
+            source="TEST",
+            source_org_id="org1",
+            name="Test Org",
+            contact_email="o@example.com",
+            location="LA",
+            postal_code="90066",
+        )
+        now = timezone.now()
+        # description_features backfilled: raw text is never needed for ranking
+        self.featured = Pet.objects.create(
+            source="TEST",
+            external_id="p1",
+            organization=self.org,
+            name="Featured",
+            size="M",
+            listed_at=now,
+            photos=["https://example.org/1.jpg"],
+            raw_description="x" * 5000,
+            ai_description="A gentle dog.",
+            temperament_tags=["friendly"],
+            description_features=0,
+        )
+        # Not backfilled yet: ranking falls back to scanning the raw text
+        self.unfeatured = Pet.objects.create(
+            source="TEST",
+            external_id="p2",
+            organization=self.org,
+            name="Unfeatured",
+            size="M",
+            listed_at=now - timezone.timedelta(hours=1),
+            raw_description="Very energetic, loves to run.",
+        )
+        self.unfeatured.description_features = None
+        self.unfeatured.save(update_fields=["description_features"])
+        RiskClassification.objects.create(pet=self.unfeatured, is_senior=True)
+
+    def test_feed_candidates_skip_text_blobs(self):
+        pets = {p.name: p for p in PetFeedService._base_queryset(self.user)}
+        featured = pets["Featured"]
+
+        self.assertIn("raw_description", featured.get_deferred_fields())
+        self.assertIn("content_hash", featured.get_deferred_fields())
+        self.assertIn("contact_email", featured.organization.get_deferred_fields())
+        self.assertIsNone(getattr(featured, "raw_description_if_unfeatured"))
+        self.assertEqual(pets["Unfeatured"].raw_description_if_unfeatured, "Very energetic, loves to run.")
+
+    def test_ranking_unfeatured_pets_needs_no_extra_queries(self):
+        profile = AdopterProfile.objects.create(
+            user=self.user,
+            activity_level=AdopterProfile.ActivityLevel.HIGH,
+        )
+        # Warm the user's exclusion array: afterwards one cache read plus the candidate
+        # fetch (scored pets, then the unscored tail since these pets have no VisibilityScore)
+        PetFeedService._rank_candidates(self.user, profile)
+        with CaptureQueriesContext(connection) as ctx:
+            ranked = PetFeedService._rank_candidates(self.user, profile)
+        self.assertEqual(len(ctx.captured_queries), 3)
+
+        reasons = {rp.pet.name: rp.reasons for rp in ranked}
+        # Same reasons as ranking the full rows
+        self.assertEqual(reasons["Unfeatured"], RankingService.score_pet(self.unfeatured, profile)[1])
+        self.assertIn("PROFILE_ACTIVITY_MATCH", reasons["Unfeatured"])
+
+    def test_feed_serializer_output_matches_full_rows(self):
+        slim = list(PetFeedService._base_queryset(self.user).order_by("name"))
+        full = list(Pet.objects.select_related("organization", "risk", "visibility").order_by("name"))
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = PetFeedItemSerializer(slim, many=True).data
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(data, PetFeedItemSerializer(full, many=True).data)
+
+    def test_interest_list_serializes_without_deferred_loads(self):
+        Interest.objects.create(user=self.user, pet=self.featured)
+        Interest.objects.create(user=self.other, pet=self.unfeatured)
+
+        interests = list(InterestService.list_interests(self.user))
+        self.assertEqual(len(interests), 1)
+        self.assertIn("raw_description", interests[0].pet.get_deferred_fields())
+
+        with CaptureQueriesContext(connection) as ctx:
+            data = InterestsListItemSerializer(interests, many=True).data
+        self.assertEqual(len(ctx.captured_queries), 0)
+        self.assertEqual(data[0]["pet"]["ai_description"], "A gentle dog.")
+        self.assertEqual(data[0]["pet"]["organization"]["location"], "LA")
+
+    def test_application_list_skips_payload_and_pet_text(self):
+        Application.objects.create(
+            user=self.user,
+            pet=self.featured,
+            organization=self.org,
+            payload={"notes": "n" * 1000},
+            handoff_payload={"version": "v1"},
+        )
+        app = ApplicationService.list_applications(self.user).get()
+
+        self.assertIn("payload", app.get_deferred_fields())
+        self.assertIn("profile_snapshot", app.get_deferred_fields())
+        self.assertIn("raw_description", app.pet.get_deferred_fields())
+        self.assertEqual(app.handoff_payload, {"version": "v1"})
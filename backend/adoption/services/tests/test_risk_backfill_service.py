@@ -95,3 +95,58 @@ class RiskBackfillServiceTests(TestCase):
         self.assertFalse(created2)
         self.assertEqual(rc1.pet_id, rc2.pet_id)
         self.assertEqual(RiskClassification.objects.filter(pet=pet).count(), 1)
+
+
+class RiskIncrementalTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(source="TEST", source_org_id="org1", name="Org")
+        self.now = timezone.now()
+
+    def _pet(self, ext, days_listed, **overrides):
+        return Pet.objects.create(
+            source="TEST",
+            external_id=ext,
+            organization=self.org,
+            name=ext,
+            species=Pet.Species.DOG,
+            status=overrides.pop("status", Pet.Status.ACTIVE),
+            listed_at=self.now - timezone.timedelta(days=days_listed),
+            **overrides,
+        )
+
+    def test_classify_pets_matches_upsert_and_keeps_notes(self):
+        pets = [self._pet("a", 30), self._pet("b", 1, age_group="SENIOR")]
+        RiskClassification.objects.create(pet=pets[0], notes="keep me")
+
+        self.assertEqual(RiskBackfillService.classify_pets(pets), 2)
+
+        a, b = RiskClassification.objects.get(pet=pets[0]), RiskClassification.objects.get(pet=pets[1])
+        self.assertTrue(a.is_long_stay)
+        self.assertEqual(a.notes, "keep me")
+        self.assertEqual((b.is_long_stay, b.is_senior), (False, True))
+
+    def test_refresh_long_stay_only_touches_pets_crossing_the_boundary(self):
+        days = RiskBackfillService.LONG_STAY_DAYS
+        crossed = self._pet("crossed", days + 0.5)
+        fresh = self._pet("fresh", days - 1)
+        old = self._pet("old", days + 30)
+        inactive = self._pet("inactive", days + 0.5, status=Pet.Status.INACTIVE)
+        RiskBackfillService.classify_pets([crossed, fresh, old], now=self.now - timezone.timedelta(days=1))
+        self.assertFalse(RiskClassification.objects.get(pet=crossed).is_long_stay)
+
+        count = RiskBackfillService.refresh_long_stay(since=self.now - timezone.timedelta(days=1), now=self.now)
+
+        self.assertEqual(count, 1)
+        self.assertTrue(RiskClassification.objects.get(pet=crossed).is_long_stay)
+        self.assertFalse(RiskClassification.objects.get(pet=fresh).is_long_stay)
+        self.assertFalse(RiskClassification.objects.filter(pet=inactive).exists())
+        # Score follows the new flag
+        self.assertGreater(crossed.visibility.boost_long_stay, 0.0)
+
+    def test_refresh_long_stay_without_since_fills_missing_rows(self):
+        old = self._pet("old", RiskBackfillService.LONG_STAY_DAYS + 30)
+
+        self.assertEqual(RiskBackfillService.refresh_long_stay(now=self.now), 1)
+        self.assertTrue(RiskClassification.objects.get(pet=old).is_long_stay)
+        # Already flagged pets are not rewritten
+        self.assertEqual(RiskBackfillService.refresh_long_stay(now=self.now), 0)
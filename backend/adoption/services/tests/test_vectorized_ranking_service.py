@@ -0,0 +1,95 @@
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from django.test import SimpleTestCase, override_settings
+
+from adoption.models import Organization, Pet, AdopterProfile, RiskClassification, VisibilityScore
+from adoption.services.ranking_service import RankingService
+from adoption.services.vectorized_ranking_service import VectorizedRankingService
+
+
+_DESCRIPTIONS = [
+    "",
+    "An active pup",
+    "Energetic and gentle",
+    "Easy going couch buddy",
+    "Quiet and shy",
+    None,
+]
+
+
+def _synthetic_pets(n: int, seed: int):
+    """
+    Unsaved pets with risk/visibility caches pre-populated (like select_related),
+    so ranking never touches the DB.
+    """
+    rnd = random.Random(seed)
+    org = Organization(source="TEST", source_org_id="O1", name="Org")
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    pets = []
+
+    for i in range(n):
+        # Few distinct timestamps so many score ties exercise the pet_id tie-break
+        listed_at = None if rnd.random() < 0.05 else base - timedelta(hours=rnd.randint(0, 20))
+        pet = Pet(
+            source="TEST",
+            external_id=f"p{i}",
+            organization=org,
+            name=f"Pet {i}",
+            listed_at=listed_at,
+            size=rnd.choice([None, "S", "M", "L", "XL"]),
+            ai_description=rnd.choice(_DESCRIPTIONS),
+            raw_description=rnd.choice(_DESCRIPTIONS),
+        )
+
+        risk = None
+        if rnd.random() < 0.5:
+            risk = RiskClassification(
+                pet=pet,
+                is_long_stay=rnd.random() < 0.4,
+                is_senior=rnd.random() < 0.3,
+                is_medical=rnd.random() < 0.3,
+                is_overlooked_breed_group=rnd.random() < 0.2,
+                recently_returned=rnd.random() < 0.2,
+            )
+        pet._state.fields_cache["risk"] = risk
+
+        visibility = None
+        if rnd.random() < 0.3:
+            visibility = VisibilityScore(pet=pet, **RankingService.compute_base_score(pet, risk))
+        pet._state.fields_cache["visibility"] = visibility
+
+        pets.append(pet)
+    return pets
+
+
+def _profiles():
+    yield None
+    for home in (AdopterProfile.HomeType.APARTMENT, AdopterProfile.HomeType.HOUSE):
+        for activity in (AdopterProfile.ActivityLevel.HIGH, AdopterProfile.ActivityLevel.LOW):
+            for experience in (AdopterProfile.ExperienceLevel.NEW, AdopterProfile.ExperienceLevel.EXPERIENCED):
+                yield AdopterProfile(home_type=home, activity_level=activity, experience_level=experience)
+
+
+@unittest.skipUnless(VectorizedRankingService.is_available(), "numpy not installed")
+class VectorizedRankingDifferentialTests(SimpleTestCase):
+    def _as_tuples(self, ranked):
+        return [(str(rp.pet.pet_id), rp.score, rp.reasons) for rp in ranked]
+
+    def test_identical_to_python_ranker(self):
+        for seed in range(5):
+            pets = _synthetic_pets(400, seed=seed)
+            for profile in _profiles():
+                expected = RankingService.rank_python(pets, profile=profile)
+                actual = VectorizedRankingService.rank(pets, profile=profile)
+                self.assertEqual(self._as_tuples(actual), self._as_tuples(expected))
+
+    def test_empty_input(self):
+        self.assertEqual(VectorizedRankingService.rank([]), [])
+
+    @override_settings(WOOFER_RANKING_BACKEND="numpy")
+    def test_rank_dispatches_to_numpy_backend(self):
+        pets = _synthetic_pets(50, seed=42)
+        expected = RankingService.rank_python(pets)
+        self.assertEqual(self._as_tuples(RankingService.rank(pets)), self._as_tuples(expected))
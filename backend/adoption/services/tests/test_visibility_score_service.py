@@ -0,0 +1,117 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth import get_user_model
+
+from adoption.models import Organization, Pet, RiskClassification, VisibilityScore
+from adoption.services.ingestion_service import IngestionService
+from adoption.services.pet_feed_service import PetFeedService
+from adoption.services.ranking_service import RankingService, MAX_TOTAL_BOOST
+from adoption.services.risk_backfill_service import RiskBackfillService
+from adoption.services.visibility_score_service import VisibilityScoreService
+
+
+class VisibilityScoreServiceTests(TestCase):
+    def setUp(self):
+        self.org = Organization.objects.create(
+            source="TEST",
+            source_org_id="org1",
+            name="Org",
+            contact_email="o@example.com",
+            location="LA",
+            is_active=True,
+        )
+
+    def _make_pet(self, external_id: str, listed_at=None) -> Pet:
+        return Pet.objects.create(
+            source="TEST",
+            external_id=external_id,
+            organization=self.org,
+            name=external_id,
+            species=Pet.Species.DOG,
+            status=Pet.Status.ACTIVE,
+            listed_at=listed_at or timezone.now(),
+            photos=[],
+            raw_description="",
+            temperament_tags=[],
+        )
+
+    def test_refresh_matches_on_the_fly_score(self):
+        pet = self._make_pet("p1")
+        RiskClassification.objects.create(pet=pet, is_long_stay=True, is_senior=True, is_medical=True)
+        expected, _ = RankingService.score_pet(Pet.objects.get(pk=pet.pk))
+
+        VisibilityScoreService.refresh_for_pets([pet])
+
+        vs = VisibilityScore.objects.get(pet=pet)
+        self.assertAlmostEqual(vs.final_score, expected, places=9)
+        self.assertAlmostEqual(vs.final_score - vs.base_score, MAX_TOTAL_BOOST, places=9)
+        self.assertAlmostEqual(vs.boost_long_stay, 0.30, places=9)
+
+    def test_refresh_is_idempotent_upsert(self):
+        pet = self._make_pet("p1")
+        VisibilityScoreService.refresh_for_pets([pet, pet])
+        VisibilityScoreService.refresh_for_pets([pet])
+        self.assertEqual(VisibilityScore.objects.filter(pet=pet).count(), 1)
+
+    def test_risk_backfill_refreshes_score(self):
+        old = timezone.now() - timezone.timedelta(days=30)
+        pet = self._make_pet("p1", listed_at=old)
+        VisibilityScoreService.refresh_for_pets([pet])
+        before = VisibilityScore.objects.get(pet=pet).final_score
+
+        RiskBackfillService.upsert_for_pet(pet)
+
+        vs = VisibilityScore.objects.get(pet=pet)
+        self.assertGreater(vs.final_score, before)
+        self.assertGreater(vs.boost_long_stay, 0.0)
+
+    def test_ingest_writes_scores_for_touched_pets(self):
+        IngestionService.ingest_canonical(
+            [{"source": "RESCUEGROUPS", "source_org_id": "RG1", "name": "Org", "location": "LA, CA", "is_active": True}],
+            [{
+                "source": "RESCUEGROUPS",
+                "external_id": "P1",
+                "organization_source_org_id": "RG1",
+                "name": "Bella",
+                "species": "DOG",
+                "listed_at": timezone.now(),
+                "status": "ACTIVE",
+            }],
+        )
+        pet = Pet.objects.get(source="RESCUEGROUPS", external_id="P1")
+        self.assertTrue(VisibilityScore.objects.filter(pet=pet).exists())
+
+    def test_feed_orders_candidates_by_stored_final_score(self):
+        user = get_user_model().objects.create_user(username="u", password="pass1234")
+        now = timezone.now()
+        newer = self._make_pet("newer", listed_at=now)
+        older = self._make_pet("older", listed_at=now - timezone.timedelta(hours=6))
+        RiskClassification.objects.create(pet=older, is_long_stay=True)
+        VisibilityScoreService.refresh_for_pets([newer, older])
+
+        pets, _ = PetFeedService.get_feed(user=user, cursor=None, limit=10)
+
+        self.assertEqual([p.pet_id for p in pets], [older.pet_id, newer.pet_id])
+
+    def test_backfill_missing_scores_pets_created_outside_ingestion(self):
+        scored = self._make_pet("scored")
+        VisibilityScoreService.refresh_for_pets([scored])
+        stored = VisibilityScore.objects.get(pet=scored).computed_at
+        unscored = [self._make_pet(f"p{i}") for i in range(5)]
+        RiskClassification.objects.create(pet=unscored[0], is_senior=True)
+
+        written = VisibilityScoreService.backfill_missing(batch_size=2)
+
+        self.assertEqual(written, 5)
+        self.assertEqual(VisibilityScore.objects.get(pet=scored).computed_at, stored)
+        self.assertEqual(VisibilityScore.objects.filter(pet__in=unscored).count(), 5)
+        expected, _ = RankingService.score_pet(Pet.objects.get(pk=unscored[0].pk))
+        self.assertAlmostEqual(VisibilityScore.objects.get(pet=unscored[0]).final_score, expected, places=9)
+        self.assertEqual(VisibilityScoreService.backfill_missing(), 0)
+
+    def test_seed_demo_pets_get_scores(self):
+        call_command("seed_demo", stdout=StringIO())
+        self.assertFalse(Pet.objects.filter(source="DEMO", visibility__isnull=True).exists())
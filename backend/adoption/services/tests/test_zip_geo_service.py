@@ -6,7 +6,7 @@ from pathlib import Path
 
 from django.test import TestCase, override_settings
 
-from adoption.services.zip_geo_service import ZipGeoService
+from adoption.services.zip_geo_service import ZipGeoService, pack_zip_centroids, _MappedZipCentroids
 
 
 class ZipGeoServiceTests(TestCase):
@@ -91,4 +91,124 @@ class ZipGeoServiceTests(TestCase):
 
             # triggers load
             _ = ZipGeoService.lookup("90066")
-            self.assertEqual(ZipGeoService.count_loaded(), 2)
\ No newline at end of file
+            self.assertEqual(ZipGeoService.count_loaded(), 2)
+
+    def _write_bin(self, base_dir: str, rows) -> None:
+        path = Path(base_dir) / "adoption" / "data" / "us_zip_centroids.bin"
+        path.write_bytes(pack_zip_centroids(rows))
+
+    def test_binary_store_is_preferred_over_csv(self):
+        base_dir = self._make_base_dir_with_csv(
+            "zip,lat,lon\n"
+            "90066,1.0,2.0\n"
+        )
+        self._write_bin(base_dir, [("90066", 33.9897, -118.4487), ("00601", 18.180555, -66.749961)])
+
+        with override_settings(BASE_DIR=Path(base_dir)):
+            ZipGeoService.reset_cache_for_tests()
+
+            res = ZipGeoService.lookup("90066")
+            self.assertAlmostEqual(res.lat, 33.9897, places=4)
+            self.assertAlmostEqual(res.lon, -118.4487, places=4)
+            self.assertEqual(ZipGeoService.lookup("00601").postal_code, "00601")
+            self.assertIsInstance(ZipGeoService._cache, _MappedZipCentroids)
+            self.assertEqual(ZipGeoService.count_loaded(), 2)
+
+    def test_binary_lookup_binary_searches_unsorted_input(self):
+        rows = [(f"{z:05d}", z / 1000.0, -z / 1000.0) for z in range(99999, 0, -997)]
+        base_dir = self._make_base_dir_with_csv("zip,lat,lon\n")
+        self._write_bin(base_dir, rows)
+
+        with override_settings(BASE_DIR=Path(base_dir)):
+            ZipGeoService.reset_cache_for_tests()
+
+            for z, lat, lon in rows:
+                res = ZipGeoService.lookup(z)
+                self.assertIsNotNone(res, z)
+                self.assertAlmostEqual(res.lat, lat, places=4)
+                self.assertAlmostEqual(res.lon, lon, places=4)
+            self.assertIsNone(ZipGeoService.lookup("00000"))
+            self.assertIsNone(ZipGeoService.lookup("99998"))
+
+    def test_invalid_binary_falls_back_to_csv(self):
+        base_dir = self._make_base_dir_with_csv(
+            "zip,lat,lon\n"
+            "90066,33.9897,-118.4487\n"
+        )
+        # Truncated: header claims two records
+        data = pack_zip_centroids([("90066", 1.0, 2.0), ("90012", 3.0, 4.0)])
+        (Path(base_dir) / "adoption" / "data" / "us_zip_centroids.bin").write_bytes(data[:-4])
+
+        with override_settings(BASE_DIR=Path(base_dir)):
+            ZipGeoService.reset_cache_for_tests()
+
+            res = ZipGeoService.lookup("90066")
+            self.assertAlmostEqual(res.lat, 33.9897, places=4)
+            self.assertIsInstance(ZipGeoService._cache, dict)
+
+    def test_shipped_binary_matches_csv(self):
+        ZipGeoService.reset_cache_for_tests()
+        csv_rows = ZipGeoService._load_csv()
+        mapped = ZipGeoService._load_binary()
+
+        self.assertIsNotNone(mapped, "run scripts/build_zip_centroids.py --bin-from-csv to rebuild")
+        self.assertEqual(len(mapped), len(csv_rows))
+        for z in list(csv_rows)[::500]:
+            lat, lon = mapped.get(z)
+            self.assertAlmostEqual(lat, csv_rows[z][0], places=4)
+            self.assertAlmostEqual(lon, csv_rows[z][1], places=4)
+
+
+class ZipGeoSpatialTests(TestCase):
+    def setUp(self):
+        ZipGeoService.reset_cache_for_tests()
+        self.addCleanup(ZipGeoService.reset_cache_for_tests)
+
+        td = tempfile.TemporaryDirectory()
+        self.addCleanup(td.cleanup)
+        data_dir = Path(td.name) / "adoption" / "data"
+        data_dir.mkdir(parents=True)
+        (data_dir / "us_zip_centroids.csv").write_text(
+            "zip,lat,lon\n"
+            "90012,34.0614,-118.2383\n"   # Downtown LA
+            "90066,33.9897,-118.4487\n"   # Mar Vista, ~12mi
+            "90095,34.0689,-118.4452\n"   # Westwood, ~12mi
+            "92101,32.7190,-117.1627\n"   # San Diego, ~111mi
+            "10001,40.7506,-73.9972\n",   # New York
+            encoding="utf-8",
+        )
+        settings_cm = override_settings(BASE_DIR=Path(td.name))
+        settings_cm.enable()
+        self.addCleanup(settings_cm.disable)
+
+    def test_nearest_known_zip_stays_in_prefix(self):
+        self.assertEqual(ZipGeoService.nearest_known_zip("90012"), "90012")
+        self.assertEqual(ZipGeoService.nearest_known_zip("90070"), "90066")
+        self.assertEqual(ZipGeoService.nearest_known_zip("90099-1234"), "90095")
+        # 92101 is numerically closer to 91999 but a different prefix
+        self.assertIsNone(ZipGeoService.nearest_known_zip("91999"))
+        self.assertIsNone(ZipGeoService.nearest_known_zip("abc"))
+
+    def test_resolve_falls_back_to_nearest_known_zip(self):
+        res = ZipGeoService.resolve("90099")
+        self.assertEqual(res.postal_code, "90095")
+        self.assertEqual(ZipGeoService.resolve("90012").postal_code, "90012")
+        self.assertIsNone(ZipGeoService.resolve("55555"))
+
+    def test_nearest_coordinate(self):
+        self.assertEqual(ZipGeoService.nearest(34.05, -118.24).postal_code, "90012")
+        self.assertEqual(ZipGeoService.nearest(33.0, -117.0).postal_code, "92101")
+        # Far from everything: still found by widening the ring search
+        self.assertEqual(ZipGeoService.nearest(45.0, -80.0).postal_code, "10001")
+
+    def test_zips_within_radius_sorted_by_distance(self):
+        hits = ZipGeoService.zips_within_radius(34.0614, -118.2383, 15)
+        self.assertEqual([z for z, _ in hits][0], "90012")
+        self.assertEqual({z for z, _ in hits}, {"90012", "90066", "90095"})
+        self.assertEqual([d for _, d in hits], sorted(d for _, d in hits))
+
+        self.assertEqual(
+            {z for z, _ in ZipGeoService.zips_within_radius(34.0614, -118.2383, 150)},
+            {"90012", "90066", "90095", "92101"},
+        )
+        self.assertEqual(ZipGeoService.zips_within_radius(0.0, 0.0, 100), [])
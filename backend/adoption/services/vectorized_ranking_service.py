@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from datetime import timezone
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency, RankingService falls back to the python backend
+    np = None
+
+from adoption.models import Pet, AdopterProfile
+from adoption.services.ranking_service import (
+    RankedPet,
+    RankingService,
+    BOOST_LONG_STAY,
+    BOOST_SENIOR,
+    BOOST_MEDICAL,
+    BOOST_OVERLOOKED,
+    BOOST_RETURNED,
+    BOOST_PROFILE_ACTIVITY_MATCH,
+    BOOST_PROFILE_HOME_MATCH,
+    BOOST_PROFILE_EXPERIENCE_MATCH,
+    MAX_TOTAL_BOOST,
+)
+
+
+# Risk flag bits (same order as RankingService.risk_reasons)
+RISK_LONG_STAY = 1 << 0
+RISK_SENIOR = 1 << 1
+RISK_MEDICAL = 1 << 2
+RISK_OVERLOOKED = 1 << 3
+RISK_RETURNED = 1 << 4
+
+# Profile match bits (same order as RankingService._profile_boost)
+MATCH_ACTIVITY = 1 << 0
+MATCH_HOME = 1 << 1
+MATCH_EXPERIENCE = 1 << 2
+
+_RISK_REASON_BITS = [
+    (RISK_LONG_STAY, "LONG_STAY_BOOST"),
+    (RISK_SENIOR, "SENIOR_BOOST"),
+    (RISK_MEDICAL, "MEDICAL_BOOST"),
+    (RISK_OVERLOOKED, "OVERLOOKED_GROUP_BOOST"),
+    (RISK_RETURNED, "RECENTLY_RETURNED_BOOST"),
+]
+_PROFILE_REASON_BITS = [
+    (MATCH_ACTIVITY, "PROFILE_ACTIVITY_MATCH"),
+    (MATCH_HOME, "PROFILE_HOME_MATCH"),
+    (MATCH_EXPERIENCE, "PROFILE_EXPERIENCE_MATCH"),
+]
+
+
+def _reason_table(bits) -> List[Tuple[str, ...]]:
+    size = 1 << len(bits)
+    return [tuple(name for bit, name in bits if mask & bit) for mask in range(size)]
+
+
+# mask -> reasons, so building reasons is one lookup per pet
+_RISK_REASONS = _reason_table(_RISK_REASON_BITS)
+_PROFILE_REASONS = _reason_table(_PROFILE_REASON_BITS)
+
+
+def _risk_bits(risk) -> int:
+    if not risk:
+        return 0
+    bits = 0
+    if risk.is_long_stay:
+        bits |= RISK_LONG_STAY
+    if risk.is_senior:
+        bits |= RISK_SENIOR
+    if risk.is_medical:
+        bits |= RISK_MEDICAL
+    if risk.is_overlooked_breed_group:
+        bits |= RISK_OVERLOOKED
+    if risk.recently_returned:
+        bits |= RISK_RETURNED
+    return bits
+
+
+class VectorizedRankingService:
+    """
+    Columnar (NumPy) backend for RankingService.rank.
+
+    Packs candidates into arrays once, then computes recency, risk boosts,
+    the MAX_TOTAL_BOOST cap and profile boosts in single array passes.
+    Additions happen in the same order as RankingService.score_pet so scores
+    (and therefore ordering) are bit-for-bit identical.
+    """
+
+    @staticmethod
+    def is_available() -> bool:
+        return np is not None
+
+    @staticmethod
+    def _pack(pets: List[Pet]):
+        epoch: List[float] = []
+        has_listed: List[bool] = []
+        stored: List[float] = []
+        has_stored: List[bool] = []
+        risk: List[int] = []
+        small_or_medium: List[bool] = []
+        kw_active: List[bool] = []
+        kw_gentle: List[bool] = []
+        id_hi: List[int] = []
+        id_lo: List[int] = []
+
+        for pet in pets:
+            # str(uuid) order == 128-bit int order, split for lexsort
+            pid = pet.pet_id.int
+            id_hi.append(pid >> 64)
+            id_lo.append(pid & 0xFFFFFFFFFFFFFFFF)
+
+            listed_at = pet.listed_at
+            if listed_at:
+                if listed_at.tzinfo is None:
+                    listed_at = listed_at.replace(tzinfo=timezone.utc)
+                epoch.append(listed_at.timestamp())
+                has_listed.append(True)
+            else:
+                epoch.append(0.0)
+                has_listed.append(False)
+
+            visibility = RankingService._get_visibility(pet)
+            if visibility is not None:
+                stored.append(visibility.final_score)
+                has_stored.append(True)
+            else:
+                stored.append(0.0)
+                has_stored.append(False)
+
+            risk.append(_risk_bits(RankingService._get_risk(pet)))
+            small_or_medium.append(pet.size in ("S", "M"))
+            active, gentle = RankingService._description_flags(pet)
+            kw_active.append(active)
+            kw_gentle.append(gentle)
+
+        return {
+            "n": len(pets),
+            "id_hi": np.array(id_hi, dtype=np.uint64),
+            "id_lo": np.array(id_lo, dtype=np.uint64),
+            "epoch": np.array(epoch, dtype=np.float64),
+            "has_listed": np.array(has_listed, dtype=bool),
+            "stored": np.array(stored, dtype=np.float64),
+            "has_stored": np.array(has_stored, dtype=bool),
+            "risk": np.array(risk, dtype=np.uint8),
+            "small_or_medium": np.array(small_or_medium, dtype=bool),
+            "kw_active": np.array(kw_active, dtype=bool),
+            "kw_gentle": np.array(kw_gentle, dtype=bool),
+        }
+
+    @staticmethod
+    def _base_scores(cols) -> "np.ndarray":
+        risk = cols["risk"]
+
+        def boost(bit: int, weight: float):
+            return np.where((risk & bit) != 0, weight, 0.0)
+
+        # Same accumulation order as RankingService.risk_boosts / compute_base_score
+        recency = np.where(cols["has_listed"], cols["epoch"] / 86400.0, 0.0)
+        long_stay = 0.0 + boost(RISK_LONG_STAY, BOOST_LONG_STAY)
+        risk_boost = 0.0 + boost(RISK_SENIOR, BOOST_SENIOR)
+        risk_boost = risk_boost + boost(RISK_MEDICAL, BOOST_MEDICAL)
+        risk_boost = risk_boost + boost(RISK_OVERLOOKED, BOOST_OVERLOOKED)
+        returned = 0.0 + boost(RISK_RETURNED, BOOST_RETURNED)
+
+        total = np.minimum(long_stay + risk_boost + returned, MAX_TOTAL_BOOST)
+        computed = recency + total
+
+        return np.where(cols["has_stored"], cols["stored"], computed)
+
+    @staticmethod
+    def _profile_matches(cols, profile: Optional[AdopterProfile]) -> "np.ndarray":
+        n = cols["n"]
+        matches = np.zeros(n, dtype=np.uint8)
+        if profile is None:
+            return matches
+
+        if profile.activity_level == AdopterProfile.ActivityLevel.HIGH:
+            matches |= np.where(cols["kw_active"], MATCH_ACTIVITY, 0).astype(np.uint8)
+        if profile.home_type == AdopterProfile.HomeType.APARTMENT:
+            matches |= np.where(cols["small_or_medium"], MATCH_HOME, 0).astype(np.uint8)
+        if profile.experience_level == AdopterProfile.ExperienceLevel.NEW:
+            matches |= np.where(cols["kw_gentle"], MATCH_EXPERIENCE, 0).astype(np.uint8)
+        return matches
+
+    @staticmethod
+    def score(pets: List[Pet], profile: Optional[AdopterProfile] = None):
+        """
+        Returns (scores, risk_bits, profile_bits, cols) in input order.
+        """
+        cols = VectorizedRankingService._pack(pets)
+        scores = VectorizedRankingService._base_scores(cols)
+        matches = VectorizedRankingService._profile_matches(cols, profile)
+
+        if profile is not None:
+            p_boost = 0.0 + np.where((matches & MATCH_ACTIVITY) != 0, BOOST_PROFILE_ACTIVITY_MATCH, 0.0)
+            p_boost = p_boost + np.where((matches & MATCH_HOME) != 0, BOOST_PROFILE_HOME_MATCH, 0.0)
+            p_boost = p_boost + np.where((matches & MATCH_EXPERIENCE) != 0, BOOST_PROFILE_EXPERIENCE_MATCH, 0.0)
+            scores = scores + p_boost
+
+        return scores, cols["risk"], matches, cols
+
+    @staticmethod
+    def rank(pets: List[Pet], profile: Optional[AdopterProfile] = None) -> List[RankedPet]:
+        if not pets:
+            return []
+
+        scores, risk, matches, cols = VectorizedRankingService.score(pets, profile=profile)
+
+        # Deterministic ordering score DESC, then pet_id DESC (last lexsort key is primary)
+        order = np.lexsort((cols["id_lo"], cols["id_hi"], scores))[::-1]
+
+        score_list = scores.tolist()
+        risk_list = risk.tolist()
+        match_list = matches.tolist()
+
+        return [
+            RankedPet(
+                pet=pets[i],
+                score=score_list[i],
+                reasons=list(_RISK_REASONS[risk_list[i]] + _PROFILE_REASONS[match_list[i]]),
+            )
+            for i in order.tolist()
+        ]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional
+
+from adoption.models import Pet, RiskClassification, VisibilityScore
+from adoption.services.ranking_service import RankingService
+
+
+_SCORE_FIELDS = [
+    "base_score",
+    "boost_long_stay",
+    "boost_risk",
+    "boost_returned",
+    "penalty_high_adopt_prob",
+    "final_score",
+    "computed_at",
+]
+
+
+class VisibilityScoreService:
+    """
+    Maintains VisibilityScore as the precomputed, profile-independent feed score.
+
+    Written by ingestion + risk backfill, read by the feed:
+    - SQL orders/caps candidates by final_score
+    - RankingService only adds per-profile boosts on top
+    """
+
+    @staticmethod
+    def refresh_for_pet(pet: Pet, risk: Optional[RiskClassification] = None) -> VisibilityScore:
+        obj, _ = VisibilityScore.objects.update_or_create(
+            pet=pet,
+            defaults=RankingService.compute_base_score(pet, risk),
+        )
+        return obj
+
+    @staticmethod
+    def refresh_for_pets(pets: Iterable[Pet]) -> int:
+        """
+        Recompute scores for the given pets in one risk query + one upsert.
+        Returns count written.
+        """
+        # One row per pet (ON CONFLICT can't touch the same row twice)
+        pets = list({p.pet_id: p for p in pets if p is not None}.values())
+        if not pets:
+            return 0
+
+        risk_by_pet_id: Dict = {
+            r.pet_id: r
+            for r in RiskClassification.objects.filter(pet_id__in=[p.pet_id for p in pets])
+        }
+
+        rows: List[VisibilityScore] = [
+            VisibilityScore(
+                pet_id=p.pet_id,
+                **RankingService.compute_base_score(p, risk_by_pet_id.get(p.pet_id)),
+            )
+            for p in pets
+        ]
+
+        VisibilityScore.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=["pet"],
+            update_fields=_SCORE_FIELDS,
+        )
+        return len(rows)
+
+    @staticmethod
+    def backfill_missing(batch_size: int = 1000) -> int:
+        """
+        Writes scores for pets that have no VisibilityScore row yet (created before
+        the table existed, or outside ingestion). Keyset pages on pet_id.
+        Returns count written.
+        """
+        written = 0
+        last_id = None
+        qs = Pet.objects.filter(visibility__isnull=True).order_by("pet_id")
+        while True:
+            page_qs = qs if last_id is None else qs.filter(pet_id__gt=last_id)
+            page = list(page_qs.only("pet_id", "listed_at")[:batch_size])
+            if not page:
+                return written
+            last_id = page[-1].pet_id
+            written += VisibilityScoreService.refresh_for_pets(page)
+            if len(page) < batch_size:
+                return written
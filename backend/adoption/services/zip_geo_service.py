@@ -1,16 +1,34 @@
 from __future__ import annotations
 
+from bisect import bisect_left
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import csv
+import math
+import mmap
+import os
+import struct
 import threading
 
 from django.conf import settings
 
+from adoption.services.geo_distance_service import GeoDistanceService
+
 
 LatLon = Tuple[float, float]
 
+# Binary centroid file: header (magic, record count) then fixed-width records
+# (zip5 as uint32, lat float32, lon float32) sorted by zip. float32 keeps ~1m precision.
+ZIP_BIN_MAGIC = b"WZC1"
+ZIP_BIN_HEADER = struct.Struct("<4sI")
+ZIP_BIN_RECORD = struct.Struct("<Iff")
+
+# Spatial grid over the centroids (degrees per cell side)
+ZIP_GRID_CELL_DEGREES = 0.5
+# Miles per degree of latitude (and of longitude at the equator)
+MILES_PER_DEGREE = 69.0
+
 
 @dataclass(frozen=True)
 class ZipGeoResult:
@@ -19,16 +37,117 @@ class ZipGeoResult:
     lon: float
 
 
+def pack_zip_centroids(rows: Iterable[Tuple[str, float, float]]) -> bytes:
+    """
+    Encodes (zip5, lat, lon) rows into the binary centroid format.
+    Later duplicates win, matching the CSV loader.
+    """
+    by_zip: Dict[int, LatLon] = {}
+    for z, lat, lon in rows:
+        by_zip[int(z)] = (float(lat), float(lon))
+
+    out = bytearray(ZIP_BIN_HEADER.pack(ZIP_BIN_MAGIC, len(by_zip)))
+    for key in sorted(by_zip):
+        lat, lon = by_zip[key]
+        out += ZIP_BIN_RECORD.pack(key, lat, lon)
+    return bytes(out)
+
+
+class _MappedZipCentroids:
+    """
+    Read-only view over a memory-mapped binary centroid file.
+    Pages are shared through the OS page cache by every worker process.
+    """
+
+    def __init__(self, buf: mmap.mmap, count: int):
+        self._buf = buf
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def get(self, z: str) -> Optional[LatLon]:
+        target = int(z)
+        record = ZIP_BIN_RECORD
+        size = record.size
+        base = ZIP_BIN_HEADER.size
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key, lat, lon = record.unpack_from(self._buf, base + mid * size)
+            if key == target:
+                return lat, lon
+            if key < target:
+                lo = mid + 1
+            else:
+                hi = mid
+        return None
+
+    def items(self) -> Iterator[Tuple[str, LatLon]]:
+        body = memoryview(self._buf)[ZIP_BIN_HEADER.size:]
+        try:
+            for key, lat, lon in ZIP_BIN_RECORD.iter_unpack(body):
+                yield f"{key:05d}", (lat, lon)
+        finally:
+            body.release()
+
+
+class _ZipGrid:
+    """
+    Centroids bucketed into ZIP_GRID_CELL_DEGREES cells, plus the sorted ZIP list.
+    Built once per process from the loaded store, on the first spatial query.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, LatLon]]):
+        self.cells: Dict[Tuple[int, int], List[Tuple[str, float, float]]] = {}
+        zips: List[str] = []
+        for z, (lat, lon) in items:
+            zips.append(z)
+            self.cells.setdefault(self.cell_of(lat, lon), []).append((z, lat, lon))
+        zips.sort()
+        self.sorted_zips = zips
+
+        rows = [r for r, _ in self.cells] or [0]
+        cols = [c for _, c in self.cells] or [0]
+        self.row_range = (min(rows), max(rows))
+        self.col_range = (min(cols), max(cols))
+
+    @staticmethod
+    def cell_of(lat: float, lon: float) -> Tuple[int, int]:
+        return math.floor(lat / ZIP_GRID_CELL_DEGREES), math.floor(lon / ZIP_GRID_CELL_DEGREES)
+
+    def block(self, row_lo: int, row_hi: int, col_lo: int, col_hi: int) -> List[Tuple[str, float, float]]:
+        out: List[Tuple[str, float, float]] = []
+        for r in range(max(row_lo, self.row_range[0]), min(row_hi, self.row_range[1]) + 1):
+            for c in range(max(col_lo, self.col_range[0]), min(col_hi, self.col_range[1]) + 1):
+                out.extend(self.cells.get((r, c), ()))
+        return out
+
+    def ring(self, row: int, col: int, radius: int) -> List[Tuple[str, float, float]]:
+        """
+        Entries in the square ring of cells exactly `radius` cells from (row, col).
+        """
+        if radius == 0:
+            return list(self.cells.get((row, col), ()))
+        out = self.block(row - radius, row - radius, col - radius, col + radius)
+        out += self.block(row + radius, row + radius, col - radius, col + radius)
+        out += self.block(row - radius + 1, row + radius - 1, col - radius, col - radius)
+        out += self.block(row - radius + 1, row + radius - 1, col + radius, col + radius)
+        return out
+
+
 class ZipGeoService:
     """
     Deterministic offline ZIP -> (lat, lon) lookup.
     - No network calls
     - No DB writes
-    - CSV loaded once per process (thread-safe)
+    - Binary centroid file memory-mapped once per process (thread-safe),
+      CSV parsed into a dict when the binary file is missing or invalid
     """
 
     _lock = threading.Lock()
-    _cache: Optional[Dict[str, LatLon]] = None
+    _cache: Optional[Union[Dict[str, LatLon], _MappedZipCentroids]] = None
+    _grid: Optional[_ZipGrid] = None
 
     @staticmethod
     def normalize_zip(z: Optional[str]) -> Optional[str]:
@@ -51,7 +170,38 @@ class ZipGeoService:
         return base_dir / "adoption" / "data" / "us_zip_centroids.csv"
 
     @classmethod
-    def _load(cls) -> Dict[str, LatLon]:
+    def _bin_path(cls) -> Path:
+        # Built next to the CSV by scripts/build_zip_centroids.py
+        return cls._csv_path().with_suffix(".bin")
+
+    @classmethod
+    def _load(cls) -> Union[Dict[str, LatLon], _MappedZipCentroids]:
+        mapped = cls._load_binary()
+        if mapped is not None:
+            return mapped
+        return cls._load_csv()
+
+    @classmethod
+    def _load_binary(cls) -> Optional[_MappedZipCentroids]:
+        path = cls._bin_path()
+        try:
+            with path.open("rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < ZIP_BIN_HEADER.size:
+                    return None
+                # The mapping stays valid after the file handle is closed
+                buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+
+        magic, count = ZIP_BIN_HEADER.unpack_from(buf, 0)
+        if magic != ZIP_BIN_MAGIC or size != ZIP_BIN_HEADER.size + count * ZIP_BIN_RECORD.size:
+            buf.close()
+            return None
+        return _MappedZipCentroids(buf, count)
+
+    @classmethod
+    def _load_csv(cls) -> Dict[str, LatLon]:
         path = cls._csv_path()
         if not path.exists():
             # Hard fail would break callers - return empty so callers can degrade gracefully
@@ -102,6 +252,105 @@ class ZipGeoService:
         lat, lon = latlon
         return ZipGeoResult(postal_code=z, lat=lat, lon=lon)
 
+    @classmethod
+    def resolve(cls, postal_code: Optional[str]) -> Optional[ZipGeoResult]:
+        """
+        Exact lookup, else the nearest known ZIP sharing the 3-digit prefix
+        (new / PO-box-only ZIPs missing from the centroid file).
+        """
+        return cls.lookup(postal_code) or cls.lookup(cls.nearest_known_zip(postal_code))
+
+    @classmethod
+    def nearest_known_zip(cls, postal_code: Optional[str]) -> Optional[str]:
+        """
+        The ZIP itself when known, else the numerically closest known ZIP with the
+        same 3-digit prefix (ties go to the lower ZIP). None when the prefix has none.
+        """
+        z = cls.normalize_zip(postal_code)
+        if not z:
+            return None
+
+        zips = cls._ensure_grid().sorted_zips
+        i = bisect_left(zips, z)
+        if i < len(zips) and zips[i] == z:
+            return z
+
+        target = int(z)
+        candidates = [zips[j] for j in (i - 1, i) if 0 <= j < len(zips) and zips[j][:3] == z[:3]]
+        if not candidates:
+            return None
+        return min(candidates, key=lambda c: abs(int(c) - target))
+
+    @classmethod
+    def nearest(cls, lat: float, lon: float) -> Optional[ZipGeoResult]:
+        """
+        Closest centroid to a coordinate (grid ring search).
+        """
+        grid = cls._ensure_grid()
+        if not grid.sorted_zips:
+            return None
+
+        row, col = grid.cell_of(lat, lon)
+        # Rings needed to reach every populated cell
+        max_radius = max(
+            abs(row - grid.row_range[0]), abs(row - grid.row_range[1]),
+            abs(col - grid.col_range[0]), abs(col - grid.col_range[1]),
+        )
+
+        best: Optional[Tuple[float, str, float, float]] = None
+        for radius in range(max_radius + 1):
+            if best is not None:
+                # Ring `radius` is at least (radius - 1) cells away; lon cells narrow toward the poles
+                far_lat = min(89.0, abs(lat) + radius * ZIP_GRID_CELL_DEGREES)
+                step_miles = ZIP_GRID_CELL_DEGREES * MILES_PER_DEGREE * max(0.01, math.cos(math.radians(far_lat)))
+                if (radius - 1) * step_miles > best[0]:
+                    break
+            entries = grid.ring(row, col, radius)
+            if not entries:
+                continue
+            distances = GeoDistanceService.distances_miles(lat, lon, [e[1] for e in entries], [e[2] for e in entries])
+            d, z, zlat, zlon = min((d, *e) for d, e in zip(distances, entries))
+            if best is None or (d, z) < best[:2]:
+                best = (d, z, zlat, zlon)
+
+        if best is None:
+            return None
+        _, z, zlat, zlon = best
+        return ZipGeoResult(postal_code=z, lat=zlat, lon=zlon)
+
+    @classmethod
+    def zips_within_radius(cls, lat: float, lon: float, miles: float) -> List[Tuple[str, float]]:
+        """
+        (zip, distance_miles) for every centroid within `miles`, nearest first.
+        """
+        if miles < 0:
+            return []
+        grid = cls._ensure_grid()
+
+        lat_delta = float(miles) / MILES_PER_DEGREE
+        lon_delta = float(miles) / (MILES_PER_DEGREE * max(0.1, math.cos(math.radians(min(89.0, abs(lat) + lat_delta)))))
+        row_lo, col_lo = grid.cell_of(lat - lat_delta, lon - lon_delta)
+        row_hi, col_hi = grid.cell_of(lat + lat_delta, lon + lon_delta)
+
+        entries = grid.block(row_lo, row_hi, col_lo, col_hi)
+        mask, distances = GeoDistanceService.within_radius(
+            lat, lon, [e[1] for e in entries], [e[2] for e in entries], miles
+        )
+        hits = [(e[0], d) for e, keep, d in zip(entries, mask, distances) if keep]
+        hits.sort(key=lambda h: (h[1], h[0]))
+        return hits
+
+    @classmethod
+    def _ensure_grid(cls) -> _ZipGrid:
+        grid = cls._grid
+        if grid is not None:
+            return grid
+        cls._ensure_cache()
+        with cls._lock:
+            if cls._grid is None:
+                cls._grid = _ZipGrid(cls._cache.items())
+            return cls._grid
+
     @classmethod
     def count_loaded(cls) -> int:
         cls._ensure_cache()
@@ -112,4 +361,5 @@ class ZipGeoService:
     def reset_cache_for_tests(cls) -> None:
         # Only intended for unit tests
         with cls._lock:
-            cls._cache = None
\ No newline at end of file
+            cls._cache = None
+            cls._grid = None
\ No newline at end of file
@@ -0,0 +1,170 @@
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from adoption.models import AdopterProfile, Application, Interest, Organization, Pet, PetSeen, VisibilityScore
+from adoption.services.application_service import ApplicationService
+from adoption.services.cursor import encode_cursor
+from adoption.services.interest_service import InterestService
+from adoption.services.pet_feed_service import MAX_CANDIDATES, PetFeedService
+
+User = get_user_model()
+
+N_PETS = 4000
+# One live pet in ten. Far sparser and the planner rightly prefers the plain status
+# index plus a top-N sort over the few live rows, which says nothing about the
+# partial index this class locks.
+ACTIVE_EVERY = 10
+N_USERS = 200
+PER_USER = 20
+
+N_FEED_PETS = 20000
+
+
+def _analyze(tables):
+    with connection.cursor() as cur:
+        for table in tables:
+            cur.execute(f"ANALYZE {table}")
+
+
+def _explain(sql):
+    with connection.cursor() as cur:
+        cur.execute("EXPLAIN " + sql)
+        return "\n".join(row[0] for row in cur.fetchall())
+
+
+class FeedQueryIndexTests(TestCase):
+    """
+    EXPLAIN regression lock: the feed / list query shapes keep using their indexes.
+    Seeded like production (mostly inactive history, many users) and ANALYZEd,
+    so the planner chooses on real statistics rather than forced settings.
+    Assertions name the index only; join order, sorts and scan kinds may change.
+    """
+
+    ANALYZED_TABLES = (User._meta.db_table, "adoption_pet", "adoption_interest", "adoption_application")
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        cls.org = Organization.objects.create(source="TEST", source_org_id="org1", name="Org")
+
+        pets = []
+        for i in range(N_PETS):
+            pets.append(Pet(
+                pet_id=uuid.uuid4(),
+                source="TEST",
+                external_id=f"p{i}",
+                organization=cls.org,
+                name=f"Pet {i}",
+                listed_at=now - timezone.timedelta(hours=i),
+                # A slice of the catalog is live, the rest is adopted/removed history
+                status=Pet.Status.ACTIVE if i % ACTIVE_EVERY == 0 else Pet.Status.INACTIVE,
+                temperament_tags=["rare_tag"] if i % 400 == 0 else ["friendly", "playful"],
+            ))
+        Pet.objects.bulk_create(pets, batch_size=1000)
+
+        # Users interleaved, like real traffic: one user's rows are spread over the heap
+        users = User.objects.bulk_create([User(username=f"u{i}") for i in range(N_USERS)])
+        cls.user = users[0]
+        Interest.objects.bulk_create([
+            Interest(user=u, pet=pets[(j * N_USERS + k) % N_PETS])
+            for j in range(PER_USER) for k, u in enumerate(users)
+        ])
+        Application.objects.bulk_create([
+            Application(user=u, pet=pets[(j * N_USERS + k) % N_PETS], organization=cls.org)
+            for j in range(PER_USER) for k, u in enumerate(users)
+        ])
+
+        _analyze(cls.ANALYZED_TABLES)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        # Row estimates in pg_class outlive the rollback: re-ANALYZE the now empty tables
+        _analyze(cls.ANALYZED_TABLES)
+
+    def assertUsesIndex(self, qs, index_name):
+        plan = qs.explain()
+        self.assertIn(index_name, plan, plan)
+
+    def test_active_newest_first_uses_partial_index(self):
+        qs = Pet.objects.filter(status=Pet.Status.ACTIVE).order_by("-listed_at", "-pet_id")[:20]
+        self.assertUsesIndex(qs, "pet_active_listed_idx")
+
+    def test_hard_constraint_uses_gin_index(self):
+        qs = PetFeedService._apply_hard_constraints(Pet.objects.all(), {"hard_constraints": ["rare_tag"]})
+        self.assertUsesIndex(qs, "pet_temperament_tags_gin")
+        self.assertEqual(qs.count(), N_PETS // 400)
+
+    def test_interest_list_uses_user_created_index(self):
+        self.assertUsesIndex(InterestService.list_interests(self.user)[:20], "interest_user_created_idx")
+
+    def test_application_list_uses_user_created_index(self):
+        self.assertUsesIndex(ApplicationService.list_applications(self.user)[:20], "application_user_created_idx")
+
+    def test_interest_keyset_page_uses_user_created_index(self):
+        last = InterestService.list_interests(self.user)[5]
+        cursor = encode_cursor(last.created_at, str(last.pk))
+        with CaptureQueriesContext(connection) as ctx:
+            InterestService.list_interests_page(self.user, cursor, 5)
+        plan = _explain(ctx.captured_queries[-1]["sql"])
+        self.assertIn("interest_user_created_idx", plan, plan)
+
+
+class FeedCandidateIndexTests(TestCase):
+    """
+    EXPLAIN regression lock for the feed candidate fetch itself: a live catalog several
+    times MAX_CANDIDATES, every pet scored, so only the top of the score order is read.
+    """
+
+    ANALYZED_TABLES = ("adoption_pet", "adoption_visibilityscore", "adoption_petseen")
+
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        org = Organization.objects.create(source="TEST", source_org_id="org1", name="Org")
+
+        pets = [
+            Pet(
+                pet_id=uuid.uuid4(),
+                source="TEST",
+                external_id=f"p{i}",
+                organization=org,
+                name=f"Pet {i}",
+                listed_at=now - timezone.timedelta(hours=i),
+                status=Pet.Status.ACTIVE if i % 5 else Pet.Status.INACTIVE,
+            )
+            for i in range(N_FEED_PETS)
+        ]
+        Pet.objects.bulk_create(pets, batch_size=1000)
+        # Scores spread independently of recency (backfill_visibility_scores keeps every pet scored)
+        VisibilityScore.objects.bulk_create([
+            VisibilityScore(pet=p, final_score=(i * 7919) % N_FEED_PETS / N_FEED_PETS)
+            for i, p in enumerate(pets)
+        ], batch_size=1000)
+
+        cls.user = User.objects.create(username="swiper")
+        PetSeen.objects.bulk_create([PetSeen(user=cls.user, pet=p) for p in pets[:200]])
+        cls.profile = AdopterProfile.objects.create(user=cls.user)
+
+        _analyze(cls.ANALYZED_TABLES)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        _analyze(cls.ANALYZED_TABLES)
+
+    def test_candidate_fetch_walks_final_score_index(self):
+        with CaptureQueriesContext(connection) as ctx:
+            ranked = PetFeedService._rank_candidates(self.user, self.profile)
+        candidate_sql = [q["sql"] for q in ctx.captured_queries if f"LIMIT {MAX_CANDIDATES}" in q["sql"]]
+
+        # Enough scored pets: the unscored tail query is skipped
+        self.assertEqual(len(candidate_sql), 1)
+        self.assertEqual(len(ranked), MAX_CANDIDATES)
+        plan = _explain(candidate_sql[0])
+        self.assertIn("visibility_final_score_idx", plan, plan)
@@ -1,10 +1,15 @@
+from io import StringIO
+from itertools import islice
 from unittest import mock
 from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.core.management.base import CommandError
 
 from providers.base import ProviderOrg, ProviderPet
 from adoption.models import Organization, Pet
+from adoption.services.ingestion_service import IngestionService
 
 from adoption.models import ProviderSyncState
 from django.utils import timezone
@@ -158,3 +163,255 @@ class IngestProviderCommandTests(TestCase):
         state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
         self.assertIsNone(state.lock_acquired_at)
         self.assertIsNone(state.lock_owner)
+
+
+class MultiPageFakeProvider:
+    provider_name = "rescuegroups"
+
+    def __init__(self, n_pets=5):
+        self.n_pets = n_pets
+        self.org_calls = []
+        self.pets_yielded = 0
+
+    def iter_orgs(self, *, limit=100, org_id=None):
+        self.org_calls.append(org_id)
+        yield ProviderOrg(provider="rescuegroups", external_org_id=org_id, name=f"Org {org_id}", raw={"id": org_id})
+
+    def iter_pets(self, *, limit=100, org_id=None):
+        for i in range(min(limit, self.n_pets)):
+            self.pets_yielded += 1
+            yield ProviderPet(
+                provider="rescuegroups",
+                external_pet_id=f"P{i}",
+                external_org_id=f"RG{i % 2}",
+                name=f"Pet {i}",
+                species="DOG",
+                raw_description="",
+                listed_at_iso="2026-01-01T00:00:00+00:00",
+                status="available",
+                raw={"id": f"P{i}"},
+            )
+
+
+class ShiftingPagesFakeProvider(MultiPageFakeProvider):
+    """Listing shifted mid-run: the last pet of page 1 shows up again on page 2."""
+
+    def iter_pets(self, *, limit=100, org_id=None):
+        pets = list(super().iter_pets(limit=limit, org_id=org_id))
+        yield from pets[:2] + pets[1:]
+
+
+class IngestProviderStreamingTests(TestCase):
+    def test_pets_seen_counts_a_pet_repeated_across_batches_once(self):
+        provider = ShiftingPagesFakeProvider(n_pets=3)
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            out = StringIO()
+            call_command("ingest_provider", "--provider", "rescuegroups", "--limit", "3", "--batch-size", "2", stdout=out)
+
+        self.assertIn("pets_seen=3", out.getvalue())
+        self.assertEqual(Pet.objects.count(), 3)
+
+    def test_batches_upsert_as_they_stream_and_fetch_each_org_once(self):
+        provider = MultiPageFakeProvider(n_pets=5)
+        batch_pets_seen = []
+
+        real_ingest = IngestionService.ingest_canonical
+
+        def spy(org_dicts, pet_dicts, *args, **kwargs):
+            # Lazy provider: a batch is ingested before the next one is fetched
+            batch_pets_seen.append((len(pet_dicts), provider.pets_yielded))
+            return real_ingest(org_dicts, pet_dicts, *args, **kwargs)
+
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider), \
+                mock.patch("adoption.management.commands.ingest_provider.IngestionService.ingest_canonical", side_effect=spy):
+            out = StringIO()
+            call_command("ingest_provider", "--provider", "rescuegroups", "--limit", "5", "--batch-size", "2", stdout=out)
+
+        self.assertEqual([n for n, _ in batch_pets_seen], [2, 2, 1])
+        self.assertEqual([y for _, y in batch_pets_seen], [2, 4, 5])
+        self.assertEqual(sorted(provider.org_calls), ["RG0", "RG1"])
+        self.assertEqual(Pet.objects.filter(status="ACTIVE").count(), 5)
+        self.assertIn("pets_created=5", out.getvalue())
+        self.assertEqual(Pet.objects.filter(last_seen_at__isnull=True).count(), 0)
+
+    def test_dry_run_streams_and_rolls_back(self):
+        provider = MultiPageFakeProvider(n_pets=3)
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            out = StringIO()
+            call_command(
+                "ingest_provider", "--provider", "rescuegroups", "--limit", "3", "--batch-size", "1", "--dry-run",
+                stdout=out,
+            )
+
+        self.assertIn("pets_created=3", out.getvalue())
+        self.assertEqual(Pet.objects.count(), 0)
+        self.assertEqual(Organization.objects.count(), 0)
+
+
+class IncludedOrgsFakeProvider(MultiPageFakeProvider):
+    """
+    Adapter that already received RG0 alongside the pets and can fetch the rest in bulk.
+    """
+
+    def __init__(self, n_pets=4):
+        super().__init__(n_pets=n_pets)
+        self.bulk_calls = []
+
+    def included_orgs(self, org_ids):
+        return [
+            ProviderOrg(provider="rescuegroups", external_org_id=oid, name=f"Included {oid}", raw={})
+            for oid in org_ids if oid == "RG0"
+        ]
+
+    def fetch_orgs(self, org_ids):
+        self.bulk_calls.append(list(org_ids))
+        return [ProviderOrg(provider="rescuegroups", external_org_id=oid, name=f"Fetched {oid}", raw={}) for oid in org_ids]
+
+
+class IngestProviderOrgResolutionTests(TestCase):
+    def _run(self, provider):
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            out = StringIO()
+            call_command("ingest_provider", "--provider", "rescuegroups", "--limit", "4", stdout=out)
+        return out.getvalue()
+
+    def test_included_orgs_skip_http_and_rest_is_fetched_in_bulk(self):
+        provider = IncludedOrgsFakeProvider()
+        out = self._run(provider)
+
+        self.assertEqual(provider.org_calls, [])
+        self.assertEqual(provider.bulk_calls, [["RG1"]])
+        self.assertEqual(Organization.objects.get(source_org_id="RG0").name, "Included RG0")
+        self.assertEqual(Organization.objects.get(source_org_id="RG1").name, "Fetched RG1")
+        self.assertIn("orgs_included=1", out)
+
+    def test_fresh_orgs_are_not_refetched(self):
+        Organization.objects.create(source="RESCUEGROUPS", source_org_id="RG1", name="Fresh", last_fetched_at=timezone.now())
+        provider = IncludedOrgsFakeProvider()
+        out = self._run(provider)
+
+        self.assertEqual(provider.bulk_calls, [])
+        self.assertEqual(Pet.objects.filter(organization__source_org_id="RG1").count(), 2)
+        self.assertIn("orgs_fresh_skipped=1", out)
+
+    def test_stale_orgs_are_refetched(self):
+        Organization.objects.create(
+            source="RESCUEGROUPS", source_org_id="RG1", name="Stale",
+            last_fetched_at=timezone.now() - timezone.timedelta(days=3),
+        )
+        provider = IncludedOrgsFakeProvider()
+        self._run(provider)
+
+        self.assertEqual(provider.bulk_calls, [["RG1"]])
+        self.assertEqual(Organization.objects.get(source_org_id="RG1").name, "Fetched RG1")
+
+    def test_unchanged_org_refetched_after_window_is_fresh_again(self):
+        self._run(IncludedOrgsFakeProvider())
+        long_ago = timezone.now() - timezone.timedelta(days=3)
+        Organization.objects.filter(source_org_id="RG1").update(last_fetched_at=long_ago, updated_at=long_ago)
+
+        # Outside the window: refetched, same content so no write, but the fetch is stamped
+        provider = IncludedOrgsFakeProvider()
+        self._run(provider)
+        self.assertEqual(provider.bulk_calls, [["RG1"]])
+        org = Organization.objects.get(source_org_id="RG1")
+        self.assertEqual(org.updated_at, long_ago)
+        self.assertGreater(org.last_fetched_at, long_ago)
+
+        provider = IncludedOrgsFakeProvider()
+        out = self._run(provider)
+        self.assertEqual(provider.bulk_calls, [])
+        self.assertIn("orgs_fresh_skipped=1", out)
+
+
+class IngestProviderDeactivationTests(TestCase):
+    def _run(self, provider):
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            call_command("ingest_provider", "--provider", "rescuegroups", "--batch-size", "2", stdout=StringIO())
+
+    def test_unchanged_pets_survive_resync_and_missing_ones_are_deactivated(self):
+        self._run(MultiPageFakeProvider(n_pets=5))
+        with CaptureQueriesContext(connection) as ctx:
+            # Same feed minus the last pet: the rest is unchanged (no rewrite) but still seen
+            self._run(MultiPageFakeProvider(n_pets=4))
+
+        self.assertEqual(Pet.objects.get(external_id="P4").status, "INACTIVE")
+        self.assertEqual(Pet.objects.filter(status="ACTIVE").count(), 4)
+        generation = ProviderSyncState.objects.get(provider="RESCUEGROUPS").sync_generation
+        self.assertEqual(Pet.objects.filter(sync_generation=generation).count(), 4)
+
+        deactivation = [q["sql"] for q in ctx.captured_queries if "INACTIVE" in q["sql"] and q["sql"].startswith("UPDATE")]
+        self.assertEqual(len(deactivation), 1)
+        self.assertNotIn("external_id", deactivation[0])
+
+
+class IncrementalFakeProvider(MultiPageFakeProvider):
+    """
+    Records updated_since; incremental calls only return the first pet (the one that changed).
+    """
+
+    def __init__(self, n_pets=3):
+        super().__init__(n_pets=n_pets)
+        self.updated_since_calls = []
+
+    def iter_pets(self, *, limit=100, org_id=None, updated_since=None):
+        self.updated_since_calls.append(updated_since)
+        pets = super().iter_pets(limit=limit, org_id=org_id)
+        if updated_since is not None:
+            pets = islice(pets, 1)
+        yield from pets
+
+
+class IngestProviderIncrementalTests(TestCase):
+    def _run(self, provider, mode):
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            call_command("ingest_provider", "--provider", "rescuegroups", "--mode", mode, stdout=StringIO())
+
+    def test_first_incremental_escalates_to_full(self):
+        provider = IncrementalFakeProvider()
+        self._run(provider, "incremental")
+
+        self.assertEqual(provider.updated_since_calls, [None])
+        state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
+        self.assertEqual(state.last_mode, "FULL")
+        self.assertIsNotNone(state.updated_since_watermark)
+        self.assertEqual(state.last_full_success_at, state.updated_since_watermark)
+
+    def test_incremental_fetches_since_watermark_and_does_not_deactivate(self):
+        self._run(IncrementalFakeProvider(), "full")
+        full_state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
+
+        provider = IncrementalFakeProvider()
+        self._run(provider, "incremental")
+
+        self.assertEqual(len(provider.updated_since_calls), 1)
+        self.assertEqual(provider.updated_since_calls[0], full_state.updated_since_watermark - timezone.timedelta(seconds=300))
+        # Unchanged pets are not in the incremental feed but stay active
+        self.assertEqual(Pet.objects.filter(source="RESCUEGROUPS", status="ACTIVE").count(), 3)
+
+        state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
+        self.assertEqual(state.last_mode, "INCREMENTAL")
+        self.assertGreater(state.updated_since_watermark, full_state.updated_since_watermark)
+        self.assertEqual(state.last_full_success_at, full_state.last_full_success_at)
+
+    def test_incremental_escalates_when_full_reconciliation_is_due(self):
+        self._run(IncrementalFakeProvider(), "full")
+        ProviderSyncState.objects.filter(provider="RESCUEGROUPS").update(
+            last_full_success_at=timezone.now() - timezone.timedelta(hours=25)
+        )
+
+        provider = IncrementalFakeProvider(n_pets=2)
+        self._run(provider, "incremental")
+
+        self.assertEqual(provider.updated_since_calls, [None])
+        self.assertEqual(Pet.objects.get(external_id="P2").status, "INACTIVE")
+        self.assertEqual(ProviderSyncState.objects.get(provider="RESCUEGROUPS").last_mode, "FULL")
+
+    def test_truncated_run_does_not_advance_watermark(self):
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client",
+                        return_value=IncrementalFakeProvider(n_pets=3)):
+            call_command("ingest_provider", "--provider", "rescuegroups", "--limit", "3", stdout=StringIO())
+
+        state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
+        self.assertIsNone(state.updated_since_watermark)
+        self.assertIsNone(state.last_full_success_at)
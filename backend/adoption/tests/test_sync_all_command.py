@@ -1,8 +1,12 @@
-from django.test import SimpleTestCase
+from io import StringIO
+from django.test import SimpleTestCase, TestCase
 from unittest import mock
 from django.core.management import call_command
 from unittest.mock import patch
 
+from providers.base import ProviderOrg, ProviderPet
+from adoption.models import Pet, ProviderSyncState
+
 class SyncAllCommandTests(SimpleTestCase):
     @patch("adoption.management.commands.sync_all.call_command")
     def test_sync_all_calls_ingest_then_backfill_then_enrich_by_default(self, mock_call):
@@ -32,4 +36,55 @@ class SyncAllCommandTests(SimpleTestCase):
         self.assertGreaterEqual(len(calls), 2)
         self.assertEqual(calls[0], "ingest_provider")
         self.assertEqual(calls[1], "enrich_pets")
-        self.assertNotIn("backfill_org_geos", calls)
\ No newline at end of file
+        self.assertNotIn("backfill_org_geos", calls)
+
+class CatalogFakeProvider:
+    provider_name = "rescuegroups"
+
+    def __init__(self, n_pets):
+        self.n_pets = n_pets
+        self.calls = []
+
+    def iter_orgs(self, *, limit=100, org_id=None):
+        yield ProviderOrg(provider="rescuegroups", external_org_id=org_id, name=f"Org {org_id}", raw={"id": org_id})
+
+    def iter_pets(self, *, limit=100, org_id=None, updated_since=None):
+        self.calls.append(updated_since)
+        for i in range(min(limit, self.n_pets)):
+            yield ProviderPet(
+                provider="rescuegroups",
+                external_pet_id=f"P{i}",
+                external_org_id="RG1",
+                name=f"Pet {i}",
+                species="DOG",
+                raw_description="",
+                listed_at_iso="2026-01-01T00:00:00+00:00",
+                status="available",
+                raw={"id": f"P{i}"},
+            )
+
+
+class SyncAllWatermarkTests(TestCase):
+    def test_default_sync_of_large_catalog_advances_watermark(self):
+        # Larger than the old --limit default of 200: a capped run never recorded a watermark
+        provider = CatalogFakeProvider(n_pets=250)
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            call_command("sync_all", "--provider", "rescuegroups", stdout=StringIO())
+
+            state = ProviderSyncState.objects.get(provider="RESCUEGROUPS")
+            self.assertEqual(Pet.objects.count(), 250)
+            self.assertIsNotNone(state.updated_since_watermark)
+            self.assertIsNotNone(state.last_full_success_at)
+
+            # The next scheduled run can go incremental
+            out = StringIO()
+            call_command("ingest_provider", "--provider", "rescuegroups", "--mode", "incremental", stdout=out)
+        self.assertIn("mode=incremental", out.getvalue())
+        self.assertIsNotNone(provider.calls[-1])
+
+    def test_capped_sync_does_not_advance_watermark(self):
+        provider = CatalogFakeProvider(n_pets=250)
+        with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+            call_command("sync_all", "--provider", "rescuegroups", "--limit", "200", stdout=StringIO())
+
+        self.assertIsNone(ProviderSyncState.objects.get(provider="RESCUEGROUPS").updated_since_watermark)
@@ -24,11 +24,69 @@ DEBUG = os.getenv("DJANGO_DEBUG", "0") == "1"
 
 RESCUEGROUPS_API_KEY = os.getenv("RESCUEGROUPS_API_KEY", "")
 RESCUEGROUPS_API_BASE_URL = os.getenv("RESCUEGROUPS_API_BASE_URL", "https://api.rescuegroups.org/v5")
+# Concurrent page fetches during sync (1 = sequential)
+RESCUEGROUPS_FETCH_CONCURRENCY = int(os.getenv("RESCUEGROUPS_FETCH_CONCURRENCY", "1"))
+# Pooled keep-alive connections + retries (429/5xx, jittered backoff) for provider HTTP
+RESCUEGROUPS_HTTP_POOL_SIZE = int(os.getenv("RESCUEGROUPS_HTTP_POOL_SIZE", "10"))
+RESCUEGROUPS_HTTP_MAX_RETRIES = int(os.getenv("RESCUEGROUPS_HTTP_MAX_RETRIES", "5"))
+# Orgs updated within this window are not refetched during ingest (unless the provider included them for free)
+WOOFER_ORG_REFRESH_HOURS = int(os.getenv("WOOFER_ORG_REFRESH_HOURS", "24"))
+# Incremental ingest escalates to a full (deactivating) run when the last full one is older than this
+WOOFER_FULL_RECONCILE_HOURS = int(os.getenv("WOOFER_FULL_RECONCILE_HOURS", "24"))
+# updated_since = watermark minus this overlap (provider clock skew, records committed mid-run)
+WOOFER_INCREMENTAL_OVERLAP_SECONDS = int(os.getenv("WOOFER_INCREMENTAL_OVERLAP_SECONDS", "300"))
 
 WOOFER_NOTIFICATIONS_ENABLED = os.getenv("WOOFER_NOTIFICATIONS_ENABLED", "1") == "1"
 WOOFER_NOTIFICATIONS_FORCE_FAIL = os.getenv("WOOFER_NOTIFICATIONS_FORCE_FAIL", "0") == "1"
 WOOFER_NOTIFICATIONS_BACKEND = os.getenv("WOOFER_NOTIFICATIONS_BACKEND", "console")  # console - email 
 
+# Feed ranking backend: python (default) - numpy (vectorized, needs numpy installed)
+WOOFER_RANKING_BACKEND = os.getenv("WOOFER_RANKING_BACKEND", "python")
+
+# Feed sessions: first page stores the ranked list, later pages read it by offset
+WOOFER_FEED_SESSIONS_ENABLED = os.getenv("WOOFER_FEED_SESSIONS_ENABLED", "1") == "1"
+WOOFER_FEED_SESSION_TTL_SECONDS = int(os.getenv("WOOFER_FEED_SESSION_TTL_SECONDS", "600"))
+WOOFER_FEED_SESSION_MAX_ENTRIES = int(os.getenv("WOOFER_FEED_SESSION_MAX_ENTRIES", "1000"))
+
+# Feed exclusions: per-user sorted array of liked/applied/passed pet ids in the "shared" cache.
+# Histories above MAX_IDS keep the NOT EXISTS anti-joins.
+WOOFER_FEED_EXCLUSION_CACHE_ENABLED = os.getenv("WOOFER_FEED_EXCLUSION_CACHE_ENABLED", "1") == "1"
+WOOFER_FEED_EXCLUSION_TTL_SECONDS = int(os.getenv("WOOFER_FEED_EXCLUSION_TTL_SECONDS", "3600"))
+WOOFER_FEED_EXCLUSION_MAX_IDS = int(os.getenv("WOOFER_FEED_EXCLUSION_MAX_IDS", "20000"))
+# Two shared cache rows per active user (array + version); DatabaseCache culls a third past this
+WOOFER_SHARED_CACHE_MAX_ENTRIES = int(os.getenv("WOOFER_SHARED_CACHE_MAX_ENTRIES", "200000"))
+
+# (home ZIP, radius) -> in-range organization ids, per process; invalidated across
+# processes through the "shared" cache (ingest / backfill bump the org geo version)
+WOOFER_ORG_DISTANCE_CACHE_ENABLED = os.getenv("WOOFER_ORG_DISTANCE_CACHE_ENABLED", "1") == "1"
+WOOFER_ORG_DISTANCE_CACHE_TTL_SECONDS = int(os.getenv("WOOFER_ORG_DISTANCE_CACHE_TTL_SECONDS", "300"))
+WOOFER_ORG_DISTANCE_CACHE_MAX_ENTRIES = int(os.getenv("WOOFER_ORG_DISTANCE_CACHE_MAX_ENTRIES", "256"))
+# Larger in-range sets keep the SQL distance filter (IN lists stop paying off)
+WOOFER_ORG_DISTANCE_CACHE_MAX_ORGS = int(os.getenv("WOOFER_ORG_DISTANCE_CACHE_MAX_ORGS", "2000"))
+
+# API responses: orjson-encoded envelope (same bytes, falls back to DRF's encoder without orjson)
+WOOFER_FAST_JSON = os.getenv("WOOFER_FAST_JSON", "0") == "1"
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    # Bounded + TTL evicting, sessions are per-process and safe to lose
+    "feed_sessions": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "woofer-feed-sessions",
+        "TIMEOUT": WOOFER_FEED_SESSION_TTL_SECONDS,
+        "OPTIONS": {"MAX_ENTRIES": WOOFER_FEED_SESSION_MAX_ENTRIES},
+    },
+    # Small cross-process values (org geo version, feed exclusions); table created by migration 0018
+    "shared": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "woofer_shared_cache",
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": WOOFER_SHARED_CACHE_MAX_ENTRIES},
+    },
+}
+
 
 ALLOWED_HOSTS = [
     h.strip()
@@ -113,7 +171,7 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_RENDERER_CLASSES": [
-        "core.renderers.EnvelopeJSONRenderer",
+        "core.renderers.FastEnvelopeJSONRenderer" if WOOFER_FAST_JSON else "core.renderers.EnvelopeJSONRenderer",
     ],
     "EXCEPTION_HANDLER": "core.exceptions.canonical_exception_handler",
     "DEFAULT_AUTHENTICATION_CLASSES": [
@@ -11,7 +11,7 @@ WOOFER_DEV_AUTH = True
 MIDDLEWARE.insert(1, "core.dev_auth.DevHeaderAuthMiddleware")
 
 REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = [
-    "core.renderers.EnvelopeJSONRenderer",
+    "core.renderers.FastEnvelopeJSONRenderer" if WOOFER_FAST_JSON else "core.renderers.EnvelopeJSONRenderer",
     "rest_framework.renderers.BrowsableAPIRenderer",
 ]
 
@@ -1,4 +1,10 @@
+try:
+    import orjson
+except ImportError:  # optional dependency, FastEnvelopeJSONRenderer falls back to the stock encoder
+    orjson = None
+
 from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
 
 class EnvelopeJSONRenderer(JSONRenderer):
@@ -10,14 +16,14 @@ class EnvelopeJSONRenderer(JSONRenderer):
     def render(self, data, accepted_media_type=None, renderer_context=None):
         # If renderer_context is missing, fallback to default behavior
         if renderer_context is None:
-            return super().render(data, accepted_media_type, renderer_context)
+            return self._encode(data, accepted_media_type, renderer_context)
 
         response = renderer_context.get("response")
         request = renderer_context.get("request")
 
         # If DRF is already returning an error envelope, do not double wrap
         if isinstance(data, dict) and data.get("ok") in (True, False) and ("data" in data or "error" in data):
-            return super().render(data, accepted_media_type, renderer_context)
+            return self._encode(data, accepted_media_type, renderer_context)
 
         request_id = getattr(request, "request_id", None)
         timestamp = getattr(request, "request_timestamp", None)
@@ -34,7 +40,7 @@ class EnvelopeJSONRenderer(JSONRenderer):
                 "request_id": request_id,
                 "timestamp": timestamp,
             }
-            return super().render(envelope, accepted_media_type, renderer_context)
+            return self._encode(envelope, accepted_media_type, renderer_context)
 
         # For safety - if an error leaks here, still wrap minimally
         envelope = {
@@ -47,4 +53,39 @@ class EnvelopeJSONRenderer(JSONRenderer):
             "request_id": request_id,
             "timestamp": timestamp,
         }
-        return super().render(envelope, accepted_media_type, renderer_context)
+        return self._encode(envelope, accepted_media_type, renderer_context)
+
+    def _encode(self, data, accepted_media_type, renderer_context):
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+# Types orjson does not serialize itself (Decimal, lazy strings, QuerySets, ...) go through DRF's encoder
+_drf_default = JSONEncoder().default
+
+if orjson is not None:
+    # Z for UTC like DRF's encoder; non-str keys like json.dumps
+    _ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+class FastEnvelopeJSONRenderer(EnvelopeJSONRenderer):
+    """
+    Same envelope, encoded with orjson (UUIDs, datetimes and dict/list subclasses natively).
+    Falls back to the stock encoder when orjson is not installed, for indented or ASCII-only
+    output, and for anything orjson rejects (e.g. ints beyond 64 bits).
+    Unlike STRICT_JSON, NaN / Infinity floats render as null instead of raising.
+    Enabled by settings.WOOFER_FAST_JSON.
+    """
+
+    def _encode(self, data, accepted_media_type, renderer_context):
+        if orjson is None or data is None or self.ensure_ascii or not self.compact:
+            return super()._encode(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super()._encode(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=_drf_default, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super()._encode(data, accepted_media_type, renderer_context)
+
+        # Same strict-javascript-subset escaping as JSONRenderer
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
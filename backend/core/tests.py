@@ -55,4 +55,70 @@ class DevAuthFenceTests(TestCase):
         self.assertFalse(payload["ok"])
         self.assertIn(payload["error"]["code"], ("UNAUTHORIZED", "FORBIDDEN"))
         self.assertIn("error", payload)
-        self.assertNotIn("data", payload)
\ No newline at end of file
+        self.assertNotIn("data", payload)
+
+class FastEnvelopeRendererTests(TestCase):
+    """
+    FastEnvelopeJSONRenderer must be a drop-in: byte-identical output to EnvelopeJSONRenderer.
+    """
+
+    def _render_both(self, data, status_code=200, accepted_media_type=None):
+        from types import SimpleNamespace
+        from core.renderers import EnvelopeJSONRenderer, FastEnvelopeJSONRenderer
+
+        context = {
+            "request": SimpleNamespace(request_id="rid", request_timestamp="2026-01-28T00:00:00+00:00"),
+            "response": SimpleNamespace(status_code=status_code),
+        }
+        stock = EnvelopeJSONRenderer().render(data, accepted_media_type, context)
+        fast = FastEnvelopeJSONRenderer().render(data, accepted_media_type, context)
+        return stock, fast
+
+    def test_same_bytes_for_feed_like_payload(self):
+        import datetime
+        import decimal
+        import uuid
+        from django.utils.translation import gettext_lazy
+        from rest_framework.utils.serializer_helpers import ReturnDict, ReturnList
+
+        items = ReturnList([
+            ReturnDict({
+                "pet_id": uuid.UUID(int=i),
+                "name": f"Pet {i} \u00e9 \u2028",
+                "photos": [],
+                "listed_at": datetime.datetime(2026, 1, 28, 12, 0, i, 123456, tzinfo=datetime.timezone.utc),
+                "born": datetime.date(2020, 1, 1),
+                "score": decimal.Decimal("1.5"),
+                "is_interested": False,
+                "interest_status": None,
+                "label": gettext_lazy("Senior"),
+                "organization": {"organization_id": uuid.UUID(int=7), "location": "LA"},
+            }, serializer=None)
+            for i in range(3)
+        ], serializer=None)
+
+        stock, fast = self._render_both({"items": items, "next_cursor": None, 1: "int key"})
+        self.assertEqual(fast, stock)
+        self.assertIn(b"\\u2028", fast)
+
+    def test_same_bytes_for_error_and_pre_enveloped_payloads(self):
+        stock, fast = self._render_both({"detail": "nope"}, status_code=500)
+        self.assertEqual(fast, stock)
+
+        enveloped = {"ok": False, "error": {"code": "NOT_FOUND"}, "request_id": "rid", "timestamp": "t"}
+        stock, fast = self._render_both(enveloped, status_code=404)
+        self.assertEqual(fast, stock)
+
+    def test_indent_and_big_ints_fall_back_to_stock_encoder(self):
+        stock, fast = self._render_both({"a": [1, 2]}, accepted_media_type="application/json; indent=2")
+        self.assertEqual(fast, stock)
+
+        stock, fast = self._render_both({"big": 1 << 70})
+        self.assertEqual(fast, stock)
+
+    def test_without_orjson_uses_stock_encoder(self):
+        from unittest import mock
+
+        with mock.patch("core.renderers.orjson", None):
+            stock, fast = self._render_both({"items": [{"name": "Pet"}]})
+        self.assertEqual(fast, stock)
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import threading
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Dict, Iterable, Iterator, Optional, Protocol, Literal, Any
 
 
@@ -55,6 +57,30 @@ class ProviderPet:
     raw: Dict[str, Any] = field(default_factory=dict)  # traceability only
 
 
+@dataclass
+class HttpStats:
+    """
+    Per-client HTTP counters (thread-safe), reported in the ingest summary.
+    total_s sums request latencies, so with concurrent fetches it can exceed wall time.
+    """
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    total_s: float = 0.0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, elapsed_s: float, ok: bool) -> None:
+        with self._lock:
+            self.requests += 1
+            self.total_s += elapsed_s
+            if not ok:
+                self.errors += 1
+
+    def record_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+
 class ProviderClient(Protocol):
     """
     Provider client interface (adapter boundary).
@@ -70,5 +96,10 @@ class ProviderClient(Protocol):
     def iter_orgs(self, *, limit: int = 100, org_id: Optional[str] = None) -> Iterator[ProviderOrg]:
         ...
 
-    def iter_pets(self, *, limit: int = 100, org_id: Optional[str] = None) -> Iterator[ProviderPet]:
+    def iter_pets(
+        self, *, limit: int = 100, org_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> Iterator[ProviderPet]:
+        """
+        updated_since (optional): only pets changed after this instant (incremental sync).
+        """
         ...
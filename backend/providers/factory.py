@@ -17,6 +17,9 @@ def get_provider_client(provider: ProviderName) -> ProviderClient:
         return RescueGroupsClient(
             api_key=settings.RESCUEGROUPS_API_KEY,
             base_url=getattr(settings, "RESCUEGROUPS_API_BASE_URL", "https://api.rescuegroups.org/v5"),
+            max_concurrency=getattr(settings, "RESCUEGROUPS_FETCH_CONCURRENCY", 1),
+            pool_size=getattr(settings, "RESCUEGROUPS_HTTP_POOL_SIZE", 10),
+            max_retries=getattr(settings, "RESCUEGROUPS_HTTP_MAX_RETRIES", 5),
         )
 
     raise ValueError(f"Unknown provider: {provider}")
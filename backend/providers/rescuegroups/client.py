@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterator, Optional, List
+import math
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, List
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
 import requests
-from providers.base import ProviderClient, ProviderOrg, ProviderPet
+from requests.adapters import HTTPAdapter
+from providers.base import HttpStats, ProviderClient, ProviderOrg, ProviderPet
 
 
 _JSONAPI = "application/vnd.api+json"
@@ -67,6 +75,70 @@ class RescueGroupsAPIError(RuntimeError):
     pass
 
 
+class RescueGroupsRetryableError(RescueGroupsAPIError):
+    """
+    429 / 5xx / connection failures, retried with backoff before surfacing.
+    """
+
+    def __init__(self, message: str, retry_after_s: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after_s = retry_after_s
+
+
+class RescueGroupsRateLimited(RescueGroupsRetryableError):
+    pass
+
+
+def _retry_after_seconds(value: Any) -> Optional[float]:
+    # Only the delta-seconds form, HTTP-date Retry-After falls back to our own backoff
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class _AdaptiveLimiter:
+    """
+    AIMD concurrency limit shared by page fetches:
+    - 429 halves the allowed in-flight requests and pauses everyone for the backoff
+    - every `limit` successes in a row allow one more (up to max_concurrency)
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self.in_flight = 0
+        self.successes = 0
+        self.resume_at = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        with self._cond:
+            while True:
+                wait_s = self.resume_at - time.monotonic()
+                if wait_s <= 0 and self.in_flight < self.limit:
+                    self.in_flight += 1
+                    return
+                self._cond.wait(timeout=wait_s if wait_s > 0 else None)
+
+    def release(self, ok: bool) -> None:
+        with self._cond:
+            self.in_flight -= 1
+            if ok:
+                self.successes += 1
+                if self.successes >= self.limit and self.limit < self.max_concurrency:
+                    self.limit += 1
+                    self.successes = 0
+            self._cond.notify_all()
+
+    def penalize(self, delay_s: float) -> None:
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self.successes = 0
+            self.resume_at = max(self.resume_at, time.monotonic() + delay_s)
+            self._cond.notify_all()
+
+
 @dataclass
 class RescueGroupsClient(ProviderClient):
     """
@@ -81,6 +153,23 @@ class RescueGroupsClient(ProviderClient):
     base_url: str = "https://api.rescuegroups.org/v5"
     timeout_s: int = 20
 
+    # docs - most endpoints max 250
+    page_size: int = 250
+    # Page fetching: 1 = sequential, >1 = pages 2..N fetched by a bounded thread pool
+    max_concurrency: int = 1
+    # Keep-alive connections kept per host by the pooled session
+    pool_size: int = 10
+    # 429 / 5xx / connection errors: retry with jittered exponential backoff (Retry-After wins when present)
+    max_retries: int = 5
+    backoff_base_s: float = 0.5
+    backoff_max_s: float = 30.0
+
+    http_stats: HttpStats = field(default_factory=HttpStats, init=False, repr=False)
+    # Orgs harvested from the `included` array of animal pages (org id -> record), reset per iter_pets
+    _included_orgs: Dict[str, ProviderOrg] = field(default_factory=dict, init=False, repr=False)
+    _limiter: Optional[_AdaptiveLimiter] = field(default=None, init=False, repr=False)
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False)
+
     provider_name = "rescuegroups"
 
     def _headers(self) -> Dict[str, str]:
@@ -89,23 +178,104 @@ class RescueGroupsClient(ProviderClient):
             "Content-Type": _JSONAPI,
             "Accept": _JSONAPI,
             "Authorization": self.api_key,
+            "Accept-Encoding": "gzip, deflate",
         }
 
-    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _get_session(self) -> requests.Session:
+        """
+        One pooled keep-alive session per client (shared by page workers).
+        Retries are ours (_get_with_backoff), the adapter never retries.
+        """
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(self.pool_size, self.max_concurrency), max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.headers.update(self._headers())
+            self._session = session
+        return self._session
+
+    def close(self) -> None:
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None, body: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        GET, or POST when a search body is given (RescueGroups filtered searches).
+        """
         url = self.base_url.rstrip("/") + path
-        resp = requests.get(url, headers=self._headers(), params=params or {}, timeout=self.timeout_s)
+        t0 = time.perf_counter()
+        try:
+            if body is not None:
+                resp = self._get_session().post(url, params=params or {}, json=body, timeout=self.timeout_s)
+            else:
+                resp = self._get_session().get(url, params=params or {}, timeout=self.timeout_s)
+        except requests.RequestException as e:
+            self.http_stats.record(time.perf_counter() - t0, ok=False)
+            raise RescueGroupsRetryableError(f"request to RescueGroups failed: {e}") from e
+        self.http_stats.record(time.perf_counter() - t0, ok=resp.status_code < 400)
 
         if resp.status_code == 429:
-            raise RescueGroupsAPIError("429 Too Many Requests (rate limited)")
+            retry_after = _retry_after_seconds((getattr(resp, "headers", None) or {}).get("Retry-After"))
+            raise RescueGroupsRateLimited("429 Too Many Requests (rate limited)", retry_after_s=retry_after)
+        if resp.status_code >= 500:
+            retry_after = _retry_after_seconds((getattr(resp, "headers", None) or {}).get("Retry-After"))
+            raise RescueGroupsRetryableError(
+                f"{resp.status_code} error from RescueGroups: {resp.text[:300]}", retry_after_s=retry_after
+            )
         if resp.status_code >= 400:
             raise RescueGroupsAPIError(f"{resp.status_code} error from RescueGroups: {resp.text[:300]}")
 
         return resp.json()
 
+    def _backoff_s(self, attempt: int, retry_after_s: Optional[float]) -> float:
+        if retry_after_s is not None:
+            return min(retry_after_s, self.backoff_max_s)
+        # Full jitter, so concurrent workers don't retry in lockstep
+        return random.uniform(0, min(self.backoff_base_s * (2 ** attempt), self.backoff_max_s))
+
+    def _get_with_backoff(
+        self, path: str, params: Optional[Dict[str, Any]] = None, body: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        _get with retries: 429 / 5xx / connection errors back off and retry
+        (a 429 also slows every page worker down via the shared limiter)
+        before the last error is raised.
+        """
+        limiter = self._limiter
+        attempt = 0
+        while True:
+            if limiter is not None:
+                limiter.acquire()
+            try:
+                payload = self._get(path, params=params, body=body)
+            except RescueGroupsRetryableError as e:
+                if limiter is not None:
+                    limiter.release(ok=False)
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_s(attempt, e.retry_after_s)
+                attempt += 1
+                self.http_stats.record_retry()
+                if limiter is not None and isinstance(e, RescueGroupsRateLimited):
+                    limiter.penalize(delay)
+                else:
+                    time.sleep(delay)
+                continue
+            except Exception:
+                if limiter is not None:
+                    limiter.release(ok=False)
+                raise
+
+            if limiter is not None:
+                limiter.release(ok=True)
+            return payload
+
     def iter_orgs(self, *, limit: int = 100, org_id: Optional[str] = None) -> Iterator[ProviderOrg]:
         if org_id:
             # GET /public/orgs/{orgs.id}
-            payload = self._get(f"/public/orgs/{org_id}", params=None)
+            payload = self._get_with_backoff(f"/public/orgs/{org_id}", params=None)
             for org in self._parse_orgs(payload):
                 yield org
             return
@@ -115,8 +285,8 @@ class RescueGroupsClient(ProviderClient):
 
         # GET /public/orgs/?limit=&page=
         while remaining > 0:
-            chunk = min(250, remaining)  # docs - most endpoints max 250
-            payload = self._get("/public/orgs/", params={"limit": chunk, "page": page})
+            chunk = min(self.page_size, remaining)
+            payload = self._get_with_backoff("/public/orgs/", params={"limit": chunk, "page": page})
             orgs = self._parse_orgs(payload)
 
             if not orgs:
@@ -134,13 +304,17 @@ class RescueGroupsClient(ProviderClient):
                 return
             page += 1
 
-    def iter_pets(self, *, limit: int = 100, org_id: Optional[str] = None) -> Iterator[ProviderPet]:
+    def iter_pets(
+        self, *, limit: int = 100, org_id: Optional[str] = None, updated_since: Optional[datetime] = None
+    ) -> Iterator[ProviderPet]:
         """
         MVP pulls DOGS only from the pre-defined 'available' view.
         Paging via ?limit=&page=
+        updated_since: only animals whose updatedDate is later (incremental sync).
         """
         page = 1
         remaining = limit
+        self._included_orgs = {}
 
         # Endpoint pattern appears in docs as
         # /public/animals/search/available/dogs/?limit=10&page=2...
@@ -149,17 +323,15 @@ class RescueGroupsClient(ProviderClient):
         if org_id:
             base_path = f"/public/orgs/{org_id}/animals/search/available/dogs/"
 
+        body = self._updated_since_filter(updated_since) if updated_since else None
+
+        if self.max_concurrency > 1:
+            yield from self._iter_pets_concurrent(base_path, limit, body=body)
+            return
+
         while remaining > 0:
-            chunk = min(250, remaining)
-            payload = self._get(
-                base_path,
-                params={
-                    "limit": chunk,
-                    "page": page,
-                    "include": "pictures,orgs",
-                    "fields[animals]": "name,descriptionText,sex,sizeGroup,ageGroup,isBreedMixed,breedPrimary,breedSecondary,updatedDate,createdDate,availableDate,pictureThumbnailUrl,pictureCount,orgs,pictures", 
-                    },
-                )
+            chunk = min(self.page_size, remaining)
+            payload = self._get_with_backoff(base_path, params=self._animal_params(chunk, page), body=body)
 
             pets = self._parse_animals(payload)
             if not pets:
@@ -177,6 +349,113 @@ class RescueGroupsClient(ProviderClient):
                 return
             page += 1
 
+    def included_orgs(self, org_ids: Iterable[str]) -> List[ProviderOrg]:
+        """
+        Orgs already delivered by `include=orgs` on the animal pages read so far (no HTTP).
+        """
+        return [self._included_orgs[oid] for oid in org_ids if oid in self._included_orgs]
+
+    def fetch_orgs(self, org_ids: Iterable[str]) -> List[ProviderOrg]:
+        """
+        Orgs by id: harvested ones first, the rest fetched through the pooled
+        session (concurrently when max_concurrency > 1). Returned in id order.
+        """
+        ids = sorted(set(org_ids))
+        found = {o.external_org_id: o for o in self.included_orgs(ids)}
+        missing = [oid for oid in ids if oid not in found]
+
+        def fetch(oid: str) -> List[ProviderOrg]:
+            return self._parse_orgs(self._get_with_backoff(f"/public/orgs/{oid}", params=None))
+
+        if len(missing) > 1 and self.max_concurrency > 1:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="rg-orgs") as pool:
+                fetched = list(pool.map(fetch, missing))
+        else:
+            fetched = [fetch(oid) for oid in missing]
+
+        for orgs in fetched:
+            for org in orgs:
+                found.setdefault(org.external_org_id, org)
+
+        return [found[oid] for oid in ids if oid in found]
+
+    @staticmethod
+    def _animal_params(chunk: int, page: int) -> Dict[str, Any]:
+        return {
+            "limit": chunk,
+            "page": page,
+            "include": "pictures,orgs",
+            "fields[animals]": "name,descriptionText,sex,sizeGroup,ageGroup,isBreedMixed,breedPrimary,breedSecondary,updatedDate,createdDate,availableDate,pictureThumbnailUrl,pictureCount,orgs,pictures", 
+        }
+
+    @staticmethod
+    def _updated_since_filter(updated_since: datetime) -> Dict[str, Any]:
+        if updated_since.tzinfo is None:
+            updated_since = updated_since.replace(tzinfo=dt_timezone.utc)
+        criteria = updated_since.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return {
+            "data": {
+                "filters": [
+                    {"fieldName": "animals.updatedDate", "operation": "greaterthan", "criteria": criteria},
+                ],
+            },
+        }
+
+    def _iter_pets_concurrent(self, base_path: str, limit: int, body: Optional[Dict[str, Any]] = None) -> Iterator[ProviderPet]:
+        """
+        Page 1 is fetched first to learn meta.pages, pages 2..N go through a bounded
+        pool. Pages are yielded strictly in page order; at most 2 x max_concurrency
+        pages are in flight or buffered, so memory stays bounded for slow consumers.
+        """
+        if limit <= 0:
+            return
+
+        # Fixed page size so page numbers address the same rows on every request
+        page_size = min(self.page_size, limit)
+        self._limiter = _AdaptiveLimiter(self.max_concurrency)
+        try:
+            first = self._get_with_backoff(base_path, params=self._animal_params(page_size, 1), body=body)
+            remaining = limit
+            for pet in self._parse_animals(first):
+                yield pet
+                remaining -= 1
+                if remaining <= 0:
+                    return
+
+            meta = first.get("meta") or {}
+            pages = meta.get("pages")
+            if pages is None:
+                return
+            last_page = min(int(pages), math.ceil(limit / page_size))
+            if last_page < 2:
+                return
+
+            window = 2 * self.max_concurrency
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="rg-pages") as pool:
+                pending = deque()
+                next_page = 2
+                try:
+                    while pending or next_page <= last_page:
+                        while next_page <= last_page and len(pending) < window:
+                            pending.append(pool.submit(
+                                self._get_with_backoff, base_path, self._animal_params(page_size, next_page), body
+                            ))
+                            next_page += 1
+
+                        pets = self._parse_animals(pending.popleft().result())
+                        if not pets:
+                            return
+                        for pet in pets:
+                            yield pet
+                            remaining -= 1
+                            if remaining <= 0:
+                                return
+                finally:
+                    for fut in pending:
+                        fut.cancel()
+        finally:
+            self._limiter = None
+
     # parsers 
 
     def _parse_orgs(self, payload: Dict[str, Any]) -> List[ProviderOrg]:
@@ -222,6 +501,15 @@ class RescueGroupsClient(ProviderClient):
 
         included = payload.get("included") or []
 
+        # Org resources ride along with include=orgs, keep them so ingest doesn't refetch
+        if isinstance(included, list):
+            org_rows = [
+                inc for inc in included
+                if isinstance(inc, dict) and inc.get("type") == "orgs" and inc.get("attributes")
+            ]
+            for org in self._parse_orgs({"data": org_rows}):
+                self._included_orgs[org.external_org_id] = org
+
         pic_meta_by_id: Dict[str, tuple[int, str]] = {}
 
         if isinstance(included, list):
@@ -1,3 +1,4 @@
+from datetime import datetime, timedelta, timezone
 from django.test import SimpleTestCase
 from unittest import mock
 
@@ -14,7 +15,7 @@ def _mock_resp(json_payload, status=200):
 
 
 class RescueGroupsClientTests(SimpleTestCase):
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_iter_orgs_one_page(self, mget):
         mget.return_value = _mock_resp({
             "data": [
@@ -30,7 +31,7 @@ class RescueGroupsClientTests(SimpleTestCase):
         self.assertEqual(orgs[0].external_org_id, "1")
         self.assertEqual(orgs[0].name, "Org1")
 
-    @mock.patch("requests.get")
+    @mock.patch("requests.Session.get")
     def test_iter_pets_available_dogs(self, mget):
         mget.return_value = _mock_resp({
             "data": [
@@ -48,3 +49,58 @@ class RescueGroupsClientTests(SimpleTestCase):
         self.assertEqual(pets[0].external_org_id, "1")
         self.assertEqual(pets[0].species, "DOG")
         self.assertTrue(pets[0].photos)
+
+    @mock.patch("requests.Session.get")
+    def test_orgs_harvested_from_included_are_not_refetched(self, mget):
+        mget.side_effect = [
+            _mock_resp({
+                "data": [
+                    {"id": "99", "type": "animals", "attributes": {"name": "Bella"},
+                     "relationships": {"orgs": {"data": [{"type": "orgs", "id": "1"}]}}},
+                    {"id": "100", "type": "animals", "attributes": {"name": "Max"},
+                     "relationships": {"orgs": {"data": [{"type": "orgs", "id": "2"}]}}},
+                ],
+                "meta": {"pages": 1},
+                "included": [
+                    {"id": "1", "type": "orgs", "attributes": {"name": "Org1", "city": "LA", "state": "CA", "postalcode": "90012"}},
+                    # id-only stub must not shadow the real record
+                    {"id": "2", "type": "orgs"},
+                ],
+            }),
+            _mock_resp({"data": {"id": "2", "type": "orgs", "attributes": {"name": "Org2"}}}),
+        ]
+
+        c = RescueGroupsClient(api_key="k", base_url="https://api.rescuegroups.org/v5")
+        pets = list(c.iter_pets(limit=5))
+        self.assertEqual(len(pets), 2)
+
+        harvested = c.included_orgs(["1", "2"])
+        self.assertEqual([o.external_org_id for o in harvested], ["1"])
+        self.assertEqual(harvested[0].postal_code, "90012")
+
+        orgs = c.fetch_orgs(["2", "1"])
+        self.assertEqual([(o.external_org_id, o.name) for o in orgs], [("1", "Org1"), ("2", "Org2")])
+        # 1 animal page + 1 org lookup (org 1 came from included)
+        self.assertEqual(mget.call_count, 2)
+        self.assertTrue(mget.call_args_list[1].args[0].endswith("/public/orgs/2"))
+
+    @mock.patch("requests.Session.get")
+    @mock.patch("requests.Session.post")
+    def test_iter_pets_updated_since_posts_filter(self, mpost, mget):
+        mpost.return_value = _mock_resp({
+            "data": [{"id": "7", "type": "animals", "attributes": {"name": "Rex"}}],
+            "meta": {"pages": 1},
+            "included": [],
+        })
+
+        c = RescueGroupsClient(api_key="k", base_url="https://api.rescuegroups.org/v5")
+        since = datetime(2026, 3, 1, 12, 30, tzinfo=timezone(timedelta(hours=-8)))
+        pets = list(c.iter_pets(limit=5, updated_since=since))
+
+        self.assertEqual([p.external_pet_id for p in pets], ["7"])
+        mget.assert_not_called()
+        body = mpost.call_args.kwargs["json"]
+        self.assertEqual(
+            body["data"]["filters"],
+            [{"fieldName": "animals.updatedDate", "operation": "greaterthan", "criteria": "2026-03-01T20:30:00Z"}],
+        )
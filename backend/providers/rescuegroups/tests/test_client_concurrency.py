@@ -0,0 +1,126 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from django.test import SimpleTestCase
+
+from providers.rescuegroups.client import RescueGroupsClient, RescueGroupsRateLimited
+
+
+class _StubState:
+    def __init__(self, total_pets, latency_s=0.0, rate_limit_pages=(), always_429=False):
+        self.total_pets = total_pets
+        self.latency_s = latency_s
+        self.rate_limit_pages = set(rate_limit_pages)
+        self.always_429 = always_429
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.hits = []
+
+
+def _make_handler(state: _StubState):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            qs = parse_qs(urlparse(self.path).query)
+            page = int(qs["page"][0])
+            size = int(qs["limit"][0])
+
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+                state.hits.append(page)
+                limited = state.always_429 or page in state.rate_limit_pages
+                # Each rate limited page answers 429 once, then succeeds
+                state.rate_limit_pages.discard(page)
+
+            try:
+                time.sleep(state.latency_s)
+                if limited:
+                    self.send_response(429)
+                    self.send_header("Retry-After", "0")
+                    self.end_headers()
+                    self.wfile.write(b"slow down")
+                    return
+
+                start = (page - 1) * size
+                ids = range(start, min(start + size, state.total_pets))
+                body = json.dumps({
+                    "data": [
+                        {
+                            "id": str(i),
+                            "type": "animals",
+                            "attributes": {"name": f"Pet {i}"},
+                            "relationships": {"orgs": {"data": [{"type": "orgs", "id": "1"}]}},
+                        }
+                        for i in ids
+                    ],
+                    "meta": {"pages": -(-state.total_pets // size)},
+                    "included": [],
+                }).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/vnd.api+json")
+                self.end_headers()
+                self.wfile.write(body)
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+    return Handler
+
+
+class RescueGroupsConcurrentFetchTests(SimpleTestCase):
+    def _serve(self, state: _StubState) -> str:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(state))
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_address[1]}"
+
+    def _client(self, base_url, **kwargs):
+        kwargs.setdefault("backoff_base_s", 0.0)
+        kwargs.setdefault("page_size", 5)
+        return RescueGroupsClient(api_key="k", base_url=base_url, **kwargs)
+
+    def test_concurrent_pages_are_yielded_in_order(self):
+        state = _StubState(total_pets=40, latency_s=0.05)
+        client = self._client(self._serve(state), max_concurrency=4)
+
+        ids = [p.external_pet_id for p in client.iter_pets(limit=40)]
+
+        self.assertEqual(ids, [str(i) for i in range(40)])
+        self.assertGreater(state.max_in_flight, 1)
+
+    def test_matches_sequential_mode(self):
+        state = _StubState(total_pets=23)
+        base_url = self._serve(state)
+
+        # limit is a multiple of the page size so both modes request the same pages
+        sequential = [p.external_pet_id for p in self._client(base_url).iter_pets(limit=10)]
+        concurrent = [p.external_pet_id for p in self._client(base_url, max_concurrency=3).iter_pets(limit=10)]
+
+        self.assertEqual(concurrent, sequential)
+
+    def test_rate_limited_pages_back_off_and_retry(self):
+        state = _StubState(total_pets=30, latency_s=0.01, rate_limit_pages={2, 3, 5})
+        client = self._client(self._serve(state), max_concurrency=4)
+
+        ids = [p.external_pet_id for p in client.iter_pets(limit=30)]
+
+        self.assertEqual(ids, [str(i) for i in range(30)])
+        for page in (2, 3, 5):
+            self.assertEqual(state.hits.count(page), 2)
+
+    def test_gives_up_after_max_retries(self):
+        state = _StubState(total_pets=10, always_429=True)
+        client = self._client(self._serve(state), max_concurrency=2, max_retries=2)
+
+        with self.assertRaises(RescueGroupsRateLimited):
+            list(client.iter_pets(limit=10))
+        self.assertEqual(len(state.hits), 3)
@@ -0,0 +1,107 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from django.test import SimpleTestCase
+
+from providers.rescuegroups.client import RescueGroupsAPIError, RescueGroupsClient, RescueGroupsRetryableError
+
+
+class _Stub:
+    def __init__(self, statuses):
+        # Status codes answered in order, then 200 forever
+        self.statuses = list(statuses)
+        self.lock = threading.Lock()
+        self.client_ports = []
+        self.requests = 0
+
+
+def _make_handler(stub: _Stub):
+    class Handler(BaseHTTPRequestHandler):
+        # HTTP/1.1 so the client can keep the connection alive
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with stub.lock:
+                stub.requests += 1
+                stub.client_ports.append(self.client_address[1])
+                status = stub.statuses.pop(0) if stub.statuses else 200
+
+            if status == 200:
+                body = json.dumps({
+                    "data": [{"id": "1", "type": "orgs", "attributes": {"name": "Org1"}}],
+                    "meta": {"pages": 1},
+                }).encode("utf-8")
+            else:
+                body = b"nope"
+
+            self.send_response(status)
+            if status in (429, 503):
+                self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return Handler
+
+
+class RescueGroupsClientHttpTests(SimpleTestCase):
+    def _client(self, stub: _Stub, **kwargs) -> RescueGroupsClient:
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(stub))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+
+        kwargs.setdefault("backoff_base_s", 0.0)
+        client = RescueGroupsClient(api_key="k", base_url=f"http://127.0.0.1:{server.server_address[1]}", **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_session_reuses_one_connection(self):
+        stub = _Stub([])
+        client = self._client(stub)
+
+        for _ in range(3):
+            self.assertEqual(len(list(client.iter_orgs(org_id="1"))), 1)
+
+        self.assertEqual(stub.requests, 3)
+        self.assertEqual(len(set(stub.client_ports)), 1)
+
+    def test_retries_5xx_and_429_then_succeeds(self):
+        stub = _Stub([503, 500, 429])
+        client = self._client(stub)
+
+        orgs = list(client.iter_orgs(org_id="1"))
+
+        self.assertEqual(len(orgs), 1)
+        self.assertEqual(stub.requests, 4)
+        self.assertEqual(client.http_stats.requests, 4)
+        self.assertEqual(client.http_stats.retries, 3)
+        self.assertEqual(client.http_stats.errors, 3)
+        self.assertGreater(client.http_stats.total_s, 0.0)
+
+    def test_gives_up_after_max_retries(self):
+        stub = _Stub([502, 502, 502])
+        client = self._client(stub, max_retries=2)
+
+        with self.assertRaises(RescueGroupsRetryableError):
+            list(client.iter_orgs(org_id="1"))
+        self.assertEqual(stub.requests, 3)
+
+    def test_4xx_is_not_retried(self):
+        stub = _Stub([404])
+        client = self._client(stub)
+
+        with self.assertRaises(RescueGroupsAPIError):
+            list(client.iter_orgs(org_id="1"))
+        self.assertEqual(stub.requests, 1)
+
+    def test_backoff_honors_retry_after_and_caps_jitter(self):
+        client = RescueGroupsClient(api_key="k", backoff_base_s=1.0, backoff_max_s=4.0)
+
+        self.assertEqual(client._backoff_s(0, retry_after_s=2.5), 2.5)
+        for attempt in range(6):
+            self.assertLessEqual(client._backoff_s(attempt, retry_after_s=None), 4.0)
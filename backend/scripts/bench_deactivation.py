@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+
+from bench_utils import setup_django
+
+# Usage: python scripts/bench_deactivation.py [sizes...]
+# End-of-sync deactivation: `.exclude(external_id__in=<every seen id>)` vs the
+# sync_generation predicate, on a catalog where 1% of pets dropped out of the feed.
+# Needs a migrated database; every run is rolled back.
+
+DEFAULT_SIZES = [10_000, 50_000, 100_000]
+SOURCE = "BENCH"
+OLD_GEN, NEW_GEN = 1, 2
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _seed(n: int):
+    from adoption.models import Organization, Pet
+
+    org = Organization.objects.create(source=SOURCE, source_org_id="O1", name="Bench Org")
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    seen = set()
+    pets = []
+    for i in range(n):
+        # Every 100th pet is missing from this sync
+        is_seen = i % 100 != 0
+        if is_seen:
+            seen.add(f"P{i}")
+        pets.append(Pet(
+            pet_id=uuid.uuid4(),
+            source=SOURCE,
+            external_id=f"P{i}",
+            organization=org,
+            name=f"Pet {i}",
+            listed_at=now,
+            sync_generation=NEW_GEN if is_seen else OLD_GEN,
+        ))
+    Pet.objects.bulk_create(pets, batch_size=5000)
+    return seen
+
+
+def _timed(n: int, deactivate) -> tuple:
+    from django.db import connection, transaction
+    from django.test.utils import CaptureQueriesContext
+
+    try:
+        with transaction.atomic():
+            seen = _seed(n)
+            with CaptureQueriesContext(connection) as ctx:
+                t0 = time.perf_counter()
+                count = deactivate(seen)
+                elapsed = time.perf_counter() - t0
+            sql_bytes = sum(len(q["sql"]) for q in ctx.captured_queries)
+            raise _Rollback()
+    except _Rollback:
+        pass
+    return elapsed, sql_bytes, count
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from adoption.models import Pet
+
+    def id_list(seen):
+        return (
+            Pet.objects.filter(source=SOURCE, status="ACTIVE")
+            .exclude(external_id__in=seen)
+            .update(status="INACTIVE")
+        )
+
+    def generation(seen):
+        return (
+            Pet.objects.filter(source=SOURCE, status="ACTIVE")
+            .exclude(sync_generation=NEW_GEN)
+            .update(status="INACTIVE")
+        )
+
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+
+    print("Stale-pet deactivation (s / SQL bytes sent):")
+    for n in sizes:
+        old_s, old_bytes, old_count = _timed(n, id_list)
+        new_s, new_bytes, new_count = _timed(n, generation)
+        assert old_count == new_count, (old_count, new_count)
+        print(
+            f"  n={n:<8} id_list={old_s:.3f}s/{old_bytes}B "
+            f"generation={new_s:.3f}s/{new_bytes}B deactivated={new_count}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import sys
+import uuid
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_feed_exclusions.py [n_pets] [work_mem] [histories...]
+#   e.g. python scripts/bench_feed_exclusions.py 50000 64kB 0 1000 5000
+# Feed candidate fetch for one user as their PetSeen history grows:
+# NOT IN (subquery) exclusions (before), the NOT EXISTS anti-join fallback, and the
+# cached FeedExclusionService array (one uuid[] parameter) used by PetFeedService.
+# NOT IN needs the whole history hashed in work_mem; a small work_mem shows the cliff
+# (expect tens of seconds per legacy call there). Every run is rolled back.
+
+DEFAULT_PETS = 50_000
+DEFAULT_HISTORIES = [0, 1_000, 5_000, 20_000]
+OTHER_USERS = 20
+
+
+class _Rollback(Exception):
+    pass
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection, transaction
+    from django.db.models import Subquery
+    from django.test.utils import override_settings
+    from django.utils import timezone
+
+    from adoption.models import Application, Interest, Organization, Pet, PetSeen
+    from adoption.services.feed_exclusion_service import FeedExclusionService
+    from adoption.services.pet_feed_service import PetFeedService, MAX_CANDIDATES
+
+    n_pets = int(argv[0]) if argv else DEFAULT_PETS
+    work_mem = argv[1] if len(argv) > 1 else None
+    histories = [int(a) for a in argv[2:]] or DEFAULT_HISTORIES
+
+    User = get_user_model()
+
+    def fetch(qs):
+        return PetFeedService._fetch_candidates(qs)
+
+    def legacy_qs(user):
+        qs = Pet.objects.select_related("organization", "risk", "visibility").filter(status=Pet.Status.ACTIVE)
+        return (
+            qs
+            .exclude(pet_id__in=Subquery(Interest.objects.filter(user=user).values("pet_id")))
+            .exclude(pet_id__in=Subquery(Application.objects.filter(user=user).values("pet_id")))
+            .exclude(pet_id__in=Subquery(PetSeen.objects.filter(user=user).values("pet_id")))
+        )
+
+    print(f"Feed exclusion benchmark: pets={n_pets} work_mem={work_mem or 'server default'}")
+    try:
+        with transaction.atomic():
+            if work_mem:
+                with connection.cursor() as cur:
+                    cur.execute("SELECT set_config('work_mem', %s, true)", [work_mem])
+
+            now = timezone.now()
+            org = Organization.objects.create(source="BENCH", source_org_id="O1", name="Bench Org")
+            pets = [
+                Pet(
+                    pet_id=uuid.uuid4(),
+                    source="BENCH",
+                    external_id=f"P{i}",
+                    organization=org,
+                    name=f"Pet {i}",
+                    listed_at=now - timezone.timedelta(minutes=i),
+                )
+                for i in range(n_pets)
+            ]
+            Pet.objects.bulk_create(pets, batch_size=5000)
+
+            # Background history from other users, so the indexes are not all one user's rows
+            others = [User.objects.create(username=f"bench_other_{i}") for i in range(OTHER_USERS)]
+            PetSeen.objects.bulk_create(
+                [PetSeen(user=u, pet=pets[j]) for u in others for j in range(0, n_pets, 10)], batch_size=5000
+            )
+
+            # The heavy swiper has passed on the newest pets first, like a real feed session
+            user = User.objects.create(username="bench_heavy_swiper")
+            seeded = 0
+            for history in sorted(histories):
+                history = min(history, n_pets - MAX_CANDIDATES)
+                PetSeen.objects.bulk_create(
+                    [PetSeen(user=user, pet=p) for p in pets[seeded:history]], batch_size=5000
+                )
+                seeded = max(seeded, history)
+                with connection.cursor() as cur:
+                    cur.execute("ANALYZE adoption_petseen")
+                    cur.execute("ANALYZE adoption_pet")
+
+                def anti_join_qs():
+                    with override_settings(WOOFER_FEED_EXCLUSION_CACHE_ENABLED=False):
+                        return PetFeedService._base_queryset(user)
+
+                FeedExclusionService._cache().delete(FeedExclusionService._key(user.pk))
+                counts = {
+                    "legacy": len(fetch(legacy_qs(user))),
+                    "anti_join": len(fetch(anti_join_qs())),
+                    "array": len(fetch(PetFeedService._base_queryset(user))),
+                }
+                print(f"  history={history} candidates: " + " ".join(f"{k}={v}" for k, v in counts.items()))
+                print(format_row(f"NOT IN h={history}", time_calls(lambda: fetch(legacy_qs(user)), repeat=3)))
+                print(format_row(f"NOT EXISTS h={history}", time_calls(lambda: fetch(anti_join_qs()), repeat=3)))
+                # Includes the shared cache read of the array
+                print(format_row(
+                    f"array h={history}", time_calls(lambda: fetch(PetFeedService._base_queryset(user)), repeat=3)
+                ))
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
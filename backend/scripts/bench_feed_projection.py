@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import sys
+import uuid
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_feed_projection.py [n_pets] [raw_description_chars]
+# Bytes Postgres sends per feed request (the MAX_CANDIDATES candidate fetch) and per
+# interests page: whole select_related rows (before) vs the PetCardService projection.
+# Bytes = octet_length(row::text) summed over the result, i.e. the text-protocol row
+# payload psycopg receives. "Before" is the same query with the projection dropped.
+# Every run is rolled back.
+
+DEFAULT_PETS = 5_000
+DEFAULT_RAW_CHARS = 2_000
+INTERESTS = 50
+
+
+class _Rollback(Exception):
+    pass
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from django.contrib.auth import get_user_model
+    from django.db import connection, transaction
+    from django.db.models import F
+    from django.utils import timezone
+
+    from adoption.models import Interest, Organization, Pet
+    from adoption.services.interest_service import InterestService
+    from adoption.services.pet_feed_service import PetFeedService, MAX_CANDIDATES
+
+    n_pets = int(argv[0]) if argv else DEFAULT_PETS
+    raw_chars = int(argv[1]) if len(argv) > 1 else DEFAULT_RAW_CHARS
+
+    User = get_user_model()
+
+    def wire_bytes(qs):
+        sql, params = qs.query.sql_with_params()
+        with connection.cursor() as cur:
+            cur.execute(f"SELECT count(*), coalesce(sum(octet_length(t::text)), 0) FROM ({sql}) t", params)
+            return cur.fetchone()
+
+    def feed_order(qs):
+        return qs.order_by(F("visibility__final_score").desc(nulls_last=True), "-listed_at", "-pet_id")[:MAX_CANDIDATES]
+
+    print(f"Pet card projection benchmark: pets={n_pets} raw_description_chars={raw_chars}")
+    try:
+        with transaction.atomic():
+            now = timezone.now()
+            org = Organization.objects.create(
+                source="BENCH",
+                source_org_id="O1",
+                name="Bench Rescue",
+                contact_email="adopt@bench.example.org",
+                location="Los Angeles, CA",
+                postal_code="90066",
+            )
+            raw = ("Loves long walks and belly rubs. " * (raw_chars // 33 + 1))[:raw_chars]
+            pets = [
+                Pet(
+                    pet_id=uuid.uuid4(),
+                    source="BENCH",
+                    external_id=f"P{i}",
+                    organization=org,
+                    name=f"Pet {i}",
+                    size="M",
+                    age_group="ADULT",
+                    breed_primary="Labrador Retriever",
+                    listed_at=now - timezone.timedelta(minutes=i),
+                    photos=[f"https://photos.bench.example.org/{i}/{k}.jpg" for k in range(4)],
+                    raw_description=raw,
+                    ai_description="A friendly, easygoing companion who settles in quickly.",
+                    temperament_tags=["friendly", "house_trained"],
+                    special_needs_flags=[],
+                    description_features=0,
+                    content_hash="0" * 64,
+                )
+                for i in range(n_pets)
+            ]
+            Pet.objects.bulk_create(pets, batch_size=5000)
+
+            user = User.objects.create(username="bench_projection_user")
+            Interest.objects.bulk_create([Interest(user=user, pet=p) for p in pets[-INTERESTS:]])
+            with connection.cursor() as cur:
+                cur.execute("ANALYZE adoption_pet")
+
+            cases = [
+                # defer(None) drops the projection: same query, whole rows
+                (
+                    "feed candidates",
+                    lambda: feed_order(PetFeedService._base_queryset(user).defer(None)),
+                    lambda: feed_order(PetFeedService._base_queryset(user)),
+                ),
+                (
+                    "interests page",
+                    lambda: InterestService.list_interests(user).defer(None)[:INTERESTS],
+                    lambda: InterestService.list_interests(user)[:INTERESTS],
+                ),
+            ]
+            for label, before, after in cases:
+                rows, before_bytes = wire_bytes(before())
+                _, after_bytes = wire_bytes(after())
+                print(
+                    f"  {label}: rows={rows} bytes_before={before_bytes} bytes_after={after_bytes}"
+                    f" saved={1 - after_bytes / before_bytes if before_bytes else 0.0:.1%}"
+                )
+                print(format_row(f"{label} full rows", time_calls(lambda: list(before()), repeat=5)))
+                print(format_row(f"{label} card", time_calls(lambda: list(after()), repeat=5)))
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import random
+import sys
+from decimal import Decimal
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_geo_distance.py [sizes...]
+# Radius mask over N org coordinates (Decimal, as the ORM returns them):
+# per-point scalar haversine vs GeoDistanceService python / numpy batch.
+
+DEFAULT_SIZES = [500, 5_000, 50_000, 100_000]
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from adoption.services import geo_distance_service
+    from adoption.services.geo_distance_service import GeoDistanceService
+
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+    rng = random.Random(11)
+    center = (34.0537, -118.2428)
+
+    def scalar(lats, lons):
+        return [
+            (d is not None and d <= 50.0)
+            for d in (GeoDistanceService.haversine_miles(*center, a, b) for a, b in zip(lats, lons))
+        ]
+
+    print("Haversine radius mask (ms):")
+    for n in sizes:
+        lats = [Decimal(f"{rng.uniform(25, 49):.6f}") for _ in range(n)]
+        lons = [Decimal(f"{rng.uniform(-124, -67):.6f}") for _ in range(n)]
+        repeat = 20 if n <= 5_000 else 5
+
+        print(format_row(f"scalar n={n}", time_calls(lambda: scalar(lats, lons), repeat=repeat)))
+        print(format_row(
+            f"batch python n={n}",
+            time_calls(lambda: GeoDistanceService.within_radius(*center, lats, lons, 50, backend="python"), repeat=repeat),
+        ))
+        if geo_distance_service.np is not None:
+            print(format_row(
+                f"batch numpy n={n}",
+                time_calls(lambda: GeoDistanceService.within_radius(*center, lats, lons, 50, backend="numpy"), repeat=repeat),
+            ))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
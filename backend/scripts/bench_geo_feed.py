@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import random
+import sys
+import uuid
+from decimal import Decimal
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_geo_feed.py [n_orgs] [pets_per_org]
+# Distance-filtered candidate fetch: legacy Decimal bounding box + Python haversine
+# after the cap vs geohash prefix cover + SQL haversine before the cap.
+# Orgs are spread over the continental US; every run is rolled back.
+
+DEFAULT_ORGS = 10_000
+DEFAULT_PETS_PER_ORG = 3
+RADII = [10, 25, 50, 100]
+CENTERS = [
+    (34.0537, -118.2428),  # Los Angeles
+    (40.7128, -74.0060),   # New York
+    (41.8781, -87.6298),   # Chicago
+    (29.7604, -95.3698),   # Houston
+    (39.7392, -104.9903),  # Denver
+]
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _seed(n_orgs: int, pets_per_org: int) -> None:
+    from django.db import connection
+    from django.utils import timezone
+
+    from adoption.models import Organization, Pet
+    from adoption.services.geohash_service import GeohashService
+
+    rng = random.Random(42)
+    now = timezone.now()
+    orgs = []
+    for i in range(n_orgs):
+        # Half clustered around metro centers, half uniform
+        if i % 2:
+            c_lat, c_lon = CENTERS[i % len(CENTERS)]
+            lat, lon = c_lat + rng.gauss(0, 1.5), c_lon + rng.gauss(0, 1.5)
+        else:
+            lat, lon = rng.uniform(25.0, 49.0), rng.uniform(-124.0, -67.0)
+        lat, lon = round(lat, 6), round(lon, 6)
+        orgs.append(Organization(
+            organization_id=uuid.uuid4(),
+            source="BENCH",
+            source_org_id=f"O{i}",
+            name=f"Org {i}",
+            latitude=Decimal(str(lat)),
+            longitude=Decimal(str(lon)),
+            geohash=GeohashService.encode(lat, lon),
+        ))
+    Organization.objects.bulk_create(orgs, batch_size=5000)
+
+    pets = [
+        Pet(
+            pet_id=uuid.uuid4(),
+            source="BENCH",
+            external_id=f"P{i}-{k}",
+            organization=org,
+            name=f"Pet {i}-{k}",
+            listed_at=now - timezone.timedelta(minutes=rng.randint(0, 100_000)),
+        )
+        for i, org in enumerate(orgs)
+        for k in range(pets_per_org)
+    ]
+    Pet.objects.bulk_create(pets, batch_size=5000)
+
+    with connection.cursor() as cur:
+        cur.execute("ANALYZE adoption_organization")
+        cur.execute("ANALYZE adoption_pet")
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from unittest import mock
+    from django.db import transaction
+    from django.db.models import F
+
+    from adoption.models import AdopterProfile, Pet
+    from adoption.services import pet_feed_service
+    from adoption.services.pet_feed_service import PetFeedService, MAX_CANDIDATES
+
+    n_orgs = int(argv[0]) if argv else DEFAULT_ORGS
+    pets_per_org = int(argv[1]) if len(argv) > 1 else DEFAULT_PETS_PER_ORG
+
+    def ordered(qs):
+        return qs.order_by(F("visibility__final_score").desc(nulls_last=True), "-listed_at", "-pet_id")
+
+    def legacy(center, miles):
+        lat, lon = center
+        lat_d, lon_d = PetFeedService._bbox_deltas_miles(lat, miles)
+        qs = Pet.objects.select_related("organization").filter(
+            status=Pet.Status.ACTIVE,
+            organization__latitude__gte=Decimal(str(lat - lat_d)),
+            organization__latitude__lte=Decimal(str(lat + lat_d)),
+            organization__longitude__gte=Decimal(str(lon - lon_d)),
+            organization__longitude__lte=Decimal(str(lon + lon_d)),
+        )
+        capped = list(ordered(qs)[:MAX_CANDIDATES])
+        return [
+            p for p in capped
+            if PetFeedService._within_radius_miles(lat, lon, p.organization.latitude, p.organization.longitude, miles)
+        ]
+
+    def indexed(center, miles):
+        profile = AdopterProfile(home_postal_code="00000", preferences={"max_distance_miles": miles})
+        with mock.patch.object(pet_feed_service.ZipGeoService, "lookup", return_value=center):
+            qs, _ = PetFeedService._apply_profile_filters(
+                Pet.objects.select_related("organization").filter(status=Pet.Status.ACTIVE), profile
+            )
+        return list(ordered(qs)[:MAX_CANDIDATES])
+
+    print(f"Geo feed benchmark: orgs={n_orgs} pets={n_orgs * pets_per_org} cap={MAX_CANDIDATES}")
+    try:
+        with transaction.atomic():
+            _seed(n_orgs, pets_per_org)
+            for miles in RADII:
+                legacy_n = sum(len(legacy(c, miles)) for c in CENTERS)
+                indexed_n = sum(len(indexed(c, miles)) for c in CENTERS)
+                print(f"  radius={miles}mi in-radius candidates: legacy={legacy_n} indexed={indexed_n}")
+                print(format_row(
+                    f"legacy bbox r={miles}", time_calls(lambda: [legacy(c, miles) for c in CENTERS], repeat=20)
+                ))
+                print(format_row(
+                    f"geohash+sql r={miles}", time_calls(lambda: [indexed(c, miles) for c in CENTERS], repeat=20)
+                ))
+            raise _Rollback()
+    except _Rollback:
+        pass
+
+    print("  (timings are per 5-center batch)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
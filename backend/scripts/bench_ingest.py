@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+from bench_utils import setup_django
+
+# Usage: python scripts/bench_ingest.py [sizes...]
+# Row-by-row upserts vs IngestionService.ingest_canonical on synthetic canonical dicts.
+# Needs a migrated database (normal settings/env); every run is rolled back.
+
+DEFAULT_SIZES = [1_000, 10_000]
+ORG_COUNT = 200
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _synthetic_dicts(n: int):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    org_dicts = [
+        {
+            "source": "BENCH",
+            "source_org_id": f"O{i}",
+            "name": f"Org {i}",
+            "location": "Los Angeles, CA",
+            "postal_code": "90012",
+            "is_active": True,
+        }
+        for i in range(ORG_COUNT)
+    ]
+    pet_dicts = [
+        {
+            "source": "BENCH",
+            "external_id": f"P{i}",
+            "organization_source_org_id": f"O{i % ORG_COUNT}",
+            "name": f"Pet {i}",
+            "species": "DOG",
+            "size": "M",
+            "photos": [f"https://example.com/{i}.jpg"],
+            "raw_description": "Sweet, gentle and active dog.",
+            "ai_description": "A gentle pup.",
+            "listed_at": base - timedelta(hours=i),
+            "status": "ACTIVE",
+        }
+        for i in range(n)
+    ]
+    return org_dicts, pet_dicts
+
+
+def _timed_rollback(fn) -> float:
+    from django.db import transaction
+
+    t0 = time.perf_counter()
+    try:
+        with transaction.atomic():
+            fn()
+            elapsed = time.perf_counter() - t0
+            raise _Rollback()
+    except _Rollback:
+        pass
+    return elapsed
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from adoption.services.ingestion_service import IngestionService
+    from adoption.services.pet_enrichment_service import PetEnrichmentService
+    from adoption.services.visibility_score_service import VisibilityScoreService
+
+    def row_by_row(org_dicts, pet_dicts):
+        for org in org_dicts:
+            IngestionService.upsert_organization(org)
+        touched = []
+        for pet in pet_dicts:
+            p, _, skipped = IngestionService.upsert_pet(pet)
+            if not skipped:
+                touched.append(p)
+        PetEnrichmentService.enrich_missing_ai_descriptions(touched)
+        VisibilityScoreService.refresh_for_pets(touched)
+
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+
+    print("Ingest benchmark (s), fresh insert:")
+    for n in sizes:
+        org_dicts, pet_dicts = _synthetic_dicts(n)
+
+        rows = _timed_rollback(lambda: row_by_row(org_dicts, pet_dicts))
+        bulk = _timed_rollback(lambda: IngestionService.ingest_canonical(org_dicts, pet_dicts))
+
+        print(f"  n={n:<8} row_by_row={rows:.2f} bulk={bulk:.2f} speedup={rows / max(bulk, 1e-9):.1f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import io
+import resource
+import subprocess
+import sys
+import time
+
+from bench_utils import setup_django, BACKEND_DIR
+
+# Usage: python scripts/bench_ingest_stream.py [n_pets] [batch_sizes...]
+# Peak RSS of `ingest_provider --dry-run` against a synthetic provider feed.
+# Each batch size runs in its own process (ru_maxrss is a per-process high-water mark);
+# batch size 0 = whole feed in one batch (the pre-streaming behaviour).
+# Needs a migrated database; dry-run rolls everything back.
+
+DEFAULT_PETS = 100_000
+DEFAULT_BATCH_SIZES = [0, 250]
+ORG_COUNT = 500
+
+
+class SyntheticProvider:
+    """
+    Lazy feed shaped like RescueGroups output, including a JSON:API `raw` row per pet.
+    """
+
+    provider_name = "rescuegroups"
+
+    def __init__(self, n_pets: int):
+        self.n_pets = n_pets
+
+    def iter_orgs(self, *, limit=100, org_id=None):
+        from providers.base import ProviderOrg
+
+        yield ProviderOrg(
+            provider="rescuegroups",
+            external_org_id=org_id,
+            name=f"Org {org_id}",
+            city="Los Angeles",
+            state="CA",
+            postal_code="90012",
+            raw={"id": org_id, "type": "orgs"},
+        )
+
+    def iter_pets(self, *, limit=100, org_id=None):
+        from providers.base import ProviderPet
+
+        description = "Sweet, gentle and active dog who loves walks. " * 8
+        for i in range(min(limit, self.n_pets)):
+            photos = [f"https://cdn.example.com/pets/{i}/{k}.jpg?width=800" for k in range(3)]
+            yield ProviderPet(
+                provider="rescuegroups",
+                external_pet_id=f"BENCH{i}",
+                external_org_id=f"BORG{i % ORG_COUNT}",
+                name=f"Pet {i}",
+                species="DOG",
+                age_group="ADULT",
+                size="M",
+                sex="FEMALE",
+                photos=photos,
+                raw_description=description,
+                listed_at_iso="2026-01-01T00:00:00+00:00",
+                status="Available",
+                raw={
+                    "id": str(i),
+                    "type": "animals",
+                    "attributes": {"name": f"Pet {i}", "descriptionText": description, "pictureThumbnailUrl": photos[0]},
+                    "relationships": {"pictures": {"data": [{"type": "pictures", "id": f"{i}-{k}"} for k in range(3)]}},
+                },
+            )
+
+
+def _run_one(n_pets: int, batch_size: int) -> None:
+    setup_django()
+
+    from unittest import mock
+    from django.core.management import call_command
+
+    provider = SyntheticProvider(n_pets)
+    t0 = time.perf_counter()
+    with mock.patch("adoption.management.commands.ingest_provider.get_provider_client", return_value=provider):
+        call_command(
+            "ingest_provider",
+            "--provider", "rescuegroups",
+            "--limit", str(n_pets),
+            "--batch-size", str(batch_size),
+            "--dry-run",
+            stdout=io.StringIO(),
+        )
+    elapsed = time.perf_counter() - t0
+
+    # ru_maxrss is KiB on Linux
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+    print(f"  n={n_pets} batch_size={batch_size:<6} peak_rss_mib={peak_mib:.1f} elapsed_s={elapsed:.1f}")
+
+
+def main(argv) -> int:
+    if argv and argv[0] == "--child":
+        _run_one(int(argv[1]), int(argv[2]))
+        return 0
+
+    n_pets = int(argv[0]) if argv else DEFAULT_PETS
+    batch_sizes = [int(a) for a in argv[1:]] or DEFAULT_BATCH_SIZES
+
+    print("Streaming ingest benchmark (dry-run):")
+    for size in batch_sizes:
+        subprocess.run(
+            [sys.executable, __file__, "--child", str(n_pets), str(size)],
+            cwd=str(BACKEND_DIR),
+            check=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
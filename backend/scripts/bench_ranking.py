@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_ranking.py [sizes...]
+# Compares RankingService python vs numpy backends on synthetic (unsaved) pets.
+
+DEFAULT_SIZES = [500, 5_000, 50_000]
+
+
+def _synthetic_pets(n: int, seed: int):
+    """
+    Unsaved pets with risk/visibility caches set the way select_related leaves them.
+    """
+    from adoption.models import Organization, Pet, RiskClassification
+
+    rnd = random.Random(seed)
+    org = Organization(source="BENCH", source_org_id="O1", name="Org")
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    descriptions = ["", "An active pup", "Energetic and gentle", "Easy going", "Quiet and shy"]
+
+    pets = []
+    for i in range(n):
+        pet = Pet(
+            source="BENCH",
+            external_id=f"p{i}",
+            organization=org,
+            name=f"Pet {i}",
+            listed_at=base - timedelta(hours=rnd.randint(0, 24 * 90)),
+            size=rnd.choice([None, "S", "M", "L", "XL"]),
+            ai_description=rnd.choice(descriptions),
+        )
+        risk = None
+        if rnd.random() < 0.4:
+            risk = RiskClassification(
+                pet=pet,
+                is_long_stay=rnd.random() < 0.4,
+                is_senior=rnd.random() < 0.3,
+                is_medical=rnd.random() < 0.3,
+            )
+        pet._state.fields_cache["risk"] = risk
+        pet._state.fields_cache["visibility"] = None
+        pets.append(pet)
+    return pets
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from adoption.models import AdopterProfile
+    from adoption.services.ranking_service import RankingService
+    from adoption.services.vectorized_ranking_service import VectorizedRankingService
+
+    if not VectorizedRankingService.is_available():
+        print("numpy not installed; nothing to compare", file=sys.stderr)
+        return 2
+
+    sizes = [int(a) for a in argv] or DEFAULT_SIZES
+    profile = AdopterProfile(
+        home_type=AdopterProfile.HomeType.APARTMENT,
+        activity_level=AdopterProfile.ActivityLevel.HIGH,
+        experience_level=AdopterProfile.ExperienceLevel.NEW,
+    )
+
+    print("Ranking benchmark (ms):")
+    for n in sizes:
+        pets = _synthetic_pets(n, seed=1)
+        repeat = 5 if n <= 5_000 else 3
+
+        py = time_calls(lambda: RankingService.rank_python(pets, profile=profile), repeat=repeat)
+        vec = time_calls(lambda: VectorizedRankingService.rank(pets, profile=profile), repeat=repeat)
+
+        print(format_row(f"n={n} python", py))
+        print(format_row(f"n={n} numpy", vec))
+        print(f"  n={n} speedup(median)={py['median_ms'] / max(vec['median_ms'], 1e-9):.2f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
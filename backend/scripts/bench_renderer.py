@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import sys
+import uuid
+from types import SimpleNamespace
+
+from bench_utils import setup_django, time_calls, format_row
+
+# Usage: python scripts/bench_renderer.py [n_items] [n_renders]
+# Envelope rendering of one feed page (PetFeedItemSerializer output, ReturnList of ReturnDicts):
+# EnvelopeJSONRenderer (DRF json encoder) vs FastEnvelopeJSONRenderer (orjson).
+# Pets are built in memory, no database needed.
+
+DEFAULT_ITEMS = 50
+DEFAULT_RENDERS = 1_000
+
+
+def main(argv) -> int:
+    setup_django()
+
+    from django.utils import timezone
+
+    from adoption.api.serializers.pets_feed import PetFeedItemSerializer
+    from adoption.models import Organization, Pet
+    from core import renderers
+    from core.renderers import EnvelopeJSONRenderer, FastEnvelopeJSONRenderer
+
+    n_items = int(argv[0]) if argv else DEFAULT_ITEMS
+    n_renders = int(argv[1]) if len(argv) > 1 else DEFAULT_RENDERS
+
+    now = timezone.now()
+    org = Organization(organization_id=uuid.uuid4(), name="Bench Rescue", location="Los Angeles, CA")
+    pets = [
+        Pet(
+            pet_id=uuid.uuid4(),
+            organization=org,
+            name=f"Pet {i}",
+            age_group="ADULT",
+            size="M",
+            listed_at=now,
+            photos=[f"https://photos.bench.example.org/{i}/{k}.jpg" for k in range(4)],
+            ai_description="A friendly, easygoing companion who settles in quickly and loves walks.",
+            temperament_tags=["friendly", "house_trained", "good_with_kids"],
+            apply_url=f"https://bench.example.org/apply/{i}",
+            apply_hint="Apply via Bench Rescue",
+        )
+        for i in range(n_items)
+    ]
+    why_shown_map = {str(p.pet_id): ["LONG_STAY_BOOST"] if i % 3 == 0 else [] for i, p in enumerate(pets)}
+    data = {
+        "items": PetFeedItemSerializer(pets, many=True, context={"why_shown_map": why_shown_map}).data,
+        "next_cursor": "opaque_cursor",
+    }
+    context = {
+        "request": SimpleNamespace(request_id=str(uuid.uuid4()), request_timestamp=now.isoformat()),
+        "response": SimpleNamespace(status_code=200),
+    }
+
+    stock, fast = EnvelopeJSONRenderer(), FastEnvelopeJSONRenderer()
+    body = stock.render(data, "application/json", context)
+    same = fast.render(data, "application/json", context) == body
+    print(
+        f"Envelope renderer benchmark: items={n_items} renders={n_renders} body_bytes={len(body)}"
+        f" orjson={'yes' if renderers.orjson is not None else 'no (fallback)'} identical_bytes={same}"
+    )
+
+    for label, renderer in (("DRF json", stock), ("orjson", fast)):
+        stats = time_calls(lambda: [renderer.render(data, "application/json", context) for _ in range(n_renders)])
+        per_render = {k.replace("_ms", "_us"): v * 1000.0 / n_renders for k, v in stats.items()}
+        print(format_row(f"{label} per page", per_render))
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
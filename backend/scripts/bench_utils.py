@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+# Benchmarks run from backend/ (python scripts/bench_*.py) with the normal settings/env
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django() -> None:
+    if str(BACKEND_DIR) not in sys.path:
+        sys.path.insert(0, str(BACKEND_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+
+    import django
+
+    django.setup()
+
+
+def time_calls(fn: Callable[[], object], repeat: int = 5) -> Dict[str, float]:
+    """
+    Runs fn `repeat` times, returns timing summary in milliseconds.
+    """
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000.0)
+
+    samples.sort()
+    p95_idx = min(len(samples) - 1, int(round(0.95 * (len(samples) - 1))))
+    return {
+        "min_ms": samples[0],
+        "median_ms": statistics.median(samples),
+        "p95_ms": samples[p95_idx],
+    }
+
+
+def format_row(label: str, stats: Dict[str, float]) -> str:
+    parts = [f"{k}={v:.3f}" for k, v in stats.items()]
+    return f"  {label:<28} " + " ".join(parts)
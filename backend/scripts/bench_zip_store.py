@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+import time
+
+from bench_utils import setup_django, time_calls, format_row, BACKEND_DIR
+
+# Usage: python scripts/bench_zip_store.py [n_lookups]
+# ZipGeoService cold start + memory: CSV -> dict vs memory-mapped binary file,
+# then spatial query latency (grid built once per process from either store).
+# Each store runs in its own process so the first lookup is really cold.
+# RSS is split into anonymous (private per worker) and file-backed (page cache,
+# shared by every worker mapping the same file). Linux only (/proc/self/status).
+
+DEFAULT_LOOKUPS = 10_000
+STORES = ["csv", "binary"]
+SPATIAL_QUERIES = 200
+CENTERS = [
+    (34.0537, -118.2428),  # Los Angeles
+    (40.7128, -74.0060),   # New York
+    (44.0, -103.0),        # rural South Dakota
+]
+
+
+def _rss_kib() -> dict:
+    out = {}
+    with open("/proc/self/status", encoding="ascii") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("RssAnon", "RssFile"):
+                out[key] = int(value.split()[0])
+    return out
+
+
+def _run_one(store: str, n_lookups: int) -> None:
+    setup_django()
+
+    from adoption.services.zip_geo_service import ZipGeoService
+
+    if store == "csv":
+        # Same code path as a deploy without the .bin file
+        ZipGeoService._load_binary = classmethod(lambda cls: None)
+
+    before = _rss_kib()
+    t0 = time.perf_counter()
+    ZipGeoService.lookup("90066")
+    cold_ms = (time.perf_counter() - t0) * 1000.0
+    after = _rss_kib()
+
+    zips = ["%05d" % z for z in random.Random(7).sample(range(600, 99_999), n_lookups)]
+    stats = time_calls(lambda: [ZipGeoService.lookup(z) for z in zips], repeat=5)
+    settled = _rss_kib()
+
+    print(
+        f"  {store:<7} loaded={ZipGeoService.count_loaded()} cold_first_lookup_ms={cold_ms:.2f}"
+        f" anon_delta_kib={after['RssAnon'] - before['RssAnon']}"
+        f" file_delta_kib_after_lookups={settled['RssFile'] - before['RssFile']}"
+    )
+    print(format_row(f"{store} {n_lookups} lookups", stats))
+
+    t0 = time.perf_counter()
+    ZipGeoService.nearest(*CENTERS[0])
+    print(f"  {store:<7} grid_build_ms={(time.perf_counter() - t0) * 1000.0:.1f}")
+
+    queries = [
+        ("nearest coord", lambda c: ZipGeoService.nearest(*c)),
+        ("zips within 25mi", lambda c: ZipGeoService.zips_within_radius(c[0], c[1], 25)),
+        ("zips within 100mi", lambda c: ZipGeoService.zips_within_radius(c[0], c[1], 100)),
+        ("resolve unknown zip", lambda c: ZipGeoService.resolve("90099")),
+    ]
+    for label, fn in queries:
+        stats = time_calls(lambda: [fn(c) for c in CENTERS for _ in range(SPATIAL_QUERIES)], repeat=3)
+        per_query = {k: v / (len(CENTERS) * SPATIAL_QUERIES) for k, v in stats.items()}
+        print(format_row(f"{store} {label}", per_query))
+
+
+def main(argv) -> int:
+    if argv and argv[0] == "--child":
+        _run_one(argv[1], int(argv[2]))
+        return 0
+
+    n_lookups = int(argv[0]) if argv else DEFAULT_LOOKUPS
+
+    print("ZIP centroid store benchmark (spatial rows are per query):")
+    for store in STORES:
+        subprocess.run(
+            [sys.executable, __file__, "--child", store, str(n_lookups)],
+            cwd=str(BACKEND_DIR),
+            check=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
@@ -6,6 +6,36 @@ from pathlib import Path
 
 # Input: Census Gazetteer ZCTA national file (tab-delimited)
 # Output: adoption/data/us_zip_centroids.csv with headers zip,lat,lon
+#         + adoption/data/us_zip_centroids.bin (sorted fixed-width records, memory-mapped by ZipGeoService)
+# Rebuild only the binary from an existing CSV:
+#   python scripts/build_zip_centroids.py --bin-from-csv adoption/data/us_zip_centroids.csv
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from adoption.services.zip_geo_service import pack_zip_centroids  # noqa: E402
+
+
+def write_binary(rows, out_csv: Path) -> Path:
+    bin_file = out_csv.with_suffix(".bin")
+    bin_file.write_bytes(pack_zip_centroids(rows))
+    return bin_file
+
+
+def bin_from_csv(csv_path: str) -> int:
+    csv_file = Path(csv_path)
+    if not csv_file.exists():
+        print(f"Input not found: {csv_file}", file=sys.stderr)
+        return 2
+
+    with csv_file.open("r", encoding="utf-8", newline="") as f:
+        rows = [(row["zip"], float(row["lat"]), float(row["lon"])) for row in csv.DictReader(f)]
+
+    bin_file = write_binary(rows, csv_file)
+    print(f"Wrote {len(rows)} rows -> {bin_file}")
+    return 0
+
 
 def main(in_path: str, out_path: str) -> int:
     in_file = Path(in_path)
@@ -18,6 +48,7 @@ def main(in_path: str, out_path: str) -> int:
 
     # Gazetteer columns include GEOID, INTPTLAT, INTPTLONG
     # GEOID is the 5-digit ZCTA code; lat/lon are representative internal point coords.
+    rows = []
     with in_file.open("r", encoding="utf-8", newline="") as fin, out_file.open("w", encoding="utf-8", newline="") as fout:
         reader = csv.DictReader(fin, delimiter="\t")
         writer = csv.DictWriter(fout, fieldnames=["zip", "lat", "lon"])
@@ -29,22 +60,29 @@ def main(in_path: str, out_path: str) -> int:
             lat = (row.get("INTPTLAT") or "").strip()
             lon = (row.get("INTPTLONG") or "").strip()
 
-            if len(geoid) != 5:
+            if len(geoid) != 5 or not geoid.isdigit():
                 continue
             try:
-                float(lat); float(lon)
+                rows.append((geoid, float(lat), float(lon)))
             except ValueError:
                 continue
 
             writer.writerow({"zip": geoid, "lat": lat, "lon": lon})
             written += 1
 
-    print(f"Wrote {written} rows -> {out_file}")
+    bin_file = write_binary(rows, out_file)
+    print(f"Wrote {written} rows -> {out_file}, {bin_file}")
     return 0
 
 
 if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--bin-from-csv":
+        raise SystemExit(bin_from_csv(sys.argv[2]))
     if len(sys.argv) != 3:
-        print("Usage: python scripts/build_zip_centroids.py <input_gazetteer_txt> <output_csv>", file=sys.stderr)
+        print(
+            "Usage: python scripts/build_zip_centroids.py <input_gazetteer_txt> <output_csv>\n"
+            "       python scripts/build_zip_centroids.py --bin-from-csv <zip_centroids_csv>",
+            file=sys.stderr,
+        )
         sys.exit(2)
-    raise SystemExit(main(sys.argv[1], sys.argv[2]))
\ No newline at end of file
+    raise SystemExit(main(sys.argv[1], sys.argv[2]))
@@ -33,12 +33,12 @@ def home(request):
         "blurb": "This pet was returned and may need extra visibility to find a stable home."
     },
 }
-        liked = api_get("/api/v1/interests")
-        liked_ids = set()
-        for item in liked.get("data", {}).get("items", []):
-            pet = item.get("pet", {})
-            if pet.get("pet_id"):
-                liked_ids.add(pet["pet_id"])
+        # Feed items carry is_interested; no need to pull the whole interests list
+        liked_ids = {
+            item["pet_id"]
+            for item in (api_result.get("data", {}).get("items") or [])
+            if item.get("is_interested") and item.get("pet_id")
+        }
 
         return render(request, "home.html", {"api_result": api_result, "liked_ids": liked_ids, "why_shown_copy": WHY_SHOWN_COPY})
     except WooferAPIError as e:
@@ -58,11 +58,9 @@ def _find_pet_in_feed(pet_id: str):
     
 def like_pet(request, pet_id):
     try:
-        before = api_get("/api/v1/interests")
-        before_ids = {i.get("pet", {}).get("pet_id") for i in before.get("data", {}).get("items", [])}
-
-        api_post(f"/api/v1/pets/{pet_id}/interest", {})
-        if str(pet_id) in before_ids:
+        # The interest POST is idempotent and reports whether the like already existed
+        result = api_post(f"/api/v1/pets/{pet_id}/interest", {})
+        if result.get("data", {}).get("already_existed"):
             return redirect("/?msg=already_liked")
         return redirect("/?msg=liked")
     except WooferAPIError as e:
@@ -195,9 +193,12 @@ def profile(request):
 
 def applications(request):
     try:
-        api_result = api_get("/api/v1/applications")
+        params = {"cursor": request.GET["cursor"]} if request.GET.get("cursor") else None
+        api_result = api_get("/api/v1/applications", params=params)
+        data = api_result.get("data", {})
         return render(request, "applications.html", {
-            "items": api_result.get("data", {}).get("items", [])
+            "items": data.get("items", []),
+            "next_cursor": data.get("next_cursor"),
         })
     except WooferAPIError as e:
         return render(
@@ -225,9 +226,12 @@ def interests(request):
     Uses backend /api/v1/interests (already canonical + enveloped).
     """
     try:
-        api_result = api_get("/api/v1/interests")
+        params = {"cursor": request.GET["cursor"]} if request.GET.get("cursor") else None
+        api_result = api_get("/api/v1/interests", params=params)
+        data = api_result.get("data", {})
         return render(request, "interests.html", {
-            "items": api_result.get("data", {}).get("items", [])
+            "items": data.get("items", []),
+            "next_cursor": data.get("next_cursor"),
         })
     except WooferAPIError as e:
         return render(